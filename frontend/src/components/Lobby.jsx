@@ -2,6 +2,7 @@ import { useState, useEffect } from 'react';
 import { useParams, useNavigate } from 'react-router-dom';
 import { api } from '../services/api';
 import { playerStorage, preserveParams } from '../services/storage';
+import { connectRoomSocket } from '../services/stateSync';
 
 export default function Lobby() {
   const { roomCode } = useParams();
@@ -13,30 +14,25 @@ export default function Lobby() {
   const playerId = playerStorage.getPlayerId();
 
   useEffect(() => {
-    fetchRoomState();
+    // The server pushes the room state on connect and after every change
+    const socket = connectRoomSocket(roomCode, playerId, {
+      onState: (state) => showRoom(state.room)
+    });
 
-    const wsUrl = import.meta.env.VITE_WS_URL;
+    return () => socket.close();
+  }, [roomCode]);
 
-    // Connect to Websocket
-    const socket = new WebSocket(wsUrl + '/' + roomCode);
+  const showRoom = (data) => {
+    setRoom(data);
 
-    socket.onmessage = function(event) {
-      const message = JSON.parse(event.data);
-      if (message.type === 'game_state_updated') {
-        fetchRoomState();
-      }
+    if (data.status === 'IN_PROGRESS') {
+      navigate(preserveParams(`/game/${roomCode}`));
     }
-
-  }, [roomCode]);
+  };
 
   const fetchRoomState = async () => {
     try {
-      const data = await api.getRoomState(roomCode);
-      setRoom(data);
-
-      if (data.status === 'IN_PROGRESS') {
-        navigate(preserveParams(`/game/${roomCode}`));
-      }
+      showRoom(await api.getRoomState(roomCode));
     } catch (err) {
       setError(err.message);
     }
@@ -1,6 +1,7 @@
 import { useState, useEffect, useRef } from 'react';
 import { api } from '../services/api';
 import { playerStorage } from '../services/storage';
+import { connectRoomSocket } from '../services/stateSync';
 
 export function useGameState(roomCode) {
   const [gameState, setGameState] = useState(null);
@@ -12,6 +13,17 @@ export function useGameState(roomCode) {
   const roleFetchedRef = useRef(false);
   const socketRef = useRef(null);
 
+  const showState = (state) => {
+    setRoom(state.room);
+    setGameState(state.game);
+    if (state.my_role) {
+      setMyRole(state.my_role);
+      roleFetchedRef.current = true;
+    }
+    setError(null);
+    setLoading(false);
+  };
+
   const fetchGameState = async () => {
 
     const playerId = playerStorage.getPlayerId();
@@ -49,26 +61,18 @@ export function useGameState(roomCode) {
     if (!roomCode) return;
 
     roleFetchedRef.current = false;
-    fetchGameState();
-
-    const wsUrl = import.meta.env.VITE_WS_URL;
-
-    // Connect to Websocket
-    const socket = new WebSocket(wsUrl + '/' + roomCode);
-    socketRef.current = socket;
 
-    socket.onmessage = function(event) {
-      const message = JSON.parse(event.data);
-
-      if (message.type === 'game_state_updated') {
-        fetchGameState();
-        return;
-      }
-      console.log(message)
-      if (message.type) {
-        setNotification(message);
+    // The server pushes this player's state on connect and after every change
+    const socket = connectRoomSocket(roomCode, playerStorage.getPlayerId(), {
+      onState: showState,
+      onMessage: (message) => {
+        console.log(message)
+        if (message.type) {
+          setNotification(message);
+        }
       }
-    }
+    });
+    socketRef.current = socket;
 
     const cleanup_func = () => {
       socket.close();
@@ -78,7 +82,10 @@ export function useGameState(roomCode) {
   }, [roomCode]);
 
   const refresh = () => {
-    fetchGameState();
+    // Changes arrive over the socket while it is open
+    if (!socketRef.current?.isOpen()) {
+      fetchGameState();
+    }
   };
 
   return {
@@ -0,0 +1,77 @@
+// Applies the state messages pushed over the room websocket.
+// Returns the new { version, state }, or null when a delta does not follow
+// on from the current state; send 'resync' to get the whole state again.
+export function applyStateMessage(current, message) {
+  if (message.type === 'state') {
+    return { version: message.version, state: message.state };
+  }
+
+  if (!current || message.base_version !== current.version) {
+    return null;
+  }
+
+  const state = { ...current.state, ...message.set };
+  for (const [section, fields] of Object.entries(message.patch)) {
+    state[section] = { ...state[section], ...fields };
+  }
+  for (const section of message.unset ?? []) {
+    delete state[section];
+  }
+  return { version: message.version, state };
+}
+
+export function isStateMessage(message) {
+  return message.type === 'state' || message.type === 'state_delta';
+}
+
+export function roomSocketUrl(roomCode, playerId) {
+  const url = import.meta.env.VITE_WS_URL + '/' + roomCode;
+  return playerId ? `${url}?player_id=${encodeURIComponent(playerId)}` : url;
+}
+
+// Close code the server uses for clients that fell too far behind
+const SLOW_CONSUMER_CLOSE_CODE = 1013;
+const RECONNECT_DELAY_MS = 1000;
+
+// Keeps a room socket open, passing each synced state to onState and every
+// other message to onMessage. Clients dropped for being slow reconnect and
+// are sent the whole state again.
+export function connectRoomSocket(roomCode, playerId, { onState, onMessage }) {
+  let socket = null;
+  let closed = false;
+
+  const open = () => {
+    let synced = null;
+    socket = new WebSocket(roomSocketUrl(roomCode, playerId));
+
+    socket.onmessage = (event) => {
+      const message = JSON.parse(event.data);
+      if (!isStateMessage(message)) {
+        onMessage?.(message);
+        return;
+      }
+      synced = applyStateMessage(synced, message);
+      if (synced) {
+        onState(synced.state);
+      } else {
+        socket.send('resync');
+      }
+    };
+
+    socket.onclose = (event) => {
+      if (!closed && event.code === SLOW_CONSUMER_CLOSE_CODE) {
+        setTimeout(open, RECONNECT_DELAY_MS);
+      }
+    };
+  };
+
+  open();
+
+  return {
+    isOpen: () => socket.readyState === WebSocket.OPEN,
+    close: () => {
+      closed = true;
+      socket.close();
+    }
+  };
+}
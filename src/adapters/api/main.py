@@ -1,14 +1,16 @@
 """Main FastAPI application."""
 
 import src.config
+from contextlib import asynccontextmanager
 from fastapi import FastAPI, Request
 from fastapi.middleware.cors import CORSMiddleware
 from fastapi.middleware.httpsredirect import HTTPSRedirectMiddleware
 from fastapi.staticfiles import StaticFiles
-from fastapi.responses import FileResponse
+from fastapi.responses import FileResponse, JSONResponse
 from fastapi.templating import Jinja2Templates
 import logging
-from src.adapters.api.rest.routes import router
+from src.adapters.api.rest.routes import close_storage, init_storage, room_sweeper, router
+from src.ports.room_repository_port import ConcurrentModificationError
 import os
 from pathlib import Path
 
@@ -20,11 +22,24 @@ logging.basicConfig(
     format='%(asctime)s - %(name)s - %(levelname)s - %(message)s'
 )
 
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    """Open storage on startup and release pooled connections on shutdown."""
+    init_storage()
+    if room_sweeper is not None:
+        room_sweeper.start()
+    yield
+    if room_sweeper is not None:
+        await room_sweeper.stop()
+    close_storage()
+
+
 # Create FastAPI application
 app = FastAPI(
     title="Secret Hitler API",
     description="REST API for the Secret Hitler online game",
     version="0.1.0",
+    lifespan=lifespan,
 )
 
 # Configure CORS for React frontend
@@ -44,6 +59,13 @@ app.add_middleware(
 if src.config.IS_PRODUCTION:
     app.add_middleware(HTTPSRedirectMiddleware)
 
+@app.exception_handler(ConcurrentModificationError)
+async def concurrent_modification_handler(
+    request: Request, exc: ConcurrentModificationError
+):
+    """Report commands that still conflicted after the command bus retried them."""
+    return JSONResponse(status_code=409, content={"detail": str(exc)})
+
 # Include API routes first (before static files)
 app.include_router(router)
 
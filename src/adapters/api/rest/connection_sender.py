@@ -0,0 +1,113 @@
+import asyncio
+import json
+import logging
+from typing import Any, Callable, Optional
+
+from fastapi import WebSocket
+
+logger = logging.getLogger(__name__)
+
+# "Try again later": the client fell too far behind and should reconnect
+SLOW_CONSUMER_CLOSE_CODE = 1013
+
+
+def encode_frame(message: Any) -> str:
+    """Encode a message once, the way WebSocket.send_json would, for any number of sockets."""
+    return json.dumps(message, separators=(",", ":"), ensure_ascii=False)
+
+
+class ConnectionSender:
+    """
+    Sends one connection's frames from a bounded queue on its own task.
+
+    `send` never waits, so a stalled client only holds up its own messages.
+    When the queue is full, or a send fails or takes longer than
+    `send_timeout`, the connection is closed and `on_drop` is called; the
+    client reconnects and is sent the whole state again.
+    """
+
+    def __init__(
+        self,
+        websocket: WebSocket,
+        on_drop: Callable[[], None],
+        max_queue: int = 64,
+        send_timeout: float = 5.0,
+    ) -> None:
+        if max_queue < 1:
+            raise ValueError("Send queue size must be at least 1")
+        self.websocket = websocket
+        self._on_drop = on_drop
+        self._send_timeout = send_timeout
+        self._queue: asyncio.Queue = asyncio.Queue(max_queue)
+        self._closed = False
+        self._task: Optional[asyncio.Task] = asyncio.get_running_loop().create_task(
+            self._run()
+        )
+
+    @property
+    def closed(self) -> bool:
+        return self._closed
+
+    def send(self, frame: str) -> bool:
+        """Queue an encoded frame; returns False if the connection is or was just dropped."""
+        if self._closed:
+            return False
+        try:
+            self._queue.put_nowait(frame)
+        except asyncio.QueueFull:
+            self._drop("send queue full")
+            return False
+        return True
+
+    def queued(self) -> int:
+        return self._queue.qsize()
+
+    async def wait_sent(self) -> None:
+        await self._queue.join()
+
+    def stop(self) -> None:
+        """Stop sending without closing the socket, e.g. after the client left."""
+        self._closed = True
+        self._discard_queued()
+        if self._task is not None and self._task is not asyncio.current_task():
+            self._task.cancel()
+        self._task = None
+
+    async def _run(self) -> None:
+        while True:
+            frame = await self._queue.get()
+            try:
+                await asyncio.wait_for(
+                    self.websocket.send_text(frame), self._send_timeout
+                )
+            except asyncio.TimeoutError:
+                self._drop("send timed out")
+                return
+            except Exception as e:
+                self._drop(f"send failed: {e}")
+                return
+            finally:
+                self._queue.task_done()
+
+    def _drop(self, reason: str) -> None:
+        if self._closed:
+            return
+        logger.warning("Dropping websocket connection: %s", reason)
+        self.stop()
+        asyncio.get_running_loop().create_task(self._close_socket())
+        self._on_drop()
+
+    async def _close_socket(self) -> None:
+        try:
+            await self.websocket.close(code=SLOW_CONSUMER_CLOSE_CODE)
+        except Exception:
+            # The socket is already gone
+            pass
+
+    def _discard_queued(self) -> None:
+        while True:
+            try:
+                self._queue.get_nowait()
+            except asyncio.QueueEmpty:
+                return
+            self._queue.task_done()
@@ -0,0 +1,62 @@
+from typing import Optional
+from uuid import UUID
+
+from src.adapters.api.rest.response_factory import ResponseFactory
+from src.application.queries.get_room_state import GetRoomStateHandler
+from src.domain.entities.game_room import GameRoom
+
+
+class PlayerStateView:
+    """
+    The room, game and role state pushed to each connected client.
+
+    What every player may see is built once per room; the policies in the
+    president's and chancellor's hands and the player's own role are added
+    only to the views of the players allowed to see them. Spectators
+    (no player id) get the public state.
+    """
+
+    def __init__(self, room: GameRoom) -> None:
+        self._room = room
+        self._room_state = ResponseFactory.make_room_state_response(
+            GetRoomStateHandler.to_dto(room)
+        ).model_dump(mode="json")
+        self._game_state = None
+        if room.game_state is not None:
+            self._game_state = ResponseFactory.make_game_state_response(room).model_dump(
+                mode="json"
+            )
+
+    def for_player(self, player_id: Optional[UUID]) -> dict:
+        return {
+            "room": self._room_state,
+            "game": self._game_for(player_id),
+            "my_role": self._role_for(player_id),
+        }
+
+    def _game_for(self, player_id: Optional[UUID]) -> Optional[dict]:
+        if self._game_state is None:
+            return None
+        game_state = self._room.game_state
+        is_president = player_id is not None and player_id == game_state.president_id
+        is_chancellor = player_id is not None and player_id == game_state.chancellor_id
+        return {
+            **self._game_state,
+            "president_policies": (
+                self._game_state["president_policies"] if is_president else []
+            ),
+            "chancellor_policies": (
+                self._game_state["chancellor_policies"] if is_chancellor else []
+            ),
+            "peeked_policies": (
+                self._game_state["peeked_policies"] if is_president else None
+            ),
+        }
+
+    def _role_for(self, player_id: Optional[UUID]) -> Optional[dict]:
+        game_state = self._room.game_state
+        if game_state is None or player_id not in game_state.role_assignments:
+            return None
+        return ResponseFactory.make_my_role_response(self._room, player_id).model_dump(
+            mode="json"
+        )
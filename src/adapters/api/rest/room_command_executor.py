@@ -0,0 +1,98 @@
+"""Runs blocking room commands off the event loop, one at a time per room."""
+
+import asyncio
+import threading
+from collections import deque
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import Any, Callable, Optional
+from uuid import UUID
+
+
+class RoomCommandExecutor:
+    """
+    Single-writer executor keyed by room.
+
+    Every room gets its own FIFO queue. While a room has work queued, exactly
+    one worker thread drains it, so commands for the same room run strictly in
+    submission order and never race each other. Different rooms are drained by
+    different workers in parallel. Callers await the result without blocking
+    the event loop.
+    """
+
+    def __init__(self, max_workers: int = 8) -> None:
+        if max_workers < 1:
+            raise ValueError("Executor needs at least 1 worker")
+        self._max_workers = max_workers
+        self._lock = threading.Lock()
+        self._queues: dict[UUID, deque[tuple[Callable[[], Any], Future]]] = {}
+        self._pool: Optional[ThreadPoolExecutor] = None
+        self._completed = 0
+        self._max_queue_depth = 0
+
+    async def submit(self, room_id: Optional[UUID], fn: Callable[[], Any]) -> Any:
+        """Run `fn` after every earlier command for `room_id` has finished."""
+        return await asyncio.wrap_future(self.submit_nowait(room_id, fn))
+
+    def submit_nowait(self, room_id: Optional[UUID], fn: Callable[[], Any]) -> Future:
+        future: Future = Future()
+        with self._lock:
+            pool = self._ensure_pool()
+            if room_id is None:
+                # Work that is not bound to an existing room needs no ordering.
+                pool.submit(self._run, fn, future)
+                return future
+
+            queue = self._queues.get(room_id)
+            idle = queue is None
+            if idle:
+                queue = self._queues[room_id] = deque()
+            queue.append((fn, future))
+            self._max_queue_depth = max(self._max_queue_depth, len(queue))
+            if idle:
+                pool.submit(self._drain, room_id)
+        return future
+
+    def shutdown(self) -> None:
+        """Wait for queued commands to finish and release the worker threads."""
+        with self._lock:
+            pool, self._pool = self._pool, None
+        if pool is not None:
+            pool.shutdown(wait=True)
+
+    def stats(self) -> dict[str, int]:
+        with self._lock:
+            return {
+                "active_rooms": len(self._queues),
+                "queued_commands": sum(len(q) for q in self._queues.values()),
+                "completed_commands": self._completed,
+                "max_queue_depth": self._max_queue_depth,
+            }
+
+    def _ensure_pool(self) -> ThreadPoolExecutor:
+        if self._pool is None:
+            self._pool = ThreadPoolExecutor(
+                max_workers=self._max_workers, thread_name_prefix="room-command"
+            )
+        return self._pool
+
+    def _drain(self, room_id: UUID) -> None:
+        while True:
+            with self._lock:
+                queue = self._queues[room_id]
+                if not queue:
+                    del self._queues[room_id]
+                    return
+                fn, future = queue.popleft()
+            self._run(fn, future)
+
+    def _run(self, fn: Callable[[], Any], future: Future) -> None:
+        if not future.set_running_or_notify_cancel():
+            return
+        try:
+            result = fn()
+        except BaseException as e:
+            future.set_exception(e)
+        else:
+            future.set_result(result)
+        with self._lock:
+            self._completed += 1
@@ -1,32 +1,187 @@
-
+import logging
+from typing import Callable, Optional
 from uuid import UUID
 from fastapi import WebSocket
 
+from src.adapters.api.rest.connection_sender import ConnectionSender, encode_frame
+
+logger = logging.getLogger(__name__)
+
+
+def state_message(
+    sent: Optional[tuple[int, dict]], version: int, state: dict
+) -> Optional[dict]:
+    """
+    The message that moves a client from the state it was last sent to `state`.
+
+    The first message is the whole state. After that, sections whose fields
+    changed are sent as a "patch" of those fields; sections that appeared, or
+    lost fields, are sent whole as a "set"; and sections that disappeared are
+    listed in "unset". Nothing is sent when nothing changed.
+    """
+    if sent is None:
+        return {"type": "state", "version": version, "state": state}
+
+    sent_version, sent_state = sent
+    patch, replaced = {}, {}
+    for section, value in state.items():
+        previous = sent_state.get(section)
+        if value == previous and section in sent_state:
+            continue
+        if (
+            isinstance(value, dict)
+            and isinstance(previous, dict)
+            and previous.keys() <= value.keys()
+        ):
+            patch[section] = {
+                field: field_value
+                for field, field_value in value.items()
+                if previous.get(field) != field_value or field not in previous
+            }
+        else:
+            replaced[section] = value
+    removed = [section for section in sent_state if section not in state]
+    if not patch and not replaced and not removed:
+        return None
+    return {
+        "type": "state_delta",
+        "base_version": sent_version,
+        "version": version,
+        "set": replaced,
+        "patch": patch,
+        "unset": removed,
+    }
+
 
 class RoomManager:
+    """
+    Tracks the websockets of each room and fans messages out to them.
+
+    Every connection sends from its own bounded queue (see ConnectionSender),
+    so broadcasts never wait on a client and one slow client cannot delay
+    the others. Connections that fall behind are dropped.
+    """
 
     rooms: dict[str, list[WebSocket]]
 
-    def __init__(self):
+    def __init__(self, max_queue: int = 64, send_timeout: float = 5.0):
         self.rooms = {}
+        self.players: dict[WebSocket, Optional[UUID]] = {}
+        # Last version and state pushed to each connection, for deltas
+        self.sent_states: dict[WebSocket, tuple[int, dict]] = {}
+        self.senders: dict[WebSocket, ConnectionSender] = {}
+        self._max_queue = max_queue
+        self._send_timeout = send_timeout
+        self._messages_queued = 0
+        self._frames_encoded = 0
+        self._connections_dropped = 0
 
-    async def connect(self, websocket: WebSocket, room_id: UUID):
+    async def connect(self, websocket: WebSocket, room_id: UUID, player_id: Optional[UUID] = None):
         await websocket.accept()
         self.rooms[room_id] = self.rooms[room_id] if room_id in self.rooms else []
         self.rooms[room_id].append(websocket)
-        print(f"WebSocket Connected to room {room_id}")
+        self.players[websocket] = player_id
+        self._sender_for(websocket, room_id)
+        logger.info("WebSocket connected to room %s", room_id)
 
     def disconnect(self, websocket: WebSocket, room_id: UUID):
-        print(f"WebSocket disconnected for room {room_id}")
-        self.rooms[room_id].remove(websocket)
-        if len(self.rooms[room_id]) == 0:
+        logger.info("WebSocket disconnected from room %s", room_id)
+        connections = self.rooms.get(room_id, [])
+        # Dropped connections were already removed
+        if websocket in connections:
+            connections.remove(websocket)
+        self.players.pop(websocket, None)
+        self.sent_states.pop(websocket, None)
+        sender = self.senders.pop(websocket, None)
+        if sender is not None:
+            sender.stop()
+        if room_id in self.rooms and len(self.rooms[room_id]) == 0:
             del self.rooms[room_id]
-    
+
+    def forget_sent_state(self, websocket: WebSocket):
+        """Send the whole state with the next push, for a client that lost track."""
+        self.sent_states.pop(websocket, None)
+
+    def has_connections(self, room_id: UUID) -> bool:
+        return bool(self.rooms.get(room_id))
+
+    def _sender_for(self, websocket: WebSocket, room_id: UUID) -> ConnectionSender:
+        sender = self.senders.get(websocket)
+        if sender is None:
+            sender = ConnectionSender(
+                websocket,
+                lambda: self._drop(websocket, room_id),
+                self._max_queue,
+                self._send_timeout,
+            )
+            self.senders[websocket] = sender
+        return sender
+
+    def _drop(self, websocket: WebSocket, room_id: UUID):
+        self._connections_dropped += 1
+        self.disconnect(websocket, room_id)
+
+    def _send(self, websocket: WebSocket, room_id: UUID, frame: str):
+        if self._sender_for(websocket, room_id).send(frame):
+            self._messages_queued += 1
 
     async def broadcast(self, room_id: UUID, payload: dict):
         connections = self.rooms.get(room_id)
         if (connections is None):
             return
-        
-        for connection in connections:
-            await connection.send_json(payload)
\ No newline at end of file
+
+        frame = encode_frame(payload)
+        self._frames_encoded += 1
+        # Dropping a connection removes it from the list
+        for connection in list(connections):
+            self._send(connection, room_id, frame)
+
+    async def push_state(
+        self,
+        room_id: UUID,
+        version: int,
+        view_for: Callable[[Optional[UUID]], dict],
+    ):
+        """Send each connection its own view of the room at `version`."""
+        connections = self.rooms.get(room_id)
+        if not connections:
+            return
+
+        views = {}
+        # Connections sent the same view last time get the same message, encoded once
+        frames = {}
+        for connection in list(connections):
+            player_id = self.players.get(connection)
+            if player_id not in views:
+                views[player_id] = view_for(player_id)
+            sent = self.sent_states.get(connection)
+            if sent is not None and version < sent[0]:
+                # A newer state already went out
+                continue
+            view = views[player_id]
+            key = (id(view), None if sent is None else (sent[0], id(sent[1])))
+            if key not in frames:
+                message = state_message(sent, version, view)
+                frames[key] = None
+                if message is not None:
+                    frames[key] = encode_frame(message)
+                    self._frames_encoded += 1
+            if frames[key] is None:
+                continue
+            self.sent_states[connection] = (version, view)
+            self._send(connection, room_id, frames[key])
+
+    async def wait_sent(self):
+        """Wait until every queued message has been sent or dropped."""
+        for sender in list(self.senders.values()):
+            await sender.wait_sent()
+
+    def stats(self) -> dict[str, int]:
+        return {
+            "rooms": len(self.rooms),
+            "connections": len(self.senders),
+            "messages_queued": self._messages_queued,
+            "frames_encoded": self._frames_encoded,
+            "queued_now": sum(sender.queued() for sender in self.senders.values()),
+            "connections_dropped": self._connections_dropped,
+        }
@@ -1,11 +1,17 @@
 """REST API routes for game room management."""
 
+import logging
 import sqlite3
+from concurrent.futures import ThreadPoolExecutor
+from datetime import timedelta
+from typing import Any, Optional, Union
 from uuid import UUID
 import src.config
 
 from fastapi import APIRouter, HTTPException, status, WebSocket, WebSocketDisconnect
 from src.adapters.api.rest.response_factory import ResponseFactory
+from src.adapters.api.rest.room_command_executor import RoomCommandExecutor
+from src.adapters.api.rest.player_state import PlayerStateView
 from src.adapters.api.rest.room_manager import RoomManager
 from src.adapters.api.rest.schemas import (
     CastVoteRequest,
@@ -27,9 +33,28 @@ from src.adapters.api.rest.schemas import (
     UseExecutiveActionRequest,
     VetoAgendaRequest,
 )
+from src.adapters.persistence.cached_code_repository import CachedCodeRepository, CodeCache
+from src.adapters.persistence.cached_room_repository import CachedRoomRepository, RoomCache
+from src.adapters.persistence.event_sourced_room_repository import EventSourcedRoomRepository
 from src.adapters.persistence.file_system_room_repository import FileSystemRoomRepository
-from src.adapters.persistence.sqlite_code_repository import SqliteCodeRepository
+from src.adapters.persistence.journaled_room_repository import JournaledRoomRepository
+from src.adapters.persistence.room_sweeper import RoomSweeper
+from src.adapters.persistence.sharded_sqlite_room_repository import (
+    ShardedSqliteRoomRepository,
+    shard_database_paths,
+)
+from src.adapters.persistence.sqlite_connection_pool import SqliteConnectionPool
+from src.adapters.persistence.sqlite_code_repository import (
+    CodeCounterLease,
+    SqliteCodeRepository,
+)
 from src.adapters.persistence.sqlite_room_repository import SqliteRoomRepository
+from src.adapters.persistence.sqlite_unit_of_work import SqliteUnitOfWork
+from src.adapters.persistence.threaded_repositories import (
+    ThreadedCodeRepository,
+    ThreadedRoomRepository,
+)
+from src.adapters.persistence.write_behind_room_repository import WriteBehindRoomRepository
 from src.application.command_bus import CommandBus
 from src.application.commands.cast_vote import CastVoteCommand
 from src.application.commands.create_room import CreateRoomCommand
@@ -48,39 +73,201 @@ from src.application.queries.get_room_state import (
 from src.domain.value_objects.policy import PolicyType
 import os
 
-from src.ports.code_repository_port import CodeRepositoryPort
-from src.ports.room_repository_port import RoomRepositoryPort
-
-
-# Update messages
-GAME_STATE_UPDATED = {
-    'type': 'game_state_updated'
-}
+from src.ports.code_repository_port import AsyncCodeRepositoryPort, CodeRepositoryPort
+from src.ports.room_repository_port import AsyncRoomRepositoryPort, RoomRepositoryPort
 
+logger = logging.getLogger(__name__)
 
 # Dependency management
-room_manager = RoomManager()
+room_manager = RoomManager(src.config.WS_SEND_QUEUE_SIZE, src.config.WS_SEND_TIMEOUT)
+room_executor = RoomCommandExecutor(src.config.COMMAND_WORKERS)
+# Bounded pool for repository calls made from async routes
+persistence_executor = ThreadPoolExecutor(
+    src.config.PERSISTENCE_WORKERS, thread_name_prefix="persistence"
+)
+connection_pool = SqliteConnectionPool(
+    src.config.SQLITE_FILE, durability=src.config.SQLITE_DURABILITY
+)
+# Rooms move to their own files when sharded; codes stay in the main file
+shard_pools = (
+    [
+        SqliteConnectionPool(path, durability=src.config.SQLITE_DURABILITY)
+        for path in shard_database_paths(src.config.SQLITE_FILE, src.config.ROOM_SHARD_COUNT)
+    ]
+    if src.config.ROOM_SHARD_COUNT > 0
+    else []
+)
+# One process-wide cache serves every request; mappings expire well before a
+# swept room's code can be handed out again
+code_cache = CodeCache(
+    src.config.CODE_CACHE_NEGATIVE_TTL,
+    ttl=min(src.config.CODE_CACHE_TTL, src.config.CODE_REUSE_AFTER / 2),
+)
+code_counter_lease = CodeCounterLease(src.config.CODE_COUNTER_BLOCK_SIZE)
 router = APIRouter(prefix="/api", tags=["rooms"])
 
 
 def make_db_connection() -> sqlite3.Connection:
-    return sqlite3.connect(src.config.SQLITE_FILE)
+    return connection_pool.connection()
+
+def make_unit_of_work() -> SqliteUnitOfWork:
+    return connection_pool.unit_of_work()
+
+
+def make_sqlite_code_repository() -> SqliteCodeRepository:
+    return SqliteCodeRepository(
+        make_db_connection(),
+        src.config.CODE_REUSE_AFTER,
+        lease=code_counter_lease,
+        unit_of_work=make_unit_of_work(),
+    )
+
 
 def make_code_repository() -> CodeRepositoryPort:
-    return SqliteCodeRepository(make_db_connection())
+    return CachedCodeRepository(make_sqlite_code_repository(), code_cache)
+
+
+def make_sqlite_room_repository() -> SqliteRoomRepository:
+    return SqliteRoomRepository(
+        make_db_connection(),
+        unit_of_work=make_unit_of_work(),
+        archive_block_size=src.config.ROOM_ARCHIVE_BLOCK_SIZE,
+    )
+
+
+def make_rooms_table_repository() -> Union[SqliteRoomRepository, ShardedSqliteRoomRepository]:
+    if shard_pools:
+        return ShardedSqliteRoomRepository(shard_pools, src.config.ROOM_ARCHIVE_BLOCK_SIZE)
+    return make_sqlite_room_repository()
+
+
+# Shared by every request so the in-memory copy stays authoritative
+write_behind_repository = (
+    WriteBehindRoomRepository(
+        make_rooms_table_repository,
+        src.config.WRITE_BEHIND_FLUSH_INTERVAL,
+        max_rooms=src.config.WRITE_BEHIND_MAX_ROOMS,
+    )
+    if src.config.ROOM_STORAGE == "write_behind"
+    else None
+)
+journaled_repository = (
+    JournaledRoomRepository(
+        src.config.ROOM_JOURNAL_FILE, src.config.ROOM_JOURNAL_FLUSH_INTERVAL
+    )
+    if src.config.ROOM_STORAGE == "journaled"
+    else None
+)
+
+# Write-behind and journaled storage serve rooms from memory, so skip the cache there
+room_cache = (
+    RoomCache(src.config.ROOM_CACHE_SIZE, src.config.ROOM_CACHE_TTL)
+    if src.config.ROOM_CACHE_SIZE > 0
+    and src.config.ROOM_STORAGE not in ("write_behind", "journaled")
+    else None
+)
+
+
+def make_room_storage() -> RoomRepositoryPort:
+    if write_behind_repository is not None:
+        return write_behind_repository
+    if journaled_repository is not None:
+        return journaled_repository
+    if src.config.ROOM_STORAGE == "event_sourced":
+        return EventSourcedRoomRepository(
+            make_db_connection(),
+            src.config.SNAPSHOT_INTERVAL,
+            unit_of_work=make_unit_of_work(),
+        )
+    if src.config.ROOM_STORAGE == "relational":
+        return make_relational_room_repository()
+    return make_rooms_table_repository()
+
+
+def make_relational_room_repository() -> RoomRepositoryPort:
+    # Imported here so SQLAlchemy is only loaded when this storage is chosen
+    from src.adapters.persistence.sqlalchemy_room_repository import (
+        SqlAlchemyRoomRepository,
+    )
+    from src.database.connection import SessionLocal
+
+    return SqlAlchemyRoomRepository(SessionLocal)
 
 
 def make_room_repository() -> RoomRepositoryPort:
-    return SqliteRoomRepository(make_db_connection())
+    if room_cache is not None:
+        return CachedRoomRepository(
+            make_room_storage(), room_cache, unit_of_work=make_unit_of_work()
+        )
+    return make_room_storage()
 
 
 def make_command_bus() -> CommandBus:
-    return CommandBus(make_room_repository())
+    return CommandBus(make_room_repository(), unit_of_work=make_unit_of_work())
+
+
+# Async repositories resolve the factories above on a persistence thread
+def make_async_room_repository() -> AsyncRoomRepositoryPort:
+    return ThreadedRoomRepository(lambda: make_room_repository(), persistence_executor)
+
+
+def make_async_code_repository() -> AsyncCodeRepositoryPort:
+    return ThreadedCodeRepository(lambda: make_code_repository(), persistence_executor)
+
+
+# Expiry needs the summary columns of the rooms table
+room_sweeper = (
+    RoomSweeper(
+        make_rooms_table_repository,
+        make_room_repository,
+        make_sqlite_code_repository,
+        completed_ttl=timedelta(seconds=src.config.COMPLETED_ROOM_TTL),
+        waiting_ttl=timedelta(seconds=src.config.WAITING_ROOM_TTL),
+        interval=src.config.ROOM_SWEEP_INTERVAL,
+        batch_size=src.config.ROOM_SWEEP_BATCH_SIZE,
+        code_cache=code_cache,
+        archive_after=(
+            timedelta(seconds=src.config.ROOM_ARCHIVE_AFTER)
+            if src.config.ROOM_ARCHIVE_AFTER > 0
+            else None
+        ),
+        run_for_room=room_executor.submit_nowait,
+    )
+    if src.config.ROOM_SWEEP_INTERVAL > 0
+    and src.config.ROOM_STORAGE not in ("event_sourced", "relational", "journaled")
+    else None
+)
 
 
-# Prep DBs (bad and lazy, but good enough for this simple web app)
-SqliteCodeRepository(make_db_connection()).init_tables()
-SqliteRoomRepository(make_db_connection()).init_tables()
+# Storage lifecycle, driven by the app lifespan
+def init_storage() -> None:
+    code_repository = make_sqlite_code_repository()
+    code_repository.init_tables()
+    code_cache.warm(code_repository.list_mappings())
+    if src.config.ROOM_STORAGE == "event_sourced":
+        EventSourcedRoomRepository(make_db_connection()).init_tables()
+    elif src.config.ROOM_STORAGE == "relational":
+        from src.database.connection import init_db
+
+        init_db()
+    elif src.config.ROOM_STORAGE == "journaled":
+        journaled_repository.start()
+    else:
+        make_rooms_table_repository().init_tables()
+    if write_behind_repository is not None:
+        write_behind_repository.start()
+
+
+def close_storage() -> None:
+    room_executor.shutdown()
+    persistence_executor.shutdown(wait=True)
+    if write_behind_repository is not None:
+        write_behind_repository.close()
+    if journaled_repository is not None:
+        journaled_repository.close()
+    connection_pool.close_all()
+    for pool in shard_pools:
+        pool.close_all()
 
 
 # Helper methods
@@ -94,6 +281,51 @@ def get_room_id_from_code(room_code: str) -> UUID:
     return room_id
 
 
+async def resolve_room_id(room_code: str) -> UUID:
+    """Like get_room_id_from_code, but looks the code up on a persistence thread."""
+    room_id = await make_async_code_repository().find_room_by_code(room_code)
+    if room_id is None:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail=f"Room code \"{room_code}\" not found"
+        )
+    return room_id
+
+
+def forget_room(room_id: UUID) -> None:
+    """
+    Undo a room whose creation failed after the room was saved.
+
+    Rolling back the unit of work only removes it from unsharded sqlite and
+    event-sourced storage; write-behind, journaled, relational and sharded
+    storage commit on their own, so the room is deleted from them here.
+    """
+    try:
+        make_room_repository().delete(room_id)
+    except Exception:
+        logger.exception("Could not delete room %s after it failed to be created", room_id)
+    code_cache.invalidate_room(room_id)
+    if room_cache is not None:
+        room_cache.invalidate(room_id)
+
+
+async def execute_command(room_id: UUID, command: Any) -> Any:
+    """Run a command on the room's worker, after any earlier commands for it."""
+    return await room_executor.submit(
+        room_id, lambda: make_command_bus().execute(command)
+    )
+
+
+async def push_room_state(room_id: UUID) -> None:
+    """Send every client connected to the room its own view of the latest state."""
+    if not room_manager.has_connections(room_id):
+        return
+    room = await make_async_room_repository().find_by_id(room_id)
+    if room is None:
+        return
+    await room_manager.push_state(room_id, room.version, PlayerStateView(room).for_player)
+
+
 def handle_value_error(e: ValueError) -> None:
     error_msg = str(e)
     if "not found" in error_msg.lower() or "not started" in error_msg.lower():
@@ -103,12 +335,17 @@ def handle_value_error(e: ValueError) -> None:
 
 # Routes
 @router.websocket("/ws/{room_code}")
-async def websocket_endpoint(websocket: WebSocket, room_code: str):
-    room_id = get_room_id_from_code(room_code)
-    await room_manager.connect(websocket, room_id)
+async def websocket_endpoint(
+    websocket: WebSocket, room_code: str, player_id: Optional[UUID] = None
+):
+    room_id = await resolve_room_id(room_code)
+    await room_manager.connect(websocket, room_id, player_id)
+    await push_room_state(room_id)
     try:
         while True:
-            await websocket.receive_text()
+            if await websocket.receive_text() == "resync":
+                room_manager.forget_sent_state(websocket)
+                await push_room_state(room_id)
     except WebSocketDisconnect:
         room_manager.disconnect(websocket, room_id)
 
@@ -123,6 +360,30 @@ def health() -> dict[str, str]:
     return {"status": "ok"}
 
 
+@router.get("/metrics")
+def metrics() -> dict[str, dict]:
+    result = {
+        "db_pool": connection_pool.stats(),
+        "commands": room_executor.stats(),
+        "code_cache": code_cache.stats(),
+        "code_counter": code_counter_lease.stats(),
+        "websockets": room_manager.stats(),
+    }
+    if shard_pools:
+        result["db_shards"] = {str(i): pool.stats() for i, pool in enumerate(shard_pools)}
+    if write_behind_repository is not None:
+        result["write_behind"] = write_behind_repository.stats()
+    if journaled_repository is not None:
+        result["room_journal"] = journaled_repository.stats()
+    if room_sweeper is not None:
+        result["room_sweeper"] = room_sweeper.stats()
+        if src.config.ROOM_ARCHIVE_AFTER > 0:
+            result["room_archive"] = make_rooms_table_repository().archive_stats()
+    if room_cache is not None:
+        result["room_cache"] = room_cache.stats()
+    return result
+
+
 @router.post(
     "/rooms",
     response_model=CreateRoomResponse,
@@ -132,8 +393,22 @@ def health() -> dict[str, str]:
 async def create_room(request: CreateRoomRequest) -> CreateRoomResponse:
     try:
         command = CreateRoomCommand(player_name=request.player_name)
-        result = make_command_bus().execute(command)
-        room_code = make_code_repository().generate_code_for_room(result.room_id)
+
+        def create() -> tuple[Any, str]:
+            # The room and its code mapping are kept together or not at all
+            result = None
+            try:
+                with make_unit_of_work():
+                    result = make_command_bus().execute(command)
+                    code = make_code_repository().generate_code_for_room(result.room_id)
+            except Exception:
+                if result is not None:
+                    forget_room(result.room_id)
+                raise
+            return result, code
+
+        # A new room has no earlier commands to wait for
+        result, room_code = await room_executor.submit(None, create)
         return CreateRoomResponse(
             room_id=result.room_id,
             player_id=result.player_id,
@@ -150,16 +425,16 @@ async def create_room(request: CreateRoomRequest) -> CreateRoomResponse:
     responses={400: {"model": ErrorResponse}, 404: {"model": ErrorResponse}},
 )
 async def join_room(room_code: str, request: JoinRoomRequest) -> JoinRoomResponse:
-    room_id = get_room_id_from_code(room_code)
+    room_id = await resolve_room_id(room_code)
     try:
         command = JoinRoomCommand(room_id=room_id, player_name=request.player_name)
-        result = make_command_bus().execute(command)
+        result = await execute_command(room_id, command)
 
         return JoinRoomResponse(player_id=result.player_id)
     except ValueError as e:
         handle_value_error(e)
     finally:
-        await room_manager.broadcast(room_id, GAME_STATE_UPDATED)
+        await push_room_state(room_id)
 
 
 @router.post(
@@ -168,18 +443,18 @@ async def join_room(room_code: str, request: JoinRoomRequest) -> JoinRoomRespons
     responses={400: {"model": ErrorResponse}, 404: {"model": ErrorResponse}},
 )
 async def reorder_players(room_code: str, request: ReorderPlayersRequest) -> None:
-    room_id = get_room_id_from_code(room_code)
+    room_id = await resolve_room_id(room_code)
     try:
         command = ReorderPlayersCommand(
             room_id=room_id,
             requester_id=request.player_id,
             player_ids=request.player_ids,
         )
-        make_command_bus().execute(command)
+        await execute_command(room_id, command)
     except ValueError as e:
         handle_value_error(e)
     finally:
-        await room_manager.broadcast(room_id, GAME_STATE_UPDATED)
+        await push_room_state(room_id)
 
 
 @router.get(
@@ -206,14 +481,14 @@ def get_room_state(room_code: str) -> RoomStateResponse:
     responses={400: {"model": ErrorResponse}, 404: {"model": ErrorResponse}},
 )
 async def start_game(room_code: str, request: StartGameRequest) -> None:
-    room_id = get_room_id_from_code(room_code)
+    room_id = await resolve_room_id(room_code)
     try:
         command = StartGameCommand(room_id=room_id, requester_id=request.player_id)
-        make_command_bus().execute(command)
+        await execute_command(room_id, command)
     except ValueError as e:
         handle_value_error(e)
     finally:
-        await room_manager.broadcast(room_id, GAME_STATE_UPDATED)
+        await push_room_state(room_id)
 
 
 @router.post(
@@ -222,18 +497,18 @@ async def start_game(room_code: str, request: StartGameRequest) -> None:
     responses={400: {"model": ErrorResponse}, 404: {"model": ErrorResponse}},
 )
 async def nominate_chancellor(room_code: str, request: NominateChancellorRequest) -> None:
-    room_id = get_room_id_from_code(room_code)
+    room_id = await resolve_room_id(room_code)
     try:
         command = NominateChancellorCommand(
             room_id=room_id,
             nominating_player_id=request.player_id,
             chancellor_id=request.chancellor_id,
         )
-        make_command_bus().execute(command)
+        await execute_command(room_id, command)
     except ValueError as e:
         handle_value_error(e)
     finally:
-        await room_manager.broadcast(room_id, GAME_STATE_UPDATED)
+        await push_room_state(room_id)
 
 
 @router.post(
@@ -242,18 +517,18 @@ async def nominate_chancellor(room_code: str, request: NominateChancellorRequest
     responses={400: {"model": ErrorResponse}, 404: {"model": ErrorResponse}},
 )
 async def cast_vote(room_code: str, request: CastVoteRequest) -> None:
-    room_id = get_room_id_from_code(room_code)
+    room_id = await resolve_room_id(room_code)
     try:
         command = CastVoteCommand(
             room_id=room_id, player_id=request.player_id, vote=request.vote
         )
-        result = make_command_bus().execute(command)
+        result = await execute_command(room_id, command)
         if result is not None:
             await room_manager.broadcast(room_id, result)
     except ValueError as e:
         handle_value_error(e)
     finally:
-        await room_manager.broadcast(room_id, GAME_STATE_UPDATED)
+        await push_room_state(room_id)
 
 
 @router.post(
@@ -262,18 +537,18 @@ async def cast_vote(room_code: str, request: CastVoteRequest) -> None:
     responses={400: {"model": ErrorResponse}, 404: {"model": ErrorResponse}},
 )
 async def discard_policy(room_code: str, request: DiscardPolicyRequest) -> None:
-    room_id = get_room_id_from_code(room_code)
+    room_id = await resolve_room_id(room_code)
     try:
         command = DiscardPolicyCommand(
             room_id=room_id,
             player_id=request.player_id,
             policy_type=PolicyType(request.policy_type),
         )
-        make_command_bus().execute(command)
+        await execute_command(room_id, command)
     except ValueError as e:
         handle_value_error(e)
     finally:
-        await room_manager.broadcast(room_id, GAME_STATE_UPDATED)
+        await push_room_state(room_id)
 
 
 @router.post(
@@ -282,14 +557,14 @@ async def discard_policy(room_code: str, request: DiscardPolicyRequest) -> None:
     responses={400: {"model": ErrorResponse}, 404: {"model": ErrorResponse}},
 )
 async def enact_policy(room_code: str, request: EnactPolicyRequest) -> None:
-    room_id = get_room_id_from_code(room_code)
+    room_id = await resolve_room_id(room_code)
     try:
         command = EnactPolicyCommand(
             room_id=room_id,
             player_id=request.player_id,
             policy_type=PolicyType(request.policy_type),
         )
-        make_command_bus().execute(command)
+        await execute_command(room_id, command)
         enacted_message = {
             'type': 'policy_enacted',
             'policy_type': request.policy_type,
@@ -298,7 +573,7 @@ async def enact_policy(room_code: str, request: EnactPolicyRequest) -> None:
     except ValueError as e:
         handle_value_error(e)
     finally:
-        await room_manager.broadcast(room_id, GAME_STATE_UPDATED)
+        await push_room_state(room_id)
 
 
 @router.get(
@@ -362,14 +637,14 @@ def investigate_loyalty(room_code: str, player_id: UUID, target_player_id: UUID)
     responses={400: {"model": ErrorResponse}, 404: {"model": ErrorResponse}},
 )
 async def use_executive_power(room_code: str, request: UseExecutiveActionRequest) -> ExecutiveActionResponse:
-    room_id = get_room_id_from_code(room_code)
+    room_id = await resolve_room_id(room_code)
     try:
         command = UseExecutiveActionCommand(
             room_id=room_id,
             player_id=request.player_id,
             target_player_id=request.target_player_id,
         )
-        result = make_command_bus().execute(command)
+        result = await execute_command(room_id, command)
 
         await room_manager.broadcast(room_id, result)
 
@@ -377,7 +652,7 @@ async def use_executive_power(room_code: str, request: UseExecutiveActionRequest
     except ValueError as e:
         handle_value_error(e)
     finally:
-        await room_manager.broadcast(room_id, GAME_STATE_UPDATED)
+        await push_room_state(room_id)
 
 
 @router.post(
@@ -386,20 +661,20 @@ async def use_executive_power(room_code: str, request: UseExecutiveActionRequest
     responses={400: {"model": ErrorResponse}, 404: {"model": ErrorResponse}},
 )
 async def veto_agenda(room_code: str, request: VetoAgendaRequest) -> None:
-    room_id = get_room_id_from_code(room_code)
+    room_id = await resolve_room_id(room_code)
     try:
         command = VetoAgendaCommand(
             room_id=room_id,
             player_id=request.player_id,
             approve_veto=request.approve_veto,
         )
-        result = make_command_bus().execute(command)
+        result = await execute_command(room_id, command)
         if (result is not None):
             await room_manager.broadcast(room_id, result)
     except ValueError as e:
         handle_value_error(e)
     finally:
-        await room_manager.broadcast(room_id, GAME_STATE_UPDATED)
+        await push_room_state(room_id)
 
 # Used to test notifications, triggers a specific one in the UI
 @router.post(
@@ -408,9 +683,9 @@ async def veto_agenda(room_code: str, request: VetoAgendaRequest) -> None:
     responses={400: {"model": ErrorResponse}, 404: {"model": ErrorResponse}},
 )
 async def trigger_notification(room_code: str, request: TriggerNotification) -> None:
-    room_id = get_room_id_from_code(room_code)
+    room_id = await resolve_room_id(room_code)
     if request.type == "failed_election":
-        room = make_room_repository().find_by_id(room_id)
+        room = await make_async_room_repository().find_by_id(room_id)
         room.players
         fake_notification = {
             "type": request.type,
@@ -0,0 +1,182 @@
+"""In-process cache of room code mappings in front of any code repository."""
+
+import threading
+import time
+from collections import OrderedDict
+from typing import Callable, Iterable, Iterator, Optional
+from uuid import UUID
+
+from src.ports.code_repository_port import CodeRepositoryPort
+
+
+class CodeCache:
+    """
+    Thread-safe, bidirectional map of room codes and room ids.
+
+    Codes of swept rooms are handed out again once the code repository's
+    reuse window has passed, so mappings expire after `ttl` seconds, which
+    must be shorter than that window; until then other processes may still
+    serve the old room. Codes that were looked up and not found are
+    remembered for
+    `negative_ttl` seconds, bounded to `max_negative` entries, so repeated
+    typos and code scanning are answered without touching the database.
+    One cache is meant to be shared by every CachedCodeRepository in the
+    process.
+    """
+
+    def __init__(
+        self,
+        negative_ttl: float = 5.0,
+        max_negative: int = 10000,
+        clock: Callable[[], float] = time.monotonic,
+        ttl: float = 3600.0,
+    ) -> None:
+        self._ttl = ttl
+        self._negative_ttl = negative_ttl
+        self._max_negative = max_negative
+        self._clock = clock
+        self._lock = threading.Lock()
+        self._rooms_by_code: dict[str, UUID] = {}
+        self._codes_by_room: dict[UUID, str] = {}
+        self._expires: dict[str, float] = {}
+        self._unknown: OrderedDict[str, float] = OrderedDict()
+        self._hits = 0
+        self._misses = 0
+        self._negative_hits = 0
+
+    def warm(self, mappings: Iterable[tuple[str, UUID]]) -> int:
+        count = 0
+        with self._lock:
+            expires = self._clock() + self._ttl
+            for code, room_id in mappings:
+                self._put_locked(code, room_id, expires)
+                count += 1
+        return count
+
+    def put(self, code: str, room_id: UUID) -> None:
+        with self._lock:
+            self._put_locked(code, room_id, self._clock() + self._ttl)
+            self._unknown.pop(code, None)
+
+    def _put_locked(self, code: str, room_id: UUID, expires: float) -> None:
+        # A reused code or a re-imported room replaces its old pairing
+        previous_room = self._rooms_by_code.get(code)
+        if previous_room is not None and previous_room != room_id:
+            self._codes_by_room.pop(previous_room, None)
+        previous_code = self._codes_by_room.get(room_id)
+        if previous_code is not None and previous_code != code:
+            self._rooms_by_code.pop(previous_code, None)
+            self._expires.pop(previous_code, None)
+        self._rooms_by_code[code] = room_id
+        self._codes_by_room[room_id] = code
+        self._expires[code] = expires
+
+    def _live_locked(self, code: str) -> bool:
+        if self._clock() < self._expires[code]:
+            return True
+        room_id = self._rooms_by_code.pop(code)
+        del self._expires[code]
+        if self._codes_by_room.get(room_id) == code:
+            del self._codes_by_room[room_id]
+        return False
+
+    def room_for(self, code: str) -> tuple[bool, Optional[UUID]]:
+        """Return (known, room_id); a known code with no room was seen missing."""
+        with self._lock:
+            room_id = self._rooms_by_code.get(code)
+            if room_id is not None and self._live_locked(code):
+                self._hits += 1
+                return True, room_id
+
+            expires = self._unknown.get(code)
+            if expires is not None:
+                if self._clock() < expires:
+                    self._negative_hits += 1
+                    return True, None
+                del self._unknown[code]
+
+            self._misses += 1
+            return False, None
+
+    def code_for(self, room_id: UUID) -> Optional[str]:
+        with self._lock:
+            code = self._codes_by_room.get(room_id)
+            if code is None or not self._live_locked(code):
+                return None
+            return code
+
+    def mark_unknown(self, code: str) -> None:
+        if self._negative_ttl <= 0:
+            return
+        with self._lock:
+            self._unknown[code] = self._clock() + self._negative_ttl
+            self._unknown.move_to_end(code)
+            while len(self._unknown) > self._max_negative:
+                self._unknown.popitem(last=False)
+
+    def invalidate_room(self, room_id: UUID) -> None:
+        with self._lock:
+            code = self._codes_by_room.pop(room_id, None)
+            if code is not None:
+                self._rooms_by_code.pop(code, None)
+                self._expires.pop(code, None)
+
+    def stats(self) -> dict[str, float]:
+        with self._lock:
+            lookups = self._hits + self._misses + self._negative_hits
+            return {
+                "codes": len(self._rooms_by_code),
+                "unknown_codes": len(self._unknown),
+                "hits": self._hits,
+                "negative_hits": self._negative_hits,
+                "misses": self._misses,
+                "hit_ratio": (
+                    (self._hits + self._negative_hits) / lookups if lookups else 0.0
+                ),
+            }
+
+
+class CachedCodeRepository(CodeRepositoryPort):
+    def __init__(self, repository: CodeRepositoryPort, cache: CodeCache) -> None:
+        self._repository = repository
+        self._cache = cache
+
+    def generate_code_for_room(self, room_id: UUID) -> str:
+        code = self._cache.code_for(room_id)
+        if code is not None:
+            return code
+
+        code = self._repository.generate_code_for_room(room_id)
+        self._cache.put(code, room_id)
+        return code
+
+    def find_room_by_code(self, code: str) -> Optional[UUID]:
+        known, room_id = self._cache.room_for(code)
+        if known:
+            return room_id
+
+        room_id = self._repository.find_room_by_code(code)
+        if room_id is None:
+            self._cache.mark_unknown(code)
+        else:
+            self._cache.put(code, room_id)
+        return room_id
+
+    def get_code_for_room(self, room_id: UUID) -> Optional[str]:
+        code = self._cache.code_for(room_id)
+        if code is not None:
+            return code
+
+        code = self._repository.get_code_for_room(room_id)
+        if code is not None:
+            self._cache.put(code, room_id)
+        return code
+
+    def iter_mappings(self, after: Optional[str] = None) -> Iterator[tuple[str, UUID]]:
+        return self._repository.iter_mappings(after)
+
+    def import_mappings(self, mappings: list[tuple[str, UUID]]) -> None:
+        self._repository.import_mappings(mappings)
+        for code, room_id in mappings:
+            self._cache.invalidate_room(room_id)
+            self._cache.put(code, room_id)
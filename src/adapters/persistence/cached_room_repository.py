@@ -0,0 +1,137 @@
+"""Read-through LRU cache in front of any room repository."""
+
+import threading
+import time
+from collections import OrderedDict
+from typing import Callable, Optional
+from uuid import UUID
+
+from src.adapters.persistence.room_codec import RoomCodec
+from src.adapters.persistence.sqlite_unit_of_work import SqliteUnitOfWork
+from src.domain.entities.game_room import GameRoom
+from src.ports.room_repository_port import RoomRepositoryPort
+
+
+class RoomCache:
+    """
+    Bounded, thread-safe LRU of encoded rooms with an optional TTL.
+
+    Rooms are stored encoded so every hit decodes a private copy that the
+    caller is free to mutate. One cache is meant to be shared by every
+    CachedRoomRepository in the process.
+    """
+
+    def __init__(
+        self,
+        max_size: int = 1000,
+        ttl: Optional[float] = None,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        if max_size < 1:
+            raise ValueError("Cache size must be at least 1")
+        self._max_size = max_size
+        self._ttl = ttl
+        self._clock = clock
+        self._lock = threading.Lock()
+        self._entries: OrderedDict[UUID, tuple[bytes, float]] = OrderedDict()
+        self._hits = 0
+        self._misses = 0
+        self._evictions = 0
+        self._expirations = 0
+
+    def get(self, room_id: UUID) -> Optional[bytes]:
+        with self._lock:
+            entry = self._entries.get(room_id)
+            if entry is not None and self._ttl is not None:
+                if self._clock() - entry[1] > self._ttl:
+                    del self._entries[room_id]
+                    self._expirations += 1
+                    entry = None
+
+            if entry is None:
+                self._misses += 1
+                return None
+
+            self._entries.move_to_end(room_id)
+            self._hits += 1
+            return entry[0]
+
+    def put(self, room_id: UUID, data: bytes) -> None:
+        with self._lock:
+            self._entries[room_id] = (data, self._clock())
+            self._entries.move_to_end(room_id)
+            while len(self._entries) > self._max_size:
+                self._entries.popitem(last=False)
+                self._evictions += 1
+
+    def invalidate(self, room_id: UUID) -> None:
+        with self._lock:
+            self._entries.pop(room_id, None)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+
+    def stats(self) -> dict[str, float]:
+        with self._lock:
+            lookups = self._hits + self._misses
+            return {
+                "size": len(self._entries),
+                "max_size": self._max_size,
+                "hits": self._hits,
+                "misses": self._misses,
+                "hit_ratio": self._hits / lookups if lookups else 0.0,
+                "evictions": self._evictions,
+                "expirations": self._expirations,
+            }
+
+
+class CachedRoomRepository(RoomRepositoryPort):
+    def __init__(
+        self,
+        repository: RoomRepositoryPort,
+        cache: RoomCache,
+        unit_of_work: Optional[SqliteUnitOfWork] = None,
+    ) -> None:
+        self._repository = repository
+        self._cache = cache
+        self._unit_of_work = unit_of_work
+
+    def save(self, room: GameRoom) -> None:
+        try:
+            self._repository.save(room)
+        except Exception:
+            self._cache.invalidate(room.room_id)
+            raise
+        self._cache.put(room.room_id, RoomCodec.encode(room))
+        if self._unit_of_work is not None and self._unit_of_work.active:
+            # The save is only durable once the unit commits
+            room_id = room.room_id
+            self._unit_of_work.on_rollback(lambda: self._cache.invalidate(room_id))
+
+    def find_by_id(self, room_id: UUID) -> Optional[GameRoom]:
+        data = self._cache.get(room_id)
+        if data is not None:
+            return RoomCodec.decode(data)
+
+        room = self._repository.find_by_id(room_id)
+        if room is not None:
+            self._cache.put(room_id, RoomCodec.encode(room))
+        return room
+
+    def find_lobby_by_id(self, room_id: UUID) -> Optional[GameRoom]:
+        data = self._cache.get(room_id)
+        if data is not None:
+            return RoomCodec.decode(data)
+        # A lobby read may leave out the game state, so it is never cached
+        return self._repository.find_lobby_by_id(room_id)
+
+    def delete(self, room_id: UUID) -> None:
+        self._repository.delete(room_id)
+        self._cache.invalidate(room_id)
+
+    def list_all(self) -> list[GameRoom]:
+        return self._repository.list_all()
+
+    def exists(self, room_id: UUID) -> bool:
+        return self._repository.exists(room_id)
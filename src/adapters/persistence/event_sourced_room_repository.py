@@ -0,0 +1,240 @@
+"""Room repository that stores an append-only event log per room."""
+
+import json
+import sqlite3
+from dataclasses import dataclass
+from datetime import datetime
+from typing import Any, Optional
+from uuid import UUID
+
+from src.adapters.persistence.room_codec import RoomCodec
+from src.adapters.persistence.room_document import RoomDocument
+from src.adapters.persistence.sqlite_unit_of_work import SqliteUnitOfWork
+from src.domain.entities.game_room import GameRoom
+from src.ports.room_repository_port import (
+    ConcurrentModificationError,
+    RoomRepositoryPort,
+)
+
+ROOM_CREATED = "RoomCreated"
+ROOM_UPDATED = "RoomUpdated"
+
+
+@dataclass
+class RoomEvent:
+    sequence: int
+    event_type: str
+    payload: dict[str, Any]
+    recorded_at: str
+
+
+class EventSourcedRoomRepository(RoomRepositoryPort):
+    """
+    Persists each save as a small patch appended to the room's event log.
+
+    The first event of a room holds its full document; every later event holds
+    only the fields that changed. A snapshot of the whole room is written
+    every `snapshot_interval` events so rebuilding a room never replays more
+    than that many patches. The log itself is never rewritten, so any past
+    state of a room can be replayed.
+
+    A room's version is the sequence of its latest event; saving a room whose
+    version is behind the log raises ConcurrentModificationError.
+    """
+
+    def __init__(
+        self,
+        conn: sqlite3.Connection,
+        snapshot_interval: int = 50,
+        unit_of_work: Optional[SqliteUnitOfWork] = None,
+    ) -> None:
+        if snapshot_interval < 1:
+            raise ValueError("Snapshot interval must be at least 1")
+        self._conn = conn
+        self._unit_of_work = unit_of_work or SqliteUnitOfWork(conn)
+        self._snapshot_interval = snapshot_interval
+        self._loaded: dict[UUID, tuple[int, dict[str, Any]]] = {}
+
+    def init_tables(self) -> None:
+        cursor = self._conn.cursor()
+        cursor.execute(
+            """
+            CREATE TABLE IF NOT EXISTS room_events (
+                room_id TEXT NOT NULL,
+                sequence INTEGER NOT NULL,
+                event_type TEXT NOT NULL,
+                payload TEXT NOT NULL,
+                recorded_at TEXT NOT NULL,
+                PRIMARY KEY (room_id, sequence)
+            )
+            """
+        )
+        cursor.execute(
+            """
+            CREATE TABLE IF NOT EXISTS room_snapshots (
+                room_id TEXT PRIMARY KEY,
+                sequence INTEGER NOT NULL,
+                room_data BLOB NOT NULL
+            )
+            """
+        )
+        self._conn.commit()
+
+    def save(self, room: GameRoom) -> None:
+        sequence, previous = self._loaded.get(room.room_id) or self._load(room.room_id)
+        if sequence != room.version:
+            self._loaded.pop(room.room_id, None)
+            raise ConcurrentModificationError(
+                f"Room {room.room_id} changed since version {room.version}"
+            )
+
+        # Rooms track their own changes since they were loaded, so only those
+        # fields are encoded again; rooms without tracking are encoded whole.
+        document = RoomDocument.update(previous, room)
+        if previous is None:
+            event_type, payload = ROOM_CREATED, document
+        else:
+            event_type, payload = ROOM_UPDATED, RoomDocument.diff(previous, document)
+            if not payload:
+                room.clear_changes()
+                return
+
+        sequence += 1
+        cursor = self._conn.cursor()
+        try:
+            cursor.execute(
+                """
+                INSERT INTO room_events (room_id, sequence, event_type, payload, recorded_at)
+                VALUES (?, ?, ?, ?, ?)
+                """,
+                (
+                    str(room.room_id),
+                    sequence,
+                    event_type,
+                    json.dumps(payload, separators=(",", ":")),
+                    datetime.utcnow().isoformat(),
+                ),
+            )
+        except sqlite3.IntegrityError:
+            self._unit_of_work.rollback()
+            self._loaded.pop(room.room_id, None)
+            raise ConcurrentModificationError(
+                f"Room {room.room_id} changed since version {room.version}"
+            )
+
+        if sequence % self._snapshot_interval == 0:
+            cursor.execute(
+                """
+                INSERT OR REPLACE INTO room_snapshots (room_id, sequence, room_data)
+                VALUES (?, ?, ?)
+                """,
+                (str(room.room_id), sequence, RoomCodec.encode(room)),
+            )
+        self._unit_of_work.commit()
+
+        self._loaded[room.room_id] = (sequence, document)
+        room.version = sequence
+        room.clear_changes()
+
+    def find_by_id(self, room_id: UUID) -> Optional[GameRoom]:
+        sequence, document = self._load(room_id)
+        if document is None:
+            return None
+
+        self._loaded[room_id] = (sequence, document)
+        room = RoomDocument.to_room(document)
+        room.version = sequence
+        room.clear_changes()
+        return room
+
+    def delete(self, room_id: UUID) -> None:
+        room_id_str = str(room_id)
+        cursor = self._conn.cursor()
+        cursor.execute("DELETE FROM room_events WHERE room_id = ?", (room_id_str,))
+        cursor.execute("DELETE FROM room_snapshots WHERE room_id = ?", (room_id_str,))
+        self._unit_of_work.commit()
+        self._loaded.pop(room_id, None)
+
+    def list_all(self) -> list[GameRoom]:
+        cursor = self._conn.cursor()
+        cursor.execute("SELECT DISTINCT room_id FROM room_events")
+        room_ids = [UUID(room_id) for (room_id,) in cursor.fetchall()]
+
+        rooms = []
+        for room_id in room_ids:
+            room = self.find_by_id(room_id)
+            if room is not None:
+                rooms.append(room)
+        return rooms
+
+    def exists(self, room_id: UUID) -> bool:
+        cursor = self._conn.cursor()
+        cursor.execute(
+            "SELECT 1 FROM room_events WHERE room_id = ? LIMIT 1", (str(room_id),)
+        )
+        return cursor.fetchone() is not None
+
+    def events(self, room_id: UUID) -> list[RoomEvent]:
+        cursor = self._conn.cursor()
+        cursor.execute(
+            """
+            SELECT sequence, event_type, payload, recorded_at FROM room_events
+            WHERE room_id = ? ORDER BY sequence
+            """,
+            (str(room_id),),
+        )
+        return [
+            RoomEvent(sequence, event_type, json.loads(payload), recorded_at)
+            for sequence, event_type, payload, recorded_at in cursor.fetchall()
+        ]
+
+    def replay(
+        self, room_id: UUID, up_to_sequence: Optional[int] = None
+    ) -> Optional[GameRoom]:
+        """Rebuild a room from its full event log, optionally stopping early."""
+        sequence, document = 0, None
+        for event in self.events(room_id):
+            if up_to_sequence is not None and event.sequence > up_to_sequence:
+                break
+            document = self._apply(document, event.event_type, event.payload)
+            sequence = event.sequence
+
+        if document is None:
+            return None
+        room = RoomDocument.to_room(document)
+        room.version = sequence
+        return room
+
+    def _load(self, room_id: UUID) -> tuple[int, Optional[dict[str, Any]]]:
+        room_id_str = str(room_id)
+        cursor = self._conn.cursor()
+
+        cursor.execute(
+            "SELECT sequence, room_data FROM room_snapshots WHERE room_id = ?",
+            (room_id_str,),
+        )
+        snapshot = cursor.fetchone()
+        sequence, document = 0, None
+        if snapshot is not None:
+            sequence = snapshot[0]
+            document = RoomDocument.from_room(RoomCodec.decode(snapshot[1]))
+
+        cursor.execute(
+            """
+            SELECT sequence, event_type, payload FROM room_events
+            WHERE room_id = ? AND sequence > ? ORDER BY sequence
+            """,
+            (room_id_str, sequence),
+        )
+        for sequence, event_type, payload in cursor.fetchall():
+            document = self._apply(document, event_type, json.loads(payload))
+
+        return sequence, document
+
+    @staticmethod
+    def _apply(
+        document: Optional[dict[str, Any]], event_type: str, payload: dict[str, Any]
+    ) -> dict[str, Any]:
+        if event_type == ROOM_CREATED or document is None:
+            return payload
+        return RoomDocument.apply(document, payload)
@@ -1,18 +1,65 @@
 import json
+import os
+import threading
+from contextlib import contextmanager
 from pathlib import Path
-from typing import Optional
+from typing import Iterator, Optional
 from uuid import UUID
 
 from src.adapters.api.rest.code_factory import CodeFactory
 from src.ports.code_repository_port import CodeRepositoryPort
 
+try:
+    import fcntl
+except ImportError:
+    # Windows: instances in other processes are not kept out
+    fcntl = None
+
 
 class FileSystemCodeRepository(CodeRepositoryPort):
+    """
+    Stores code mappings as an append-only log of "CODE room_id" lines.
+
+    The log is indexed in memory when the repository is created, and lines
+    appended since then (by this or any other instance) are read on a lookup
+    miss, so lookups and new codes cost the same however many rooms exist.
+    Instances in other processes take turns through a lock file. The counter
+    file is replaced atomically, and since a crash can still land between
+    appending a code and saving the counter, the counter never falls behind
+    the codes in the log and codes already in it are skipped.
+    """
+
     def __init__(self, base_path: str = "/tmp") -> None:
         self.base_path = Path(base_path)
         self.base_path.mkdir(parents=True, exist_ok=True)
         self.counter_file = self.base_path / "code_counter.json"
-        self.mappings_file = self.base_path / "code_mappings.json"
+        self.mappings_file = self.base_path / "code_mappings.log"
+        self.legacy_mappings_file = self.base_path / "code_mappings.json"
+        self.lock_file = self.base_path / "code_mappings.lock"
+        self._lock = threading.Lock()
+        self._code_to_room: dict[str, str] = {}
+        self._room_to_code: dict[str, str] = {}
+        self._offset = 0
+        # One past the highest counter behind a code in the log
+        self._next_counter = 1
+        with self._locked():
+            self._migrate_legacy_mappings()
+            self._catch_up()
+            self._drop_torn_tail()
+
+    @contextmanager
+    def _locked(self) -> Iterator[None]:
+        """Hold the thread lock and the lock file shared with other processes."""
+        with self._lock:
+            if fcntl is None:
+                yield
+                return
+            with open(self.lock_file, "a") as lock:
+                fcntl.flock(lock, fcntl.LOCK_EX)
+                try:
+                    yield
+                finally:
+                    fcntl.flock(lock, fcntl.LOCK_UN)
 
     def _load_counter(self) -> int:
         if not self.counter_file.exists():
@@ -25,43 +72,84 @@ class FileSystemCodeRepository(CodeRepositoryPort):
             return 1
 
     def _save_counter(self, counter: int) -> None:
-        with open(self.counter_file, "w") as f:
+        temp_file = self.counter_file.with_suffix(".tmp")
+        with open(temp_file, "w") as f:
             json.dump({"counter": counter}, f)
+        os.replace(temp_file, self.counter_file)
 
-    def _load_mappings(self) -> dict:
-        if not self.mappings_file.exists():
-            return {"code_to_room": {}, "room_to_code": {}}
+    def _migrate_legacy_mappings(self) -> None:
+        if self.mappings_file.exists() or not self.legacy_mappings_file.exists():
+            return
         try:
-            with open(self.mappings_file, "r") as f:
-                return json.load(f)
-        except (json.JSONDecodeError, FileNotFoundError):
-            return {"code_to_room": {}, "room_to_code": {}}
-
-    def _save_mappings(self, mappings: dict) -> None:
-        with open(self.mappings_file, "w") as f:
-            json.dump(mappings, f, indent=2)
+            with open(self.legacy_mappings_file, "r") as f:
+                legacy = json.load(f)
+        except json.JSONDecodeError:
+            return
+
+        temp_file = self.mappings_file.with_suffix(".tmp")
+        with open(temp_file, "w") as f:
+            for code, room_id_str in legacy.get("code_to_room", {}).items():
+                f.write(f"{code} {room_id_str}\n")
+        os.replace(temp_file, self.mappings_file)
+
+    def _catch_up(self) -> None:
+        """Index the log lines written since the last read."""
+        if not self.mappings_file.exists():
+            return
+        with open(self.mappings_file, "rb") as f:
+            f.seek(self._offset)
+            data = f.read()
+
+        # A line without its newline is still being written; pick it up next time.
+        complete = data.rfind(b"\n") + 1
+        for line in data[:complete].decode().splitlines():
+            code, _, room_id_str = line.partition(" ")
+            if code and room_id_str:
+                self._code_to_room[code] = room_id_str
+                self._room_to_code[room_id_str] = code
+                try:
+                    counter = CodeFactory.code_to_int(code)
+                except ValueError:
+                    # Legacy codes were not made from the counter
+                    continue
+                self._next_counter = max(self._next_counter, counter + 1)
+        self._offset += complete
+
+    def _drop_torn_tail(self) -> None:
+        # Left behind by a crash mid-append; later appends must start on a fresh line.
+        if self.mappings_file.exists() and self.mappings_file.stat().st_size > self._offset:
+            os.truncate(self.mappings_file, self._offset)
 
     def generate_code_for_room(self, room_id: UUID) -> str:
         room_id_str = str(room_id)
-        mappings = self._load_mappings()
-
-        if room_id_str in mappings["room_to_code"]:
-            return mappings["room_to_code"][room_id_str]
-
-        counter = self._load_counter()
-        code = CodeFactory.int_to_code(counter)
-
-        mappings["code_to_room"][code] = room_id_str
-        mappings["room_to_code"][room_id_str] = code
-
-        self._save_mappings(mappings)
-        self._save_counter(counter + 1)
-
-        return code
+        with self._locked():
+            self._catch_up()
+            if room_id_str in self._room_to_code:
+                return self._room_to_code[room_id_str]
+
+            counter = max(self._load_counter(), self._next_counter)
+            code = CodeFactory.int_to_code(counter)
+            skipped = 0
+            while code in self._code_to_room:
+                skipped += 1
+                if skipped >= CodeFactory.MAX_CODES:
+                    raise ValueError("Every room code is in use")
+                counter += 1
+                code = CodeFactory.int_to_code(counter)
+
+            with open(self.mappings_file, "a") as f:
+                f.write(f"{code} {room_id_str}\n")
+            self._save_counter(counter + 1)
+            self._catch_up()
+
+            return code
 
     def find_room_by_code(self, code: str) -> Optional[UUID]:
-        mappings = self._load_mappings()
-        room_id_str = mappings["code_to_room"].get(code)
+        with self._lock:
+            room_id_str = self._code_to_room.get(code)
+            if room_id_str is None:
+                self._catch_up()
+                room_id_str = self._code_to_room.get(code)
 
         if room_id_str is None:
             return None
@@ -71,7 +159,38 @@ class FileSystemCodeRepository(CodeRepositoryPort):
         except ValueError:
             return None
 
+    def iter_mappings(self, after: Optional[str] = None) -> Iterator[tuple[str, UUID]]:
+        with self._lock:
+            self._catch_up()
+            mappings = sorted(
+                (code, room_id_str)
+                for code, room_id_str in self._code_to_room.items()
+                if after is None or code > after
+            )
+        for code, room_id_str in mappings:
+            try:
+                yield code, UUID(room_id_str)
+            except ValueError:
+                continue
+
+    def import_mappings(self, mappings: list[tuple[str, UUID]]) -> None:
+        if not mappings:
+            return
+        with self._locked():
+            with open(self.mappings_file, "a") as f:
+                f.write("".join(f"{code} {room_id}\n" for code, room_id in mappings))
+            # Codes are handed out from the counter unchecked, so move it past them
+            highest = max(CodeFactory.code_to_int(code) for code, _ in mappings)
+            counter = self._load_counter()
+            if highest >= counter:
+                self._save_counter(highest + 1)
+            self._catch_up()
+
     def get_code_for_room(self, room_id: UUID) -> Optional[str]:
         room_id_str = str(room_id)
-        mappings = self._load_mappings()
-        return mappings["room_to_code"].get(room_id_str)
+        with self._lock:
+            code = self._room_to_code.get(room_id_str)
+            if code is None:
+                self._catch_up()
+                code = self._room_to_code.get(room_id_str)
+        return code
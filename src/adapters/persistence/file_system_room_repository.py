@@ -1,51 +1,107 @@
-import json
+import hashlib
+import os
 import pickle
+import tempfile
 from pathlib import Path
-from typing import Optional
+from typing import Iterator, Optional
 from uuid import UUID
 
+from src.adapters.persistence.room_codec import RoomCodec
 from src.domain.entities.game_room import GameRoom
 from src.ports.room_repository_port import RoomRepositoryPort
 
 
 class FileSystemRoomRepository(RoomRepositoryPort):
+    """
+    Stores one file per room under two levels of hash-sharded directories.
+
+    Rooms are written to a temp file in the target directory and renamed into
+    place, so readers and crashes only ever see a complete file. Files written
+    to the flat layout used before sharding are still read, and are moved into
+    their shard the next time the room is saved.
+    """
+
     def __init__(self, base_path: str = "/tmp") -> None:
         self.base_path = Path(base_path)
         self.base_path.mkdir(parents=True, exist_ok=True)
 
     def _get_file_path(self, room_id: UUID) -> Path:
+        digest = hashlib.sha1(str(room_id).encode()).hexdigest()
+        return self.base_path / digest[:2] / digest[2:4] / f"secret-hitler-{room_id}.txt"
+
+    def _get_legacy_file_path(self, room_id: UUID) -> Path:
         return self.base_path / f"secret-hitler-{room_id}.txt"
 
+    def _find_file(self, room_id: UUID) -> Optional[Path]:
+        for file_path in (
+            self._get_file_path(room_id),
+            self._get_legacy_file_path(room_id),
+        ):
+            if file_path.exists():
+                return file_path
+        return None
+
     def save(self, room: GameRoom) -> None:
         file_path = self._get_file_path(room.room_id)
-        with open(file_path, "wb") as f:
-            pickle.dump(room, f)
-
-    def find_by_id(self, room_id: UUID) -> Optional[GameRoom]:
-        file_path = self._get_file_path(room_id)
-        if not file_path.exists():
-            return None
+        file_path.parent.mkdir(parents=True, exist_ok=True)
 
+        fd, temp_path = tempfile.mkstemp(dir=file_path.parent, prefix=".tmp-")
         try:
-            with open(file_path, "rb") as f:
-                return pickle.load(f)
-        except (FileNotFoundError, pickle.UnpicklingError):
+            with os.fdopen(fd, "wb") as f:
+                f.write(RoomCodec.encode(room))
+                f.flush()
+                os.fsync(f.fileno())
+            os.replace(temp_path, file_path)
+        except BaseException:
+            Path(temp_path).unlink(missing_ok=True)
+            raise
+
+        self._get_legacy_file_path(room.room_id).unlink(missing_ok=True)
+
+    def find_by_id(self, room_id: UUID) -> Optional[GameRoom]:
+        file_path = self._find_file(room_id)
+        if file_path is None:
             return None
+        return self._read(file_path)
 
     def delete(self, room_id: UUID) -> None:
-        file_path = self._get_file_path(room_id)
-        file_path.unlink(missing_ok=True)
+        self._get_file_path(room_id).unlink(missing_ok=True)
+        self._get_legacy_file_path(room_id).unlink(missing_ok=True)
 
     def list_all(self) -> list[GameRoom]:
-        rooms = []
-        for file_path in self.base_path.glob("secret-hitler-*.txt"):
-            try:
-                with open(file_path, "rb") as f:
-                    room = pickle.load(f)
-                    rooms.append(room)
-            except (pickle.UnpicklingError, EOFError):
+        return list(self.iter_all())
+
+    def iter_all(self, after: Optional[UUID] = None) -> Iterator[GameRoom]:
+        # Only the paths are collected up front; rooms are read one at a time
+        paths: dict[str, Path] = {}
+        for file_path in self._iter_files(self.base_path, depth=2):
+            room_id = file_path.name[len("secret-hitler-"):-len(".txt")]
+            if after is not None and room_id <= str(after):
                 continue
-        return rooms
+            # A sharded file is newer than a legacy one for the same room
+            if room_id not in paths or file_path.parent != self.base_path:
+                paths[room_id] = file_path
+        for room_id in sorted(paths):
+            room = self._read(paths[room_id])
+            if room is not None:
+                yield room
 
     def exists(self, room_id: UUID) -> bool:
-        return self._get_file_path(room_id).exists()
+        return self._find_file(room_id) is not None
+
+    def _iter_files(self, directory: Path, depth: int) -> Iterator[Path]:
+        # Walks shard directories lazily; files at any level cover the legacy layout.
+        with os.scandir(directory) as entries:
+            for entry in entries:
+                if entry.is_dir() and depth > 0:
+                    yield from self._iter_files(Path(entry.path), depth - 1)
+                elif entry.name.startswith("secret-hitler-") and entry.name.endswith(".txt"):
+                    yield Path(entry.path)
+
+    @staticmethod
+    def _read(file_path: Path) -> Optional[GameRoom]:
+        try:
+            with open(file_path, "rb") as f:
+                return RoomCodec.decode(f.read())
+        except (FileNotFoundError, pickle.UnpicklingError, EOFError, ValueError):
+            return None
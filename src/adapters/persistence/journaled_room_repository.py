@@ -0,0 +1,316 @@
+"""Room repository that keeps rooms in memory and journals every change to a file."""
+
+import logging
+import os
+import struct
+import threading
+import time
+import zlib
+from pathlib import Path
+from typing import BinaryIO, Iterator, Optional
+from uuid import UUID
+
+from src.adapters.persistence.room_codec import RoomCodec
+from src.domain.entities.game_room import GameRoom
+from src.ports.room_repository_port import (
+    ConcurrentModificationError,
+    RoomRepositoryPort,
+)
+
+logger = logging.getLogger(__name__)
+
+_SAVE = 1
+_DELETE = 2
+# op, room id, payload length, CRC32 of room id and payload
+_RECORD = struct.Struct("<B16sII")
+
+
+def _record(op: int, room_id: UUID, data: bytes = b"") -> bytes:
+    return _RECORD.pack(op, room_id.bytes, len(data), zlib.crc32(room_id.bytes + data)) + data
+
+
+def read_journal(f: BinaryIO) -> Iterator[tuple[int, UUID, bytes]]:
+    """
+    Yield the records of a journal up to the first incomplete or corrupt one.
+
+    A crash mid-append leaves a torn record at the end; everything before it
+    was written whole and is replayed.
+    """
+    while True:
+        header = f.read(_RECORD.size)
+        if len(header) < _RECORD.size:
+            return
+        op, room_id_bytes, length, checksum = _RECORD.unpack(header)
+        data = f.read(length)
+        if (
+            op not in (_SAVE, _DELETE)
+            or len(data) < length
+            or zlib.crc32(room_id_bytes + data) != checksum
+        ):
+            logger.warning("Ignoring torn record at the end of the room journal")
+            return
+        yield op, UUID(bytes=room_id_bytes), data
+
+
+class JournaledRoomRepository(RoomRepositoryPort):
+    """
+    Serves rooms from memory and appends every save and delete to a journal.
+
+    Records are buffered and written with a single fsync once per
+    `flush_interval` seconds, so a crash loses at most one interval of changes
+    while saves never wait on the disk. A flush that fails is cut off the
+    journal again and its records are retried by the next one. `start`
+    replays the journal into memory and rewrites it with one record per live
+    room; the journal is compacted the same way whenever it grows past
+    `compact_ratio` times the size of the live rooms. Like write-behind storage, rooms are held as
+    encoded snapshots and versions are checked in memory.
+
+    One instance must be shared by the whole process.
+    """
+
+    def __init__(
+        self,
+        path: str,
+        flush_interval: float = 0.05,
+        compact_ratio: float = 4.0,
+        min_compact_bytes: int = 1 << 20,
+    ) -> None:
+        self._path = Path(path)
+        self._flush_interval = flush_interval
+        self._compact_ratio = compact_ratio
+        self._min_compact_bytes = min_compact_bytes
+        self._lock = threading.Lock()
+        self._flush_lock = threading.Lock()
+        self._rooms: dict[UUID, bytes] = {}
+        self._versions: dict[UUID, int] = {}
+        self._pending: list[bytes] = []
+        self._file: Optional[BinaryIO] = None
+        self._journal_bytes = 0
+        self._live_bytes = 0
+        self._wake = threading.Event()
+        self._stopping = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+        self._flushes = 0
+        self._failed_flushes = 0
+        self._records_flushed = 0
+        self._compactions = 0
+        self._replayed_records = 0
+        self._max_flush_seconds = 0.0
+
+    def start(self) -> None:
+        """Load the journal, compact it and start the background flusher."""
+        if self._thread is not None:
+            return
+        self.load()
+        self._stopping.clear()
+        self._thread = threading.Thread(
+            target=self._run, name="room-journal", daemon=True
+        )
+        self._thread.start()
+
+    def load(self) -> int:
+        """Replay the journal into memory and compact it; returns the live room count."""
+        with self._flush_lock:
+            rooms: dict[UUID, bytes] = {}
+            replayed = 0
+            if self._path.exists():
+                with open(self._path, "rb") as f:
+                    for op, room_id, data in read_journal(f):
+                        if op == _SAVE:
+                            rooms[room_id] = data
+                        else:
+                            rooms.pop(room_id, None)
+                        replayed += 1
+            versions = {
+                room_id: RoomCodec.decode(data).version for room_id, data in rooms.items()
+            }
+            journal_bytes = self._rewrite(rooms)
+            with self._lock:
+                self._rooms = rooms
+                self._versions = versions
+                self._pending = []
+                self._replayed_records = replayed
+                self._journal_bytes = journal_bytes
+                self._live_bytes = journal_bytes
+        return len(rooms)
+
+    def close(self) -> None:
+        """Stop the flusher and write everything still buffered."""
+        if self._thread is not None:
+            self._stopping.set()
+            self._wake.set()
+            self._thread.join()
+            self._thread = None
+        self.flush()
+        if self._file is not None:
+            self._file.close()
+            self._file = None
+
+    def _run(self) -> None:
+        while not self._stopping.is_set():
+            self._wake.wait(self._flush_interval)
+            self._wake.clear()
+            try:
+                self.flush()
+            except Exception:
+                logger.exception("Room journal flush failed")
+
+    def flush(self) -> int:
+        with self._flush_lock:
+            with self._lock:
+                batch, self._pending = self._pending, []
+            if not batch:
+                return 0
+
+            started = time.perf_counter()
+            data = b"".join(batch)
+            f = self._open()
+            size_before = os.fstat(f.fileno()).st_size
+            try:
+                f.write(data)
+                f.flush()
+                os.fsync(f.fileno())
+            except Exception:
+                self._undo_write(size_before)
+                with self._lock:
+                    # Retried first by the next flush, ahead of newer records
+                    self._pending = batch + self._pending
+                    self._failed_flushes += 1
+                raise
+
+            elapsed = time.perf_counter() - started
+            with self._lock:
+                self._journal_bytes += len(data)
+                self._flushes += 1
+                self._records_flushed += len(batch)
+                self._max_flush_seconds = max(self._max_flush_seconds, elapsed)
+                should_compact = self._journal_bytes > max(
+                    self._min_compact_bytes, self._live_bytes * self._compact_ratio
+                )
+            if should_compact:
+                self._compact_locked()
+            return len(batch)
+
+    def _undo_write(self, size: int) -> None:
+        """Cut a partly written batch off the journal so records after it still replay."""
+        f, self._file = self._file, None
+        try:
+            f.close()
+        except OSError:
+            # Still holding the unwritten bytes; they are dropped with the file
+            pass
+        try:
+            os.truncate(self._path, size)
+        except OSError:
+            logger.exception("Could not truncate the room journal after a failed flush")
+
+    def compact(self) -> None:
+        """Rewrite the journal with one record per live room."""
+        with self._flush_lock:
+            self._compact_locked()
+
+    def _compact_locked(self) -> None:
+        with self._lock:
+            rooms = dict(self._rooms)
+            # The snapshot holds every change buffered so far
+            covered = len(self._pending)
+        journal_bytes = self._rewrite(rooms)
+        with self._lock:
+            # Records buffered during the rewrite still need appending
+            del self._pending[:covered]
+            self._journal_bytes = journal_bytes
+            self._compactions += 1
+
+    def _rewrite(self, rooms: dict[UUID, bytes]) -> int:
+        """Atomically replace the journal with `rooms`; call under the flush lock."""
+        if self._file is not None:
+            self._file.close()
+            self._file = None
+
+        self._path.parent.mkdir(parents=True, exist_ok=True)
+        temp_path = self._path.with_suffix(".tmp")
+        records = [_record(_SAVE, room_id, data) for room_id, data in rooms.items()]
+        try:
+            with open(temp_path, "wb") as f:
+                f.write(b"".join(records))
+                f.flush()
+                os.fsync(f.fileno())
+            os.replace(temp_path, self._path)
+        except BaseException:
+            temp_path.unlink(missing_ok=True)
+            raise
+        self._fsync_directory()
+
+        return sum(len(record) for record in records)
+
+    def _fsync_directory(self) -> None:
+        # Makes the rename itself durable; not every platform can open a directory
+        try:
+            fd = os.open(self._path.parent, os.O_RDONLY)
+        except OSError:
+            return
+        try:
+            os.fsync(fd)
+        finally:
+            os.close(fd)
+
+    def _open(self) -> BinaryIO:
+        if self._file is None:
+            self._file = open(self._path, "ab")
+        return self._file
+
+    def save(self, room: GameRoom) -> None:
+        expected_version = room.version
+        with self._lock:
+            if self._versions.get(room.room_id, 0) != expected_version:
+                raise ConcurrentModificationError(
+                    f"Room {room.room_id} changed since version {expected_version}"
+                )
+            room.version = expected_version + 1
+            self._versions[room.room_id] = room.version
+            data = RoomCodec.encode(room)
+            record = _record(_SAVE, room.room_id, data)
+            previous = self._rooms.get(room.room_id)
+            if previous is not None:
+                self._live_bytes -= _RECORD.size + len(previous)
+            self._live_bytes += len(record)
+            self._rooms[room.room_id] = data
+            self._pending.append(record)
+
+    def find_by_id(self, room_id: UUID) -> Optional[GameRoom]:
+        with self._lock:
+            data = self._rooms.get(room_id)
+        return None if data is None else RoomCodec.decode(data)
+
+    def delete(self, room_id: UUID) -> None:
+        with self._lock:
+            self._versions.pop(room_id, None)
+            current = self._rooms.pop(room_id, None)
+            if current is None:
+                return
+            self._live_bytes -= _RECORD.size + len(current)
+            self._pending.append(_record(_DELETE, room_id))
+
+    def list_all(self) -> list[GameRoom]:
+        with self._lock:
+            encoded = list(self._rooms.values())
+        return [RoomCodec.decode(data) for data in encoded]
+
+    def exists(self, room_id: UUID) -> bool:
+        with self._lock:
+            return room_id in self._rooms
+
+    def stats(self) -> dict[str, float]:
+        with self._lock:
+            return {
+                "rooms": len(self._rooms),
+                "pending_records": len(self._pending),
+                "journal_bytes": self._journal_bytes,
+                "live_bytes": self._live_bytes,
+                "flushes": self._flushes,
+                "failed_flushes": self._failed_flushes,
+                "records_flushed": self._records_flushed,
+                "compactions": self._compactions,
+                "replayed_records": self._replayed_records,
+                "max_flush_ms": self._max_flush_seconds * 1000,
+            }
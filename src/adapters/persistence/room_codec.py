@@ -0,0 +1,360 @@
+"""Compact, schema-versioned binary encoding of game rooms."""
+
+import pickle
+import struct
+from datetime import datetime, timedelta
+from typing import Iterator, Optional
+from uuid import UUID
+
+from src.domain.entities.game_room import GameRoom, RoomStatus
+from src.domain.entities.game_state import GamePhase, GameState
+from src.domain.entities.player import Player
+from src.domain.entities.policy_deck import PolicyDeck
+from src.domain.value_objects.policy import Policy, PolicyType
+from src.domain.value_objects.role import Role
+
+
+class RoomCodecError(ValueError):
+    pass
+
+
+_EPOCH = datetime(1970, 1, 1)
+_MICROSECOND = timedelta(microseconds=1)
+
+# Wire codes are fixed per schema version; never reorder, only append.
+_STATUS_CODES = {
+    RoomStatus.WAITING: 0,
+    RoomStatus.IN_PROGRESS: 1,
+    RoomStatus.COMPLETED: 2,
+}
+_PHASE_CODES = {
+    GamePhase.NOMINATION: 0,
+    GamePhase.ELECTION: 1,
+    GamePhase.LEGISLATIVE_PRESIDENT: 2,
+    GamePhase.LEGISLATIVE_CHANCELLOR: 3,
+    GamePhase.EXECUTIVE_ACTION: 4,
+    GamePhase.GAME_OVER: 5,
+}
+_ROLE_CODES = {
+    Role.liberal(): 0,
+    Role.fascist(): 1,
+    Role.hitler_role(): 2,
+}
+
+_STATUSES = {code: status for status, code in _STATUS_CODES.items()}
+_PHASES = {code: phase for phase, code in _PHASE_CODES.items()}
+# Policies and roles are immutable value objects, so decoded rooms share them.
+_ROLES = {code: role for role, code in _ROLE_CODES.items()}
+_LIBERAL = Policy(PolicyType.LIBERAL)
+_FASCIST = Policy(PolicyType.FASCIST)
+
+_OPTIONAL_GAME_STATE_IDS = (
+    "president_id",
+    "chancellor_id",
+    "nominated_chancellor_id",
+    "previous_president_id",
+    "previous_chancellor_id",
+    "next_regular_president_id",
+)
+
+_HEADER = struct.Struct("<3sBB")
+_ROOM_V1 = struct.Struct("<BBBqB")
+_ROOM = struct.Struct("<BBBqBI")
+_PLAYER = struct.Struct("<BB")
+_GAME_STATE = struct.Struct("<HBBBBBB")
+_TEXT_LENGTH = struct.Struct("<H")
+
+
+class _Writer:
+    def __init__(self) -> None:
+        self._parts: list[bytes] = []
+        self._uuids: dict[UUID, int] = {}
+
+    def pack(self, packer: struct.Struct, *values) -> None:
+        self._parts.append(packer.pack(*values))
+
+    def byte(self, value: int) -> None:
+        self._parts.append(bytes((value,)))
+
+    def uuid_ref(self, value: UUID) -> int:
+        if not isinstance(value, UUID):
+            value = UUID(str(value))
+        index = self._uuids.get(value)
+        if index is None:
+            index = self._uuids[value] = len(self._uuids)
+            if index > 255:
+                raise RoomCodecError("Too many distinct ids to encode room")
+        return index
+
+    def text(self, value: str) -> None:
+        encoded = value.encode("utf-8")
+        self._parts.append(_TEXT_LENGTH.pack(len(encoded)))
+        self._parts.append(encoded)
+
+    def policies(self, policies: list[Policy]) -> None:
+        bits = 0
+        for index, policy in enumerate(policies):
+            if policy.is_fascist():
+                bits |= 1 << index
+        self.byte(len(policies))
+        self._parts.append(bits.to_bytes((len(policies) + 7) // 8, "little"))
+
+    def getvalue(self, magic: bytes, version: int) -> bytes:
+        header = _HEADER.pack(magic, version, len(self._uuids))
+        table = b"".join(uuid.bytes for uuid in self._uuids)
+        return header + table + b"".join(self._parts)
+
+
+class _Reader:
+    def __init__(self, data: bytes, offset: int, uuid_count: int) -> None:
+        end = offset + uuid_count * 16
+        if end > len(data):
+            raise RoomCodecError("Unexpected end of room data")
+        self._data = data
+        self._uuids = [
+            UUID(bytes=data[start:start + 16]) for start in range(offset, end, 16)
+        ]
+        self._offset = end
+
+    def unpack(self, packer: struct.Struct) -> tuple:
+        values = packer.unpack_from(self._data, self._offset)
+        self._offset += packer.size
+        return values
+
+    def byte(self) -> int:
+        value = self._data[self._offset]
+        self._offset += 1
+        return value
+
+    def uuid(self, index: Optional[int] = None) -> UUID:
+        return self._uuids[self.byte() if index is None else index]
+
+    def raw(self, length: int) -> bytes:
+        end = self._offset + length
+        if end > len(self._data):
+            raise RoomCodecError("Unexpected end of room data")
+        value = self._data[self._offset:end]
+        self._offset = end
+        return value
+
+    def pairs(self) -> Iterator[tuple[int, int]]:
+        """A count byte followed by that many pairs of bytes."""
+        data = self.raw(2 * self.byte())
+        return zip(data[::2], data[1::2])
+
+    def text(self) -> str:
+        (length,) = self.unpack(_TEXT_LENGTH)
+        return self.raw(length).decode("utf-8")
+
+    def policies(self) -> list[Policy]:
+        count = self.byte()
+        bits = int.from_bytes(self.raw((count + 7) // 8), "little")
+        return [
+            _FASCIST if bits >> index & 1 else _LIBERAL for index in range(count)
+        ]
+
+    def at_end(self) -> bool:
+        return self._offset == len(self._data)
+
+
+class RoomCodec:
+    """
+    Encodes a GameRoom as a versioned binary record.
+
+    Every distinct UUID is written once to a 16-byte table and referenced by a
+    one-byte index, roles and enums are single-byte codes and policy piles are
+    packed bit strings. Data that does not carry the codec header is assumed
+    to be a legacy pickle and is unpickled on read.
+    """
+
+    MAGIC = b"SHR"
+    VERSION = 2
+    # Version 1 predates GameRoom.version; such rooms decode as version 0.
+    SUPPORTED_VERSIONS = (1, 2)
+
+    @classmethod
+    def encode(cls, room: GameRoom) -> bytes:
+        writer = _Writer()
+
+        flags = (room.creator_id is not None) | (room.game_state is not None) << 1
+        writer.pack(
+            _ROOM,
+            writer.uuid_ref(room.room_id),
+            flags,
+            _STATUS_CODES[room.status],
+            (room.created_at - _EPOCH) // _MICROSECOND,
+            len(room.players),
+            room.version,
+        )
+        if room.creator_id is not None:
+            writer.byte(writer.uuid_ref(room.creator_id))
+
+        for player in room.players:
+            writer.pack(
+                _PLAYER,
+                writer.uuid_ref(player.player_id),
+                player.is_connected | player.is_alive << 1,
+            )
+            writer.text(player.name)
+
+        if room.game_state is not None:
+            cls._encode_game_state(writer, room.game_state)
+
+        return writer.getvalue(cls.MAGIC, cls.VERSION)
+
+    @classmethod
+    def decode(cls, data: bytes) -> GameRoom:
+        if not data.startswith(cls.MAGIC):
+            return pickle.loads(data)
+
+        try:
+            _, version, uuid_count = _HEADER.unpack_from(data)
+            if version not in cls.SUPPORTED_VERSIONS:
+                raise RoomCodecError(f"Unsupported room codec version {version}")
+
+            reader = _Reader(data, _HEADER.size, uuid_count)
+            room = cls._decode_room(reader, version)
+            if not reader.at_end():
+                raise RoomCodecError("Trailing bytes after room data")
+            return room
+        except (struct.error, IndexError, KeyError) as e:
+            raise RoomCodecError(f"Malformed room data: {e}") from e
+
+    @classmethod
+    def _decode_room(cls, reader: _Reader, version: int) -> GameRoom:
+        if version == 1:
+            room_index, flags, status_code, created_at, player_count = reader.unpack(
+                _ROOM_V1
+            )
+            room_version = 0
+        else:
+            (
+                room_index,
+                flags,
+                status_code,
+                created_at,
+                player_count,
+                room_version,
+            ) = reader.unpack(_ROOM)
+        creator_id = reader.uuid() if flags & 1 else None
+
+        players = []
+        for _ in range(player_count):
+            player_index, player_flags = reader.unpack(_PLAYER)
+            players.append(
+                Player.restore(
+                    player_id=reader.uuid(player_index),
+                    name=reader.text(),
+                    is_connected=bool(player_flags & 1),
+                    is_alive=bool(player_flags & 2),
+                )
+            )
+
+        game_state = cls._decode_game_state(reader) if flags & 2 else None
+
+        return GameRoom.restore(
+            room_id=reader.uuid(room_index),
+            creator_id=creator_id,
+            status=_STATUSES[status_code],
+            players=players,
+            game_state=game_state,
+            created_at=_EPOCH + created_at * _MICROSECOND,
+            version=room_version,
+        )
+
+    @staticmethod
+    def _encode_game_state(writer: _Writer, state: GameState) -> None:
+        ids = [getattr(state, name) for name in _OPTIONAL_GAME_STATE_IDS]
+        id_mask = sum(
+            1 << index for index, value in enumerate(ids) if value is not None
+        )
+        flags = (
+            state.veto_requested
+            | state.veto_rejected << 1
+            | (state.game_over_reason is not None) << 2
+        )
+
+        writer.pack(
+            _GAME_STATE,
+            state.round_number,
+            id_mask,
+            flags,
+            state.liberal_policies,
+            state.fascist_policies,
+            state.election_tracker,
+            _PHASE_CODES[state.current_phase],
+        )
+        for value in ids:
+            if value is not None:
+                writer.byte(writer.uuid_ref(value))
+
+        writer.byte(len(state.role_assignments))
+        for player_id, role in state.role_assignments.items():
+            writer.byte(writer.uuid_ref(player_id))
+            writer.byte(_ROLE_CODES[role])
+
+        writer.byte(len(state.votes))
+        for player_id, vote in state.votes.items():
+            writer.byte(writer.uuid_ref(player_id))
+            writer.byte(bool(vote))
+
+        writer.byte(len(state.investigated_players))
+        for player_id in state.investigated_players:
+            writer.byte(writer.uuid_ref(player_id))
+
+        writer.policies(state.policy_deck.draw_pile)
+        writer.policies(state.policy_deck.discard_pile)
+        writer.policies(state.president_policies)
+        writer.policies(state.chancellor_policies)
+
+        if state.game_over_reason is not None:
+            writer.text(state.game_over_reason)
+
+    @staticmethod
+    def _decode_game_state(reader: _Reader) -> GameState:
+        (
+            round_number,
+            id_mask,
+            flags,
+            liberal_policies,
+            fascist_policies,
+            election_tracker,
+            phase_code,
+        ) = reader.unpack(_GAME_STATE)
+
+        ids: dict[str, Optional[UUID]] = {}
+        for index, name in enumerate(_OPTIONAL_GAME_STATE_IDS):
+            ids[name] = reader.uuid() if id_mask >> index & 1 else None
+
+        role_assignments = {
+            reader.uuid(index): _ROLES[code] for index, code in reader.pairs()
+        }
+        votes = {reader.uuid(index): bool(vote) for index, vote in reader.pairs()}
+
+        investigated_players = {reader.uuid() for _ in range(reader.byte())}
+
+        policy_deck = PolicyDeck.restore(
+            draw_pile=reader.policies(), discard_pile=reader.policies()
+        )
+        president_policies = reader.policies()
+        chancellor_policies = reader.policies()
+
+        game_over_reason = reader.text() if flags & 4 else None
+
+        return GameState.restore(
+            round_number=round_number,
+            veto_requested=bool(flags & 1),
+            veto_rejected=bool(flags & 2),
+            policy_deck=policy_deck,
+            liberal_policies=liberal_policies,
+            fascist_policies=fascist_policies,
+            election_tracker=election_tracker,
+            current_phase=_PHASES[phase_code],
+            role_assignments=role_assignments,
+            votes=votes,
+            president_policies=president_policies,
+            chancellor_policies=chancellor_policies,
+            investigated_players=investigated_players,
+            game_over_reason=game_over_reason,
+            **ids,
+        )
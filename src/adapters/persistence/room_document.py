@@ -0,0 +1,280 @@
+"""JSON-compatible document form of a game room, with field-level diffs."""
+
+from datetime import datetime
+from typing import Any, Optional
+from uuid import UUID
+
+from src.domain.entities.game_room import GameRoom, RoomStatus
+from src.domain.entities.game_state import GamePhase, GameState
+from src.domain.entities.player import Player
+from src.domain.entities.policy_deck import PolicyDeck
+from src.domain.value_objects.policy import Policy, PolicyType
+from src.domain.value_objects.role import Role
+
+_POLICY_LETTERS = {PolicyType.LIBERAL: "L", PolicyType.FASCIST: "F"}
+_POLICIES = {
+    "L": Policy(PolicyType.LIBERAL),
+    "F": Policy(PolicyType.FASCIST),
+}
+_ROLES = {"L": Role.liberal(), "F": Role.fascist(), "H": Role.hitler_role()}
+
+_ID_FIELDS = (
+    "president_id",
+    "chancellor_id",
+    "nominated_chancellor_id",
+    "previous_president_id",
+    "previous_chancellor_id",
+    "next_regular_president_id",
+)
+_SCALAR_FIELDS = (
+    "round_number",
+    "veto_requested",
+    "veto_rejected",
+    "liberal_policies",
+    "fascist_policies",
+    "election_tracker",
+    "game_over_reason",
+)
+# Maps whose patches carry only the entries that were added or changed
+_MAP_FIELDS = ("votes", "role_assignments")
+_MERGE_SUFFIX = "+"
+
+
+def _id(value: Optional[UUID]) -> Optional[str]:
+    return None if value is None else str(value)
+
+
+def _uuid(value: Optional[str]) -> Optional[UUID]:
+    return None if value is None else UUID(value)
+
+
+def _policies(policies: list[Policy]) -> str:
+    return "".join(_POLICY_LETTERS[policy.type] for policy in policies)
+
+
+def _role(role: Role) -> str:
+    if role.is_hitler:
+        return "H"
+    return "F" if role.is_fascist() else "L"
+
+
+def _encode_game_state_field(state: GameState, name: str) -> dict[str, Any]:
+    """Document entries for one GameState field."""
+    if name in _ID_FIELDS:
+        return {name: _id(getattr(state, name))}
+    if name in _SCALAR_FIELDS:
+        return {name: getattr(state, name)}
+    if name == "current_phase":
+        return {name: state.current_phase.value}
+    if name == "policy_deck":
+        return {
+            "draw_pile": _policies(state.policy_deck.draw_pile),
+            "discard_pile": _policies(state.policy_deck.discard_pile),
+        }
+    if name in ("president_policies", "chancellor_policies"):
+        return {name: _policies(getattr(state, name))}
+    if name == "role_assignments":
+        return {
+            name: {str(pid): _role(role) for pid, role in state.role_assignments.items()}
+        }
+    if name == "votes":
+        return {name: {str(pid): vote for pid, vote in state.votes.items()}}
+    if name == "investigated_players":
+        return {name: sorted(str(pid) for pid in state.investigated_players)}
+    raise ValueError(f"Unknown game state field {name}")
+
+
+_GAME_STATE_FIELDS = (
+    *_ID_FIELDS,
+    *_SCALAR_FIELDS,
+    "current_phase",
+    "policy_deck",
+    "president_policies",
+    "chancellor_policies",
+    "role_assignments",
+    "votes",
+    "investigated_players",
+)
+
+
+class RoomDocument:
+    """
+    Converts rooms to plain dicts and back.
+
+    Top-level keys mirror GameRoom fields and the "game_state" value mirrors
+    GameState fields, so a patch can replace individual game state fields
+    without carrying the rest of the room. Patches of the vote and role maps
+    carry only the entries that changed, under the map name plus "+".
+    """
+
+    @staticmethod
+    def from_room(room: GameRoom) -> dict[str, Any]:
+        return {
+            "room_id": str(room.room_id),
+            "creator_id": _id(room.creator_id),
+            "status": room.status.value,
+            "created_at": room.created_at.isoformat(),
+            "players": [RoomDocument.from_player(p) for p in room.players],
+            "game_state": (
+                None
+                if room.game_state is None
+                else RoomDocument.from_game_state(room.game_state)
+            ),
+        }
+
+    @staticmethod
+    def update(document: Optional[dict[str, Any]], room: GameRoom) -> dict[str, Any]:
+        """
+        Return `document` brought up to date with `room`.
+
+        Only the fields the room's entities report as changed are encoded
+        again; `document` must describe the room as it was when its changes
+        were last cleared.
+        """
+        changed = room.changed_fields()
+        if document is None or changed is None or "room_id" in changed:
+            return RoomDocument.from_room(room)
+
+        result = dict(document)
+        if "creator_id" in changed:
+            result["creator_id"] = _id(room.creator_id)
+        if "status" in changed:
+            result["status"] = room.status.value
+        if "created_at" in changed:
+            result["created_at"] = room.created_at.isoformat()
+        if "players" in changed or any(
+            player.changed_fields() != set() for player in room.players
+        ):
+            result["players"] = [RoomDocument.from_player(p) for p in room.players]
+
+        state = room.game_state
+        if state is None or "game_state" in changed or document["game_state"] is None:
+            result["game_state"] = (
+                None if state is None else RoomDocument.from_game_state(state)
+            )
+            return result
+
+        state_changed = state.changed_fields()
+        deck_changed = state.policy_deck.changed_fields()
+        if state_changed is None or deck_changed is None:
+            result["game_state"] = RoomDocument.from_game_state(state)
+            return result
+        if deck_changed:
+            state_changed.add("policy_deck")
+        if state_changed:
+            result["game_state"] = dict(document["game_state"])
+            for name in state_changed:
+                result["game_state"].update(_encode_game_state_field(state, name))
+        return result
+
+    @staticmethod
+    def from_player(player: Player) -> list:
+        return [
+            str(player.player_id),
+            player.name,
+            player.is_connected,
+            player.is_alive,
+        ]
+
+    @staticmethod
+    def from_game_state(state: GameState) -> dict[str, Any]:
+        document: dict[str, Any] = {}
+        for name in _GAME_STATE_FIELDS:
+            document.update(_encode_game_state_field(state, name))
+        return document
+
+    @staticmethod
+    def to_room(document: dict[str, Any]) -> GameRoom:
+        game_state = document["game_state"]
+        return GameRoom(
+            room_id=UUID(document["room_id"]),
+            creator_id=_uuid(document["creator_id"]),
+            status=RoomStatus(document["status"]),
+            players=[RoomDocument.to_player(p) for p in document["players"]],
+            game_state=(
+                None if game_state is None else RoomDocument.to_game_state(game_state)
+            ),
+            created_at=datetime.fromisoformat(document["created_at"]),
+        )
+
+    @staticmethod
+    def to_player(document: list) -> Player:
+        player_id, name, is_connected, is_alive = document
+        return Player(
+            player_id=UUID(player_id),
+            name=name,
+            is_connected=is_connected,
+            is_alive=is_alive,
+        )
+
+    @staticmethod
+    def to_game_state(document: dict[str, Any]) -> GameState:
+        return GameState(
+            **{name: _uuid(document[name]) for name in _ID_FIELDS},
+            **{name: document[name] for name in _SCALAR_FIELDS},
+            current_phase=GamePhase(document["current_phase"]),
+            policy_deck=PolicyDeck(
+                draw_pile=[_POLICIES[c] for c in document["draw_pile"]],
+                discard_pile=[_POLICIES[c] for c in document["discard_pile"]],
+            ),
+            president_policies=[_POLICIES[c] for c in document["president_policies"]],
+            chancellor_policies=[
+                _POLICIES[c] for c in document["chancellor_policies"]
+            ],
+            role_assignments={
+                UUID(pid): _ROLES[role]
+                for pid, role in document["role_assignments"].items()
+            },
+            votes={UUID(pid): vote for pid, vote in document["votes"].items()},
+            investigated_players={UUID(pid) for pid in document["investigated_players"]},
+        )
+
+    @staticmethod
+    def diff(old: dict[str, Any], new: dict[str, Any]) -> dict[str, Any]:
+        """Return the patch that turns `old` into `new`."""
+        patch = {
+            key: value
+            for key, value in new.items()
+            if key != "game_state" and old.get(key) != value
+        }
+
+        old_state, new_state = old.get("game_state"), new["game_state"]
+        if old_state is None or new_state is None:
+            if old_state != new_state:
+                patch["game_state"] = new_state
+        else:
+            state_patch = {}
+            for key, value in new_state.items():
+                old_value = old_state.get(key)
+                if old_value == value:
+                    continue
+                if (
+                    key in _MAP_FIELDS
+                    and isinstance(old_value, dict)
+                    and old_value.keys() <= value.keys()
+                ):
+                    state_patch[key + _MERGE_SUFFIX] = {
+                        k: v for k, v in value.items() if old_value.get(k) != v
+                    }
+                else:
+                    state_patch[key] = value
+            if state_patch:
+                patch["game_state"] = state_patch
+
+        return patch
+
+    @staticmethod
+    def apply(document: dict[str, Any], patch: dict[str, Any]) -> dict[str, Any]:
+        """Return a new document with `patch` applied to `document`."""
+        result = {**document, **patch}
+        state_patch = patch.get("game_state")
+        if state_patch is not None and document.get("game_state") is not None:
+            state = {**document["game_state"]}
+            for key, value in state_patch.items():
+                if key.endswith(_MERGE_SUFFIX):
+                    name = key[: -len(_MERGE_SUFFIX)]
+                    state[name] = {**state.get(name, {}), **value}
+                else:
+                    state[key] = value
+            result["game_state"] = state
+        return result
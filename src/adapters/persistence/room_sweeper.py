@@ -0,0 +1,212 @@
+"""Background task that expires finished and abandoned rooms."""
+
+import asyncio
+import logging
+import threading
+import time
+from concurrent.futures import Future
+from datetime import datetime, timedelta
+from typing import Any, Callable, Optional, Union
+from uuid import UUID
+
+from src.adapters.persistence.cached_code_repository import CodeCache
+from src.adapters.persistence.sharded_sqlite_room_repository import (
+    ShardedSqliteRoomRepository,
+)
+from src.adapters.persistence.sqlite_code_repository import SqliteCodeRepository
+from src.adapters.persistence.sqlite_room_repository import SqliteRoomRepository
+from src.domain.entities.game_room import RoomStatus
+from src.ports.room_repository_port import RoomRepositoryPort
+
+SummaryRepository = Union[SqliteRoomRepository, ShardedSqliteRoomRepository]
+
+logger = logging.getLogger(__name__)
+
+
+class RoomSweeper:
+    """
+    Deletes COMPLETED rooms older than `completed_ttl` and WAITING rooms
+    that have not changed for `waiting_ttl`, then releases their codes. With
+    `archive_after`, COMPLETED rooms older than that are first moved into the
+    compressed archive, where they stay readable until they expire.
+
+    Expired rooms are found through the indexed summary columns of the
+    rooms table. They are deleted through `room_repository_factory`, so caches
+    and write-behind storage drop them too, and from the rooms table in one
+    transaction per batch of at most `batch_size` rooms. Batches run off the
+    event loop, so a sweep never holds the write lock for long.
+
+    Each room is only deleted if it still has the version it was found with.
+    That check and the delete run through `run_for_room` (the room command
+    executor's `submit_nowait`), so they cannot interleave with a command
+    for the same room; without it they run on the sweeping thread.
+    """
+
+    def __init__(
+        self,
+        summary_repository_factory: Callable[[], SummaryRepository],
+        room_repository_factory: Callable[[], RoomRepositoryPort],
+        code_repository_factory: Callable[[], SqliteCodeRepository],
+        completed_ttl: timedelta,
+        waiting_ttl: timedelta,
+        interval: float = 300.0,
+        batch_size: int = 100,
+        code_cache: Optional[CodeCache] = None,
+        clock: Callable[[], datetime] = datetime.utcnow,
+        archive_after: Optional[timedelta] = None,
+        run_for_room: Optional[Callable[[UUID, Callable[[], Any]], Future]] = None,
+    ) -> None:
+        if batch_size < 1:
+            raise ValueError("Batch size must be at least 1")
+        self._summary_repository_factory = summary_repository_factory
+        self._room_repository_factory = room_repository_factory
+        self._code_repository_factory = code_repository_factory
+        self._completed_ttl = completed_ttl
+        self._waiting_ttl = waiting_ttl
+        self._interval = interval
+        self._batch_size = batch_size
+        self._code_cache = code_cache
+        self._clock = clock
+        self._archive_after = archive_after
+        self._run_for_room = run_for_room
+        self._lock = threading.Lock()
+        self._task: Optional[asyncio.Task] = None
+        self._sweeps = 0
+        self._rooms_deleted = 0
+        self._rooms_kept = 0
+        self._rooms_archived = 0
+        self._codes_released = 0
+        self._last_sweep_ms = 0.0
+        self._last_swept_at: Optional[str] = None
+
+    def start(self) -> None:
+        if self._task is None:
+            self._task = asyncio.get_running_loop().create_task(self._run())
+
+    async def stop(self) -> None:
+        if self._task is None:
+            return
+        self._task.cancel()
+        try:
+            await self._task
+        except asyncio.CancelledError:
+            pass
+        self._task = None
+
+    async def _run(self) -> None:
+        while True:
+            await asyncio.sleep(self._interval)
+            try:
+                while await asyncio.to_thread(self.sweep_batch) == self._batch_size:
+                    # Let other writers in between batches
+                    await asyncio.sleep(0)
+            except Exception:
+                logger.exception("Room sweep failed")
+
+    def sweep(self) -> int:
+        """Archive and expire every eligible room now; returns how many were touched."""
+        total = 0
+        while True:
+            deleted = self.sweep_batch()
+            total += deleted
+            if deleted < self._batch_size:
+                return total
+
+    def sweep_batch(self) -> int:
+        started = time.perf_counter()
+        summaries = self._summary_repository_factory()
+        archived = 0
+        if self._archive_after is not None:
+            archived = summaries.archive_completed(
+                self._clock() - self._archive_after, self._batch_size
+            )
+        expired = self._find_expired(summaries)
+        room_ids = self._delete_unchanged(expired)
+        if room_ids:
+            summaries.write_batch([], room_ids)
+            released = self._code_repository_factory().release_codes(room_ids)
+            if self._code_cache is not None:
+                for room_id in room_ids:
+                    self._code_cache.invalidate_room(room_id)
+        else:
+            released = 0
+
+        with self._lock:
+            self._sweeps += 1
+            self._rooms_deleted += len(room_ids)
+            self._rooms_kept += len(expired) - len(room_ids)
+            self._rooms_archived += archived
+            self._codes_released += released
+            self._last_sweep_ms = (time.perf_counter() - started) * 1000
+            self._last_swept_at = self._clock().isoformat()
+        if room_ids or archived:
+            logger.info(
+                "Swept %d rooms, archived %d and released %d codes",
+                len(room_ids), archived, released,
+            )
+        return max(len(room_ids), archived)
+
+    def _delete_unchanged(self, expired: dict[UUID, int]) -> list[UUID]:
+        """Delete the rooms still at the version they expired at; returns their ids."""
+        if self._run_for_room is None:
+            return [
+                room_id
+                for room_id, version in expired.items()
+                if self._delete_if_unchanged(room_id, version)
+            ]
+        futures = {
+            room_id: self._run_for_room(
+                room_id,
+                lambda room_id=room_id, version=version: self._delete_if_unchanged(
+                    room_id, version
+                ),
+            )
+            for room_id, version in expired.items()
+        }
+        return [room_id for room_id, future in futures.items() if future.result()]
+
+    def _delete_if_unchanged(self, room_id: UUID, version: int) -> bool:
+        room_repository = self._room_repository_factory()
+        room = room_repository.find_by_id(room_id)
+        if room is not None and room.version != version:
+            return False
+        room_repository.delete(room_id)
+        return True
+
+    def _find_expired(self, summaries: SummaryRepository) -> dict[UUID, int]:
+        """Map the ids of expired rooms to the version they expired at."""
+        now = self._clock()
+        expired = summaries.find_room_summaries(
+            status=RoomStatus.COMPLETED,
+            updated_before=now - self._completed_ttl,
+            limit=self._batch_size,
+        )
+        remaining = self._batch_size - len(expired)
+        if remaining > 0:
+            expired += summaries.find_room_summaries(
+                status=RoomStatus.WAITING,
+                updated_before=now - self._waiting_ttl,
+                limit=remaining,
+            )
+        versions = {summary.room_id: summary.version for summary in expired}
+        remaining = self._batch_size - len(versions)
+        if remaining > 0:
+            for room_id in summaries.find_archived_room_ids(
+                now - self._completed_ttl, remaining
+            ):
+                room = summaries.find_by_id(room_id)
+                if room is not None:
+                    versions[room_id] = room.version
+        return versions
+
+    def stats(self) -> dict[str, object]:
+        with self._lock:
+            return {
+                "sweeps": self._sweeps,
+                "rooms_deleted": self._rooms_deleted,
+                "rooms_kept": self._rooms_kept,
+                "rooms_archived": self._rooms_archived,
+                "codes_released": self._codes_released,
+                "last_sweep_ms": self._last_sweep_ms,
+                "last_swept_at": self._last_swept_at,
+            }
@@ -0,0 +1,147 @@
+"""Streams rooms and code mappings from one storage backend to another."""
+
+import json
+import os
+import time
+from dataclasses import dataclass, field
+from itertools import islice
+from pathlib import Path
+from typing import Callable, Iterable, Iterator, Optional, TypeVar
+from uuid import UUID
+
+from src.domain.entities.game_room import GameRoom
+from src.ports.code_repository_port import CodeRepositoryPort
+from src.ports.room_repository_port import RoomRepositoryPort
+
+T = TypeVar("T")
+
+
+@dataclass
+class TransferProgress:
+    rooms: int = 0
+    codes: int = 0
+    # Rooms and codes are copied in id order; these are the last ones copied
+    last_room_id: Optional[UUID] = None
+    last_code: Optional[str] = None
+    started_at: float = field(default_factory=time.monotonic)
+
+    def elapsed(self) -> float:
+        return time.monotonic() - self.started_at
+
+    def rooms_per_second(self) -> float:
+        elapsed = self.elapsed()
+        return self.rooms / elapsed if elapsed > 0 else 0.0
+
+
+class TransferCheckpoint:
+    """
+    The last room and code mapping copied, and how many, kept in a JSON file.
+
+    The checkpoint is saved after every batch the target has stored, and the
+    file is removed once a transfer completes. Without a path nothing is
+    saved and every transfer starts from the beginning.
+    """
+
+    def __init__(self, path: Optional[str] = None) -> None:
+        self._path = Path(path) if path else None
+
+    def load(self) -> TransferProgress:
+        if self._path is None or not self._path.exists():
+            return TransferProgress()
+        try:
+            with open(self._path, "r") as f:
+                data = json.load(f)
+        except json.JSONDecodeError:
+            return TransferProgress()
+        last_room_id = data.get("last_room_id")
+        return TransferProgress(
+            rooms=data.get("rooms", 0),
+            codes=data.get("codes", 0),
+            last_room_id=UUID(last_room_id) if last_room_id else None,
+            last_code=data.get("last_code"),
+        )
+
+    def save(self, progress: TransferProgress) -> None:
+        if self._path is None:
+            return
+        temp_file = self._path.with_suffix(".tmp")
+        with open(temp_file, "w") as f:
+            json.dump(
+                {
+                    "rooms": progress.rooms,
+                    "codes": progress.codes,
+                    "last_room_id": (
+                        str(progress.last_room_id) if progress.last_room_id else None
+                    ),
+                    "last_code": progress.last_code,
+                },
+                f,
+            )
+        os.replace(temp_file, self._path)
+
+    def clear(self) -> None:
+        if self._path is not None:
+            self._path.unlink(missing_ok=True)
+
+
+def _batches(items: Iterable[T], batch_size: int) -> Iterator[list[T]]:
+    iterator = iter(items)
+    while batch := list(islice(iterator, batch_size)):
+        yield batch
+
+
+def _write_rooms(target: RoomRepositoryPort, rooms: list[GameRoom]) -> None:
+    write_batch = getattr(target, "write_batch", None)
+    if write_batch is not None:
+        # Batched targets store rooms as given, versions included, in one commit
+        write_batch(rooms, [])
+    else:
+        for room in rooms:
+            target.save(room)
+
+
+def transfer(
+    source_rooms: RoomRepositoryPort,
+    target_rooms: RoomRepositoryPort,
+    source_codes: Optional[CodeRepositoryPort] = None,
+    target_codes: Optional[CodeRepositoryPort] = None,
+    batch_size: int = 500,
+    checkpoint: Optional[TransferCheckpoint] = None,
+    on_progress: Optional[Callable[[TransferProgress], None]] = None,
+) -> TransferProgress:
+    """
+    Copy every room, then every code mapping, from the sources to the targets.
+
+    Rooms are read through `iter_all` and written `batch_size` at a time, so
+    memory use is bounded by one batch on backends that stream. After each
+    batch the checkpoint records the last room id or code copied; a later
+    call with the same checkpoint carries on after it, since sources list
+    rooms and codes in id order. Rooms and codes added behind that point
+    while the transfer was stopped are not copied; writes are idempotent, so
+    restarting without a checkpoint is always safe.
+    """
+    if batch_size < 1:
+        raise ValueError("Batch size must be at least 1")
+    checkpoint = checkpoint or TransferCheckpoint()
+    progress = checkpoint.load()
+
+    for batch in _batches(source_rooms.iter_all(progress.last_room_id), batch_size):
+        _write_rooms(target_rooms, batch)
+        progress.rooms += len(batch)
+        progress.last_room_id = batch[-1].room_id
+        checkpoint.save(progress)
+        if on_progress is not None:
+            on_progress(progress)
+
+    if source_codes is not None and target_codes is not None:
+        mappings = source_codes.iter_mappings(progress.last_code)
+        for batch in _batches(mappings, batch_size):
+            target_codes.import_mappings(batch)
+            progress.codes += len(batch)
+            progress.last_code = batch[-1][0]
+            checkpoint.save(progress)
+            if on_progress is not None:
+                on_progress(progress)
+
+    checkpoint.clear()
+    return progress
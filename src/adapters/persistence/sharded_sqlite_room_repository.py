@@ -0,0 +1,268 @@
+"""Room repository that spreads rooms over several SQLite files."""
+
+import hashlib
+import heapq
+import sqlite3
+from datetime import datetime
+from itertools import islice
+from pathlib import Path
+from typing import Iterator, Optional
+from uuid import UUID
+
+from src.adapters.persistence.sqlite_connection_pool import SqliteConnectionPool
+from src.adapters.persistence.sqlite_room_archive import SqliteRoomArchive
+from src.adapters.persistence.sqlite_room_repository import (
+    RoomSummary,
+    SqliteRoomRepository,
+)
+from src.domain.entities.game_room import GameRoom, RoomStatus
+from src.domain.entities.game_state import GamePhase
+from src.ports.room_repository_port import RoomRepositoryPort
+
+ROOM_COLUMNS = (
+    "room_id, room_data, version, status, player_count, phase, created_at, updated_at"
+)
+
+
+def shard_index(room_id: UUID, shard_count: int) -> int:
+    digest = hashlib.sha1(room_id.bytes).digest()
+    return int.from_bytes(digest[:8], "big") % shard_count
+
+
+def shard_database_paths(database: str, shard_count: int) -> list[str]:
+    """Shard files sit next to `database`: rooms.db -> rooms.shard0.db, ..."""
+    path = Path(database)
+    return [
+        str(path.with_name(f"{path.stem}.shard{i}{path.suffix}"))
+        for i in range(shard_count)
+    ]
+
+
+class ShardedSqliteRoomRepository(RoomRepositoryPort):
+    """
+    Routes each room to one of several SQLite files by a hash of its id.
+
+    Every shard has its own connection pool, so writes to rooms on different
+    shards never wait on the same database lock. Queries that span rooms
+    visit every shard and merge the results.
+    """
+
+    def __init__(
+        self, pools: list[SqliteConnectionPool], archive_block_size: int = 64
+    ) -> None:
+        if not pools:
+            raise ValueError("At least one shard is required")
+        self._pools = pools
+        self._archive_block_size = archive_block_size
+
+    @property
+    def shard_count(self) -> int:
+        return len(self._pools)
+
+    def shard(self, index: int) -> SqliteRoomRepository:
+        pool = self._pools[index]
+        return SqliteRoomRepository(
+            pool.connection(),
+            unit_of_work=pool.unit_of_work(),
+            archive_block_size=self._archive_block_size,
+        )
+
+    def _shard_for(self, room_id: UUID) -> SqliteRoomRepository:
+        return self.shard(shard_index(room_id, len(self._pools)))
+
+    def _shards(self) -> Iterator[SqliteRoomRepository]:
+        return (self.shard(i) for i in range(len(self._pools)))
+
+    def init_tables(self) -> None:
+        for shard in self._shards():
+            shard.init_tables()
+
+    def save(self, room: GameRoom) -> None:
+        self._shard_for(room.room_id).save(room)
+
+    def write_batch(self, rooms: list[GameRoom], deleted_ids: list[UUID]) -> None:
+        # Each shard commits its part on its own; a batch is atomic per shard.
+        rooms_by_shard: dict[int, list[GameRoom]] = {}
+        deleted_by_shard: dict[int, list[UUID]] = {}
+        for room in rooms:
+            index = shard_index(room.room_id, len(self._pools))
+            rooms_by_shard.setdefault(index, []).append(room)
+        for room_id in deleted_ids:
+            index = shard_index(room_id, len(self._pools))
+            deleted_by_shard.setdefault(index, []).append(room_id)
+
+        for index in sorted(rooms_by_shard.keys() | deleted_by_shard.keys()):
+            self.shard(index).write_batch(
+                rooms_by_shard.get(index, []), deleted_by_shard.get(index, [])
+            )
+
+    def find_by_id(self, room_id: UUID) -> Optional[GameRoom]:
+        return self._shard_for(room_id).find_by_id(room_id)
+
+    def delete(self, room_id: UUID) -> None:
+        self._shard_for(room_id).delete(room_id)
+
+    def list_all(self) -> list[GameRoom]:
+        return list(self.iter_all())
+
+    def iter_all(self, after: Optional[UUID] = None) -> Iterator[GameRoom]:
+        # Each shard is in room id order, so merging them keeps that order
+        yield from heapq.merge(
+            *(shard.iter_all(after) for shard in self._shards()),
+            key=lambda room: str(room.room_id),
+        )
+
+    def exists(self, room_id: UUID) -> bool:
+        return self._shard_for(room_id).exists(room_id)
+
+    def find_room_summaries(
+        self,
+        status: Optional[RoomStatus] = None,
+        phase: Optional[GamePhase] = None,
+        updated_before: Optional[datetime] = None,
+        limit: int = 100,
+        offset: int = 0,
+    ) -> list[RoomSummary]:
+        per_shard = [
+            shard.find_room_summaries(status, phase, updated_before, limit + offset)
+            for shard in self._shards()
+        ]
+        merged = heapq.merge(
+            *per_shard, key=lambda summary: (summary.updated_at, str(summary.room_id))
+        )
+        return list(islice(merged, offset, offset + limit))
+
+    def count_rooms(
+        self,
+        status: Optional[RoomStatus] = None,
+        phase: Optional[GamePhase] = None,
+        updated_before: Optional[datetime] = None,
+    ) -> int:
+        return sum(
+            shard.count_rooms(status, phase, updated_before) for shard in self._shards()
+        )
+
+    def archive_completed(self, updated_before: datetime, limit: int = 100) -> int:
+        archived = 0
+        for shard in self._shards():
+            archived += shard.archive_completed(updated_before, limit - archived)
+            if archived >= limit:
+                break
+        return archived
+
+    def find_archived_room_ids(self, updated_before: datetime, limit: int = 100) -> list[UUID]:
+        room_ids: list[UUID] = []
+        for shard in self._shards():
+            room_ids += shard.find_archived_room_ids(updated_before, limit - len(room_ids))
+            if len(room_ids) >= limit:
+                break
+        return room_ids
+
+    def archive_stats(self) -> dict[str, int]:
+        totals: dict[str, int] = {}
+        for shard in self._shards():
+            for key, value in shard.archive_stats().items():
+                totals[key] = totals.get(key, 0) + value
+        return totals
+
+
+def reshard(source_paths: list[str], target_paths: list[str], batch_size: int = 500) -> int:
+    """
+    Move rooms from `source_paths` into the shard layout of `target_paths`.
+
+    Rows are copied as stored, without decoding, in batches of `batch_size`;
+    archived rooms are repacked into the archive of their new shard. A source
+    file may also be a target; rooms that already sit in their target shard
+    stay put and only the rest are moved. Returns how many rooms were moved.
+    """
+    targets = [sqlite3.connect(path) for path in target_paths]
+    moved = 0
+    try:
+        for conn in targets:
+            SqliteRoomRepository(conn).init_tables()
+
+        for source_path in source_paths:
+            source = sqlite3.connect(source_path)
+            try:
+                moved += _move_rows(source, source_path, targets, target_paths, batch_size)
+                moved += _move_archived_rows(source, source_path, targets, target_paths)
+            finally:
+                source.close()
+    finally:
+        for conn in targets:
+            conn.close()
+    return moved
+
+
+def _move_rows(
+    source: sqlite3.Connection,
+    source_path: str,
+    targets: list[sqlite3.Connection],
+    target_paths: list[str],
+    batch_size: int,
+) -> int:
+    SqliteRoomRepository(source).init_tables()
+    resolved_targets = [Path(path).resolve() for path in target_paths]
+    source_resolved = Path(source_path).resolve()
+    placeholders = ", ".join("?" * len(ROOM_COLUMNS.split(",")))
+    moved = 0
+    last_room_id = ""
+    while True:
+        rows = source.execute(
+            f"SELECT {ROOM_COLUMNS} FROM rooms WHERE room_id > ? ORDER BY room_id LIMIT ?",
+            (last_room_id, batch_size),
+        ).fetchall()
+        if not rows:
+            return moved
+        last_room_id = rows[-1][0]
+
+        leaving = []
+        for row in rows:
+            index = shard_index(UUID(row[0]), len(targets))
+            if resolved_targets[index] == source_resolved:
+                continue
+            targets[index].execute(
+                f"INSERT OR REPLACE INTO rooms ({ROOM_COLUMNS}) VALUES ({placeholders})",
+                row,
+            )
+            leaving.append((row[0],))
+
+        for conn in targets:
+            conn.commit()
+        # Only forget rows once their new shard has committed them
+        source.executemany("DELETE FROM rooms WHERE room_id = ?", leaving)
+        source.commit()
+        moved += len(leaving)
+
+
+def _move_archived_rows(
+    source: sqlite3.Connection,
+    source_path: str,
+    targets: list[sqlite3.Connection],
+    target_paths: list[str],
+) -> int:
+    resolved_targets = [Path(path).resolve() for path in target_paths]
+    source_resolved = Path(source_path).resolve()
+    source_archive = SqliteRoomArchive(source)
+    pending: dict[int, list] = {}
+    moved = 0
+
+    def flush(index: int) -> int:
+        rows = pending.pop(index)
+        SqliteRoomArchive(targets[index]).add(rows)
+        targets[index].commit()
+        source_archive.remove(row[0] for row in rows)
+        source.commit()
+        return len(rows)
+
+    for row in source_archive.iter_rows():
+        index = shard_index(UUID(row[0]), len(targets))
+        if resolved_targets[index] == source_resolved:
+            continue
+        pending.setdefault(index, []).append(row)
+        # Full blocks are written as soon as they fill to bound memory use
+        if len(pending[index]) == source_archive.block_size:
+            moved += flush(index)
+    for index in list(pending):
+        moved += flush(index)
+    return moved
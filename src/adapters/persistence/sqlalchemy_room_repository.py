@@ -0,0 +1,269 @@
+"""Room repository over the normalized schema in src.database.models."""
+
+import json
+from datetime import datetime
+from typing import Callable, Iterator, Optional
+from uuid import UUID
+
+from sqlalchemy import delete, select, update
+from sqlalchemy.exc import IntegrityError
+from sqlalchemy.orm import Session, selectinload
+
+from src.adapters.persistence.room_document import RoomDocument
+from src.database.models import GameStateRecord, RoleAssignment, Room, RoomPlayer
+from src.domain.entities.game_room import GameRoom, RoomStatus
+from src.domain.entities.game_state import GameState
+from src.domain.entities.player import Player
+from src.ports.room_repository_port import (
+    ConcurrentModificationError,
+    RoomRepositoryPort,
+)
+
+# GameStateRecord columns stored exactly as they appear in a RoomDocument
+_STATE_COLUMNS = (
+    "round_number",
+    "current_phase",
+    "president_id",
+    "chancellor_id",
+    "nominated_chancellor_id",
+    "previous_president_id",
+    "previous_chancellor_id",
+    "next_regular_president_id",
+    "veto_requested",
+    "veto_rejected",
+    "liberal_policies",
+    "fascist_policies",
+    "election_tracker",
+    "game_over_reason",
+    "draw_pile",
+    "discard_pile",
+    "president_policies",
+    "chancellor_policies",
+)
+
+
+def _uuid(value: Optional[str]) -> Optional[UUID]:
+    return None if value is None else UUID(value)
+
+
+class SqlAlchemyRoomRepository(RoomRepositoryPort):
+    """
+    Stores rooms across the rooms, room_players, role_assignments and
+    game_states tables.
+
+    Every relationship is loaded explicitly, so each read fetches only the
+    tables it needs: `find_lobby_by_id` reads rooms and players and never
+    touches the game state. Saves are checked against the version column like
+    the other SQL repositories, and only write the player, role and game
+    state rows that changed. Each call runs in its own short session.
+    """
+
+    def __init__(
+        self,
+        session_factory: Callable[[], Session],
+        clock: Callable[[], datetime] = datetime.utcnow,
+    ) -> None:
+        self._session_factory = session_factory
+        self._clock = clock
+
+    def save(self, room: GameRoom) -> None:
+        room_id_str = str(room.room_id)
+        expected_version = room.version
+        values = {
+            "status": room.status.value,
+            "creator_id": None if room.creator_id is None else str(room.creator_id),
+            "created_at": room.created_at,
+            "updated_at": self._clock(),
+            "is_active": room.status != RoomStatus.COMPLETED,
+            "version": expected_version + 1,
+        }
+
+        with self._session_factory() as session:
+            result = session.execute(
+                update(Room)
+                .where(Room.room_id == room_id_str, Room.version == expected_version)
+                .values(**values)
+            )
+            created = result.rowcount == 0
+            if created:
+                if expected_version != 0:
+                    raise ConcurrentModificationError(
+                        f"Room {room.room_id} changed since version {expected_version}"
+                    )
+                session.add(Room(room_id=room_id_str, **values))
+
+            roles, state = self._game_state_rows(room.game_state)
+            players = {
+                str(player.player_id): {
+                    "seat": seat,
+                    "name": player.name,
+                    "is_connected": player.is_connected,
+                    "is_alive": player.is_alive,
+                }
+                for seat, player in enumerate(room.players)
+            }
+            self._sync_rows(session, RoomPlayer, "player_id", room_id_str, players, created)
+            self._sync_rows(session, RoleAssignment, "player_id", room_id_str, roles, created)
+            self._sync_rows(
+                session,
+                GameStateRecord,
+                "room_id",
+                room_id_str,
+                {} if state is None else {room_id_str: state},
+                created,
+            )
+
+            try:
+                session.commit()
+            except IntegrityError:
+                # Another writer created the same room first
+                session.rollback()
+                raise ConcurrentModificationError(
+                    f"Room {room.room_id} changed since version {expected_version}"
+                )
+
+        room.version = expected_version + 1
+
+    def find_by_id(self, room_id: UUID) -> Optional[GameRoom]:
+        with self._session_factory() as session:
+            record = session.execute(
+                select(Room)
+                .where(Room.room_id == str(room_id))
+                .options(
+                    selectinload(Room.players),
+                    selectinload(Room.role_assignments),
+                    selectinload(Room.game_state),
+                )
+            ).scalar_one_or_none()
+            return None if record is None else self._to_room(record, with_game_state=True)
+
+    def find_lobby_by_id(self, room_id: UUID) -> Optional[GameRoom]:
+        with self._session_factory() as session:
+            record = session.execute(
+                select(Room)
+                .where(Room.room_id == str(room_id))
+                .options(selectinload(Room.players))
+            ).scalar_one_or_none()
+            return None if record is None else self._to_room(record, with_game_state=False)
+
+    def delete(self, room_id: UUID) -> None:
+        room_id_str = str(room_id)
+        with self._session_factory() as session:
+            for table in (RoomPlayer, RoleAssignment, GameStateRecord, Room):
+                session.execute(delete(table).where(table.room_id == room_id_str))
+            session.commit()
+
+    def list_all(self) -> list[GameRoom]:
+        return list(self.iter_all())
+
+    def iter_all(
+        self, after: Optional[UUID] = None, batch_size: int = 200
+    ) -> Iterator[GameRoom]:
+        last_room_id = str(after) if after is not None else ""
+        while True:
+            with self._session_factory() as session:
+                records = session.execute(
+                    select(Room)
+                    .where(Room.room_id > last_room_id)
+                    .order_by(Room.room_id)
+                    .limit(batch_size)
+                    .options(
+                        selectinload(Room.players),
+                        selectinload(Room.role_assignments),
+                        selectinload(Room.game_state),
+                    )
+                ).scalars().all()
+                rooms = [self._to_room(record, with_game_state=True) for record in records]
+            if not rooms:
+                return
+            yield from rooms
+            last_room_id = str(rooms[-1].room_id)
+
+    def exists(self, room_id: UUID) -> bool:
+        with self._session_factory() as session:
+            return session.execute(
+                select(Room.room_id).where(Room.room_id == str(room_id)).limit(1)
+            ).first() is not None
+
+    @staticmethod
+    def _sync_rows(
+        session: Session,
+        model: type,
+        key: str,
+        room_id_str: str,
+        rows: dict[str, dict],
+        created: bool,
+    ) -> None:
+        """Make a room's `model` rows match `rows`, touching only rows that differ."""
+        existing = {}
+        if not created:
+            existing = {
+                getattr(record, key): record
+                for record in session.execute(
+                    select(model).where(model.room_id == room_id_str)
+                ).scalars()
+            }
+        for row_key, values in rows.items():
+            record = existing.pop(row_key, None)
+            if record is None:
+                session.add(model(**{"room_id": room_id_str, key: row_key, **values}))
+                continue
+            for name, value in values.items():
+                if getattr(record, name) != value:
+                    setattr(record, name, value)
+        for record in existing.values():
+            session.delete(record)
+
+    @staticmethod
+    def _game_state_rows(
+        state: Optional[GameState],
+    ) -> tuple[dict[str, dict], Optional[dict]]:
+        """The role assignment rows by player id, and the game state row, of a room."""
+        if state is None:
+            return {}, None
+        document = RoomDocument.from_game_state(state)
+        roles = {
+            player_id: {"role": role}
+            for player_id, role in document["role_assignments"].items()
+        }
+        record = {
+            **{name: document[name] for name in _STATE_COLUMNS},
+            "votes": json.dumps(document["votes"], separators=(",", ":")),
+            "investigated_players": json.dumps(
+                document["investigated_players"], separators=(",", ":")
+            ),
+        }
+        return roles, record
+
+    @staticmethod
+    def _to_room(record: Room, with_game_state: bool) -> GameRoom:
+        game_state = None
+        if with_game_state and record.game_state is not None:
+            document = {name: getattr(record.game_state, name) for name in _STATE_COLUMNS}
+            document["votes"] = json.loads(record.game_state.votes)
+            document["investigated_players"] = json.loads(
+                record.game_state.investigated_players
+            )
+            document["role_assignments"] = {
+                assignment.player_id: assignment.role
+                for assignment in record.role_assignments
+            }
+            game_state = RoomDocument.to_game_state(document)
+
+        return GameRoom(
+            room_id=UUID(record.room_id),
+            creator_id=_uuid(record.creator_id),
+            status=RoomStatus(record.status),
+            players=[
+                Player(
+                    player_id=UUID(player.player_id),
+                    name=player.name,
+                    is_connected=player.is_connected,
+                    is_alive=player.is_alive,
+                )
+                for player in record.players
+            ],
+            game_state=game_state,
+            created_at=record.created_at,
+            version=record.version,
+        )
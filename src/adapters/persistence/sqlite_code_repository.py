@@ -1,14 +1,101 @@
 import sqlite3
-from typing import Optional
+import threading
+import time
+from typing import Callable, Iterable, Iterator, Optional
 from uuid import UUID
 
 from src.adapters.api.rest.code_factory import CodeFactory
+from src.adapters.persistence.sqlite_unit_of_work import SqliteUnitOfWork
 from src.ports.code_repository_port import CodeRepositoryPort
 
 
+class CodeCounterLease:
+    """
+    Hands out code counter values from blocks leased in one transaction.
+
+    The shared counter row is bumped by `block_size` at a time, so workers
+    only contend on it once per block instead of once per room. Values left
+    in a block when the process stops are simply never used. A block leased
+    inside a unit of work that then rolls back is dropped, since the counter
+    row no longer covers it. One lease is meant to be shared by every
+    SqliteCodeRepository in the process.
+    """
+
+    def __init__(self, block_size: int = 1000) -> None:
+        if block_size < 1:
+            raise ValueError("Block size must be at least 1")
+        self._block_size = block_size
+        self._lock = threading.Lock()
+        self._next = 0
+        self._end = 0
+        self._leases = 0
+
+    def next_value(
+        self, conn: sqlite3.Connection, unit_of_work: SqliteUnitOfWork
+    ) -> int:
+        with self._lock:
+            if self._next >= self._end:
+                self._next = self._lease_block(conn, unit_of_work)
+                self._end = self._next + self._block_size
+                self._leases += 1
+            value = self._next
+            self._next += 1
+            return value
+
+    def _lease_block(
+        self, conn: sqlite3.Connection, unit_of_work: SqliteUnitOfWork
+    ) -> int:
+        cursor = conn.cursor()
+        cursor.execute(
+            "UPDATE code_counter SET counter = counter + ? WHERE id = 1",
+            (self._block_size,),
+        )
+        cursor.execute("SELECT counter FROM code_counter WHERE id = 1")
+        result = cursor.fetchone()
+        start = result[0] - self._block_size
+        if unit_of_work.active:
+            unit_of_work.on_rollback(lambda: self._drop_block(start))
+        unit_of_work.commit()
+        return start
+
+    def _drop_block(self, start: int) -> None:
+        with self._lock:
+            if self._end == start + self._block_size:
+                self._next = self._end
+
+    def stats(self) -> dict[str, int]:
+        with self._lock:
+            return {
+                "block_size": self._block_size,
+                "leases": self._leases,
+                "remaining": self._end - self._next,
+            }
+
+
 class SqliteCodeRepository(CodeRepositoryPort):
-    def __init__(self, conn: sqlite3.Connection) -> None:
+    """
+    Allocates room codes from a counter, recycling codes of deleted rooms.
+
+    Released codes wait in `code_pool` for `reuse_after` seconds before they
+    are handed out again, so stale links do not immediately point at a new
+    room. Counter values whose code is still taken (the counter wraps after
+    CodeFactory.MAX_CODES) are skipped. Without a shared `lease` every new
+    code bumps the counter row on its own.
+    """
+
+    def __init__(
+        self,
+        conn: sqlite3.Connection,
+        reuse_after: float = 86400.0,
+        clock: Callable[[], float] = time.time,
+        lease: Optional[CodeCounterLease] = None,
+        unit_of_work: Optional[SqliteUnitOfWork] = None,
+    ) -> None:
         self._conn = conn
+        self._reuse_after = reuse_after
+        self._clock = clock
+        self._lease = lease or CodeCounterLease(block_size=1)
+        self._unit_of_work = unit_of_work or SqliteUnitOfWork(conn)
 
     def init_tables(self) -> None:
         cursor = self._conn.cursor()
@@ -28,20 +115,24 @@ class SqliteCodeRepository(CodeRepositoryPort):
             )
             """
         )
+        cursor.execute(
+            """
+            CREATE TABLE IF NOT EXISTS code_pool (
+                code TEXT PRIMARY KEY,
+                released_at REAL NOT NULL
+            )
+            """
+        )
+        cursor.execute(
+            "CREATE INDEX IF NOT EXISTS idx_code_pool_released_at ON code_pool (released_at)"
+        )
         cursor.execute(
             "INSERT OR IGNORE INTO code_counter (id, counter) VALUES (1, 1)"
         )
         self._conn.commit()
 
     def _increment_counter(self) -> int:
-        cursor = self._conn.cursor()
-        cursor.execute(
-            "UPDATE code_counter SET counter = counter + 1 WHERE id = 1"
-        )
-        cursor.execute("SELECT counter FROM code_counter WHERE id = 1")
-        result = cursor.fetchone()
-        self._conn.commit()
-        return result[0] - 1
+        return self._lease.next_value(self._conn, self._unit_of_work)
 
     def generate_code_for_room(self, room_id: UUID) -> str:
         room_id_str = str(room_id)
@@ -55,16 +146,82 @@ class SqliteCodeRepository(CodeRepositoryPort):
         if result:
             return result[0]
 
-        counter = self._increment_counter()
-        code = CodeFactory.int_to_code(counter)
+        code = self._claim_pooled_code(room_id_str)
+        if code is not None:
+            return code
 
-        cursor.execute(
-            "INSERT INTO code_mappings (code, room_id) VALUES (?, ?)",
-            (code, room_id_str),
-        )
-        self._conn.commit()
+        for _ in range(CodeFactory.MAX_CODES):
+            code = CodeFactory.int_to_code(self._increment_counter())
+            cursor.execute("SELECT 1 FROM code_pool WHERE code = ?", (code,))
+            if cursor.fetchone() is not None:
+                continue
+            cursor.execute(
+                "INSERT OR IGNORE INTO code_mappings (code, room_id) VALUES (?, ?)",
+                (code, room_id_str),
+            )
+            inserted = cursor.rowcount == 1
+            self._unit_of_work.commit()
+            if inserted:
+                return code
 
-        return code
+        raise ValueError("No room codes available")
+
+    def _claim_pooled_code(self, room_id_str: str) -> Optional[str]:
+        cursor = self._conn.cursor()
+        while True:
+            cursor.execute(
+                """
+                SELECT code FROM code_pool WHERE released_at <= ?
+                ORDER BY released_at LIMIT 1
+                """,
+                (self._clock() - self._reuse_after,),
+            )
+            result = cursor.fetchone()
+            if result is None:
+                return None
+
+            code = result[0]
+            cursor.execute("DELETE FROM code_pool WHERE code = ?", (code,))
+            if cursor.rowcount == 1:
+                cursor.execute(
+                    "INSERT INTO code_mappings (code, room_id) VALUES (?, ?)",
+                    (code, room_id_str),
+                )
+                self._unit_of_work.commit()
+                return code
+            # Another worker claimed it first; the DELETE changed nothing, so
+            # look again without undoing the caller's writes
+
+    def release_codes(self, room_ids: Iterable[UUID]) -> int:
+        """Free the codes of deleted rooms; returns how many were released."""
+        cursor = self._conn.cursor()
+        released = 0
+        try:
+            for room_id_str in map(str, room_ids):
+                cursor.execute(
+                    "SELECT code FROM code_mappings WHERE room_id = ?", (room_id_str,)
+                )
+                result = cursor.fetchone()
+                if result is None:
+                    continue
+                cursor.execute(
+                    "DELETE FROM code_mappings WHERE room_id = ?", (room_id_str,)
+                )
+                cursor.execute(
+                    "INSERT OR REPLACE INTO code_pool (code, released_at) VALUES (?, ?)",
+                    (result[0], self._clock()),
+                )
+                released += 1
+        except Exception:
+            self._unit_of_work.rollback()
+            raise
+        self._unit_of_work.commit()
+        return released
+
+    def pooled_code_count(self) -> int:
+        cursor = self._conn.cursor()
+        cursor.execute("SELECT COUNT(*) FROM code_pool")
+        return cursor.fetchone()[0]
 
     def find_room_by_code(self, code: str) -> Optional[UUID]:
         cursor = self._conn.cursor()
@@ -81,6 +238,56 @@ class SqliteCodeRepository(CodeRepositoryPort):
         except ValueError:
             return None
 
+    def list_mappings(self) -> list[tuple[str, UUID]]:
+        cursor = self._conn.cursor()
+        cursor.execute("SELECT code, room_id FROM code_mappings")
+        mappings = []
+        for code, room_id in cursor.fetchall():
+            try:
+                mappings.append((code, UUID(room_id)))
+            except ValueError:
+                continue
+        return mappings
+
+    def iter_mappings(
+        self, after: Optional[str] = None, batch_size: int = 500
+    ) -> Iterator[tuple[str, UUID]]:
+        last_code = after or ""
+        while True:
+            cursor = self._conn.cursor()
+            cursor.execute(
+                """
+                SELECT code, room_id FROM code_mappings
+                WHERE code > ? ORDER BY code LIMIT ?
+                """,
+                (last_code, batch_size),
+            )
+            results = cursor.fetchall()
+            if not results:
+                return
+            for code, room_id in results:
+                try:
+                    yield code, UUID(room_id)
+                except ValueError:
+                    continue
+            last_code = results[-1][0]
+
+    def import_mappings(self, mappings: list[tuple[str, UUID]]) -> None:
+        # Counter values whose code is taken are skipped, so the counter is left as is.
+        cursor = self._conn.cursor()
+        try:
+            cursor.executemany(
+                "INSERT OR REPLACE INTO code_mappings (code, room_id) VALUES (?, ?)",
+                [(code, str(room_id)) for code, room_id in mappings],
+            )
+            cursor.executemany(
+                "DELETE FROM code_pool WHERE code = ?", [(code,) for code, _ in mappings]
+            )
+        except Exception:
+            self._unit_of_work.rollback()
+            raise
+        self._unit_of_work.commit()
+
     def get_code_for_room(self, room_id: UUID) -> Optional[str]:
         room_id_str = str(room_id)
         cursor = self._conn.cursor()
@@ -0,0 +1,158 @@
+"""Process-wide pool of per-thread SQLite connections."""
+
+import sqlite3
+import threading
+from dataclasses import dataclass
+from typing import Optional
+
+from src.adapters.persistence.sqlite_unit_of_work import SqliteUnitOfWork
+
+
+@dataclass(frozen=True)
+class DurabilityProfile:
+    """PRAGMA settings applied to every connection a pool opens."""
+
+    journal_mode: str
+    synchronous: str
+    cache_size_kib: int
+    mmap_size: int
+    temp_store: str
+
+    def apply(self, conn: sqlite3.Connection) -> None:
+        conn.execute(f"PRAGMA journal_mode = {self.journal_mode}")
+        conn.execute(f"PRAGMA synchronous = {self.synchronous}")
+        # A negative cache_size is a size in KiB rather than in pages
+        conn.execute(f"PRAGMA cache_size = {-int(self.cache_size_kib)}")
+        conn.execute(f"PRAGMA mmap_size = {int(self.mmap_size)}")
+        conn.execute(f"PRAGMA temp_store = {self.temp_store}")
+
+
+# Every profile keeps WAL, which the pool relies on so readers never block the
+# writer. They differ in when commits reach the disk:
+#   safe      fsync on every commit; a committed command survives power loss.
+#   balanced  fsync at checkpoints only; power loss may drop the last commits,
+#             but never corrupts the database. Process crashes lose nothing.
+#   fast      never fsync; an OS crash or power loss may corrupt the database.
+DURABILITY_PROFILES: dict[str, DurabilityProfile] = {
+    "safe": DurabilityProfile("WAL", "FULL", 8 * 1024, 0, "DEFAULT"),
+    "balanced": DurabilityProfile("WAL", "NORMAL", 32 * 1024, 128 * 1024 * 1024, "MEMORY"),
+    "fast": DurabilityProfile("WAL", "OFF", 64 * 1024, 256 * 1024 * 1024, "MEMORY"),
+}
+
+
+def durability_profile(name: str) -> DurabilityProfile:
+    try:
+        return DURABILITY_PROFILES[name]
+    except KeyError:
+        raise ValueError(
+            f"Unknown durability profile {name!r}; expected one of "
+            f"{', '.join(DURABILITY_PROFILES)}"
+        ) from None
+
+
+class SqliteConnectionPool:
+    """
+    Hands each thread its own long-lived connection to the database file.
+
+    Connections are opened lazily on first use in a thread, configured with a
+    busy timeout and the PRAGMAs of the named durability profile, and reused
+    for every later request served by that thread. Connections belonging to
+    threads that have exited are closed the next time a new connection is
+    opened. Each connection comes with one unit of work that every repository
+    on that thread joins.
+    """
+
+    def __init__(
+        self,
+        database: Optional[str],
+        busy_timeout_ms: int = 5000,
+        durability: str = "safe",
+    ) -> None:
+        self._database = database
+        self._busy_timeout_ms = busy_timeout_ms
+        self._durability = durability
+        self._profile = durability_profile(durability)
+        self._local = threading.local()
+        self._lock = threading.Lock()
+        self._connections: dict[int, sqlite3.Connection] = {}
+        self._connections_opened = 0
+        self._connections_closed = 0
+        self._peak_connections = 0
+        self._acquisitions = 0
+
+    @property
+    def database(self) -> Optional[str]:
+        return self._database
+
+    @property
+    def durability(self) -> str:
+        return self._durability
+
+    def connection(self) -> sqlite3.Connection:
+        conn = getattr(self._local, "conn", None)
+        if conn is None:
+            conn = self._open()
+            self._local.conn = conn
+            self._local.unit_of_work = SqliteUnitOfWork(conn)
+
+        with self._lock:
+            self._acquisitions += 1
+
+        return conn
+
+    def unit_of_work(self) -> SqliteUnitOfWork:
+        """The unit of work of this thread's connection."""
+        self.connection()
+        return self._local.unit_of_work
+
+    def _open(self) -> sqlite3.Connection:
+        if self._database is None:
+            raise ValueError("No SQLite database configured for connection pool")
+
+        conn = sqlite3.connect(
+            self._database,
+            timeout=self._busy_timeout_ms / 1000,
+            check_same_thread=False,
+        )
+        conn.execute(f"PRAGMA busy_timeout = {int(self._busy_timeout_ms)}")
+        self._profile.apply(conn)
+
+        thread_id = threading.get_ident()
+        with self._lock:
+            self._close_dead_thread_connections()
+            previous = self._connections.pop(thread_id, None)
+            if previous is not None:
+                previous.close()
+                self._connections_closed += 1
+            self._connections[thread_id] = conn
+            self._connections_opened += 1
+            self._peak_connections = max(
+                self._peak_connections, len(self._connections)
+            )
+
+        return conn
+
+    def _close_dead_thread_connections(self) -> None:
+        alive = {thread.ident for thread in threading.enumerate()}
+        for thread_id in [t for t in self._connections if t not in alive]:
+            self._connections.pop(thread_id).close()
+            self._connections_closed += 1
+
+    def close_all(self) -> None:
+        with self._lock:
+            for conn in self._connections.values():
+                conn.close()
+            self._connections_closed += len(self._connections)
+            self._connections.clear()
+        self._local = threading.local()
+
+    def stats(self) -> dict[str, object]:
+        with self._lock:
+            return {
+                "durability": self._durability,
+                "open_connections": len(self._connections),
+                "peak_connections": self._peak_connections,
+                "connections_opened": self._connections_opened,
+                "connections_closed": self._connections_closed,
+                "acquisitions": self._acquisitions,
+            }
@@ -0,0 +1,223 @@
+"""Compressed cold storage for rooms that are no longer played."""
+
+import sqlite3
+import zlib
+from datetime import datetime
+from typing import Iterable, Iterator, Optional
+from uuid import UUID
+
+# One row of the rooms table as archived: room_id, room_data, version, updated_at
+ArchivedRow = tuple[str, bytes, int, str]
+
+
+class SqliteRoomArchive:
+    """
+    Packs encoded rooms into zlib-compressed blocks of up to `block_size`.
+
+    Compressing rooms together lets the compressor reuse what they share:
+    the codec layout, policy piles and repeated player names. An index row per
+    room records its block and byte range. Reading a room decompresses only
+    its own block, and only when that room is asked for.
+
+    The archive never commits; the repository that owns the connection does.
+    """
+
+    def __init__(
+        self,
+        conn: sqlite3.Connection,
+        block_size: int = 64,
+        compression_level: int = 6,
+    ) -> None:
+        if block_size < 1:
+            raise ValueError("Block size must be at least 1")
+        self._conn = conn
+        self._block_size = block_size
+        self._compression_level = compression_level
+
+    def init_tables(self) -> None:
+        cursor = self._conn.cursor()
+        cursor.execute(
+            """
+            CREATE TABLE IF NOT EXISTS room_archive_blocks (
+                block_id INTEGER PRIMARY KEY AUTOINCREMENT,
+                data BLOB NOT NULL,
+                room_count INTEGER NOT NULL,
+                raw_size INTEGER NOT NULL
+            )
+            """
+        )
+        cursor.execute(
+            """
+            CREATE TABLE IF NOT EXISTS room_archive (
+                room_id TEXT PRIMARY KEY,
+                block_id INTEGER NOT NULL,
+                start INTEGER NOT NULL,
+                length INTEGER NOT NULL,
+                version INTEGER NOT NULL,
+                updated_at TEXT NOT NULL
+            )
+            """
+        )
+        cursor.execute(
+            "CREATE INDEX IF NOT EXISTS idx_room_archive_updated ON room_archive (updated_at)"
+        )
+        cursor.execute(
+            "CREATE INDEX IF NOT EXISTS idx_room_archive_block ON room_archive (block_id)"
+        )
+
+    @property
+    def block_size(self) -> int:
+        return self._block_size
+
+    def add(self, rows: list[ArchivedRow]) -> None:
+        self.remove(room_id for room_id, _, _, _ in rows)
+        cursor = self._conn.cursor()
+        for first in range(0, len(rows), self._block_size):
+            block = rows[first:first + self._block_size]
+            raw = b"".join(room_data for _, room_data, _, _ in block)
+            cursor.execute(
+                """
+                INSERT INTO room_archive_blocks (data, room_count, raw_size)
+                VALUES (?, ?, ?)
+                """,
+                (zlib.compress(raw, self._compression_level), len(block), len(raw)),
+            )
+            block_id = cursor.lastrowid
+
+            index_rows, start = [], 0
+            for room_id, room_data, version, updated_at in block:
+                index_rows.append(
+                    (room_id, block_id, start, len(room_data), version, updated_at)
+                )
+                start += len(room_data)
+            cursor.executemany(
+                """
+                INSERT OR REPLACE INTO room_archive
+                    (room_id, block_id, start, length, version, updated_at)
+                VALUES (?, ?, ?, ?, ?, ?)
+                """,
+                index_rows,
+            )
+
+    def find(self, room_id: UUID) -> Optional[tuple[bytes, int]]:
+        """Return the encoded room and its version, or None if not archived."""
+        cursor = self._conn.cursor()
+        cursor.execute(
+            """
+            SELECT b.data, a.start, a.length, a.version
+            FROM room_archive a JOIN room_archive_blocks b ON b.block_id = a.block_id
+            WHERE a.room_id = ?
+            """,
+            (str(room_id),),
+        )
+        result = cursor.fetchone()
+        if result is None:
+            return None
+        data, start, length, version = result
+        return zlib.decompress(data)[start:start + length], version
+
+    def version_of(self, room_id: UUID) -> Optional[int]:
+        cursor = self._conn.cursor()
+        cursor.execute(
+            "SELECT version FROM room_archive WHERE room_id = ?", (str(room_id),)
+        )
+        result = cursor.fetchone()
+        return None if result is None else result[0]
+
+    def remove(self, room_ids: Iterable[str]) -> None:
+        """Drop rooms from the index, and any blocks left holding no rooms."""
+        params = [(room_id,) for room_id in dict.fromkeys(room_ids)]
+        if not params:
+            return
+        cursor = self._conn.cursor()
+        # Count every removal before freeing blocks, so a block losing several
+        # rooms in one call is freed too
+        cursor.executemany(
+            """
+            UPDATE room_archive_blocks SET room_count = room_count - 1
+            WHERE block_id IN (SELECT block_id FROM room_archive WHERE room_id = ?)
+            """,
+            params,
+        )
+        cursor.executemany("DELETE FROM room_archive WHERE room_id = ?", params)
+        cursor.execute("DELETE FROM room_archive_blocks WHERE room_count <= 0")
+
+    def room_ids_updated_before(self, updated_before: datetime, limit: int) -> list[UUID]:
+        cursor = self._conn.cursor()
+        cursor.execute(
+            """
+            SELECT room_id FROM room_archive WHERE updated_at < ?
+            ORDER BY updated_at, room_id LIMIT ?
+            """,
+            (updated_before.isoformat(), limit),
+        )
+        return [UUID(room_id) for (room_id,) in cursor.fetchall()]
+
+    def rows_after(self, after: str, limit: int) -> list[ArchivedRow]:
+        """Return up to `limit` archived rooms in room id order, decompressing each block once."""
+        cursor = self._conn.cursor()
+        cursor.execute(
+            """
+            SELECT room_id, block_id, start, length, version, updated_at FROM room_archive
+            WHERE room_id > ? ORDER BY room_id LIMIT ?
+            """,
+            (after, limit),
+        )
+        entries = cursor.fetchall()
+        block_ids = sorted({entry[1] for entry in entries})
+        blocks = {}
+        for block_id in block_ids:
+            cursor.execute(
+                "SELECT data FROM room_archive_blocks WHERE block_id = ?", (block_id,)
+            )
+            blocks[block_id] = zlib.decompress(cursor.fetchone()[0])
+        return [
+            (room_id, blocks[block_id][start:start + length], version, updated_at)
+            for room_id, block_id, start, length, version, updated_at in entries
+        ]
+
+    def iter_rows(self) -> Iterator[ArchivedRow]:
+        """Yield every archived room, decompressing one block at a time."""
+        last_block_id = 0
+        while True:
+            cursor = self._conn.cursor()
+            cursor.execute(
+                """
+                SELECT block_id, data FROM room_archive_blocks
+                WHERE block_id > ? ORDER BY block_id LIMIT 1
+                """,
+                (last_block_id,),
+            )
+            block = cursor.fetchone()
+            if block is None:
+                return
+            last_block_id, data = block
+            cursor.execute(
+                """
+                SELECT room_id, start, length, version, updated_at FROM room_archive
+                WHERE block_id = ?
+                """,
+                (last_block_id,),
+            )
+            entries = cursor.fetchall()
+            raw = zlib.decompress(data)
+            for room_id, start, length, version, updated_at in entries:
+                yield room_id, raw[start:start + length], version, updated_at
+
+    def stats(self) -> dict[str, int]:
+        cursor = self._conn.cursor()
+        cursor.execute("SELECT COUNT(*) FROM room_archive")
+        rooms = cursor.fetchone()[0]
+        cursor.execute(
+            """
+            SELECT COUNT(*), COALESCE(SUM(LENGTH(data)), 0), COALESCE(SUM(raw_size), 0)
+            FROM room_archive_blocks
+            """
+        )
+        blocks, compressed_bytes, raw_bytes = cursor.fetchone()
+        return {
+            "rooms": rooms,
+            "blocks": blocks,
+            "compressed_bytes": compressed_bytes,
+            "raw_bytes": raw_bytes,
+        }
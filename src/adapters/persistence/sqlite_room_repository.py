@@ -1,15 +1,65 @@
+import heapq
 import pickle
 import sqlite3
-from typing import Optional
+from dataclasses import dataclass
+from datetime import datetime
+from itertools import islice
+from typing import Any, Callable, Iterator, Optional
 from uuid import UUID
 
-from src.domain.entities.game_room import GameRoom
-from src.ports.room_repository_port import RoomRepositoryPort
+from src.adapters.persistence.room_codec import RoomCodec
+from src.adapters.persistence.sqlite_room_archive import SqliteRoomArchive
+from src.adapters.persistence.sqlite_unit_of_work import SqliteUnitOfWork
+from src.domain.entities.game_room import GameRoom, RoomStatus
+from src.domain.entities.game_state import GamePhase
+from src.ports.room_repository_port import (
+    ConcurrentModificationError,
+    RoomRepositoryPort,
+)
+
+
+# Columns copied out of room_data on every save so rooms can be queried in SQL
+SUMMARY_COLUMNS = {
+    "version": "INTEGER NOT NULL DEFAULT 0",
+    "status": "TEXT",
+    "player_count": "INTEGER",
+    "phase": "TEXT",
+    "created_at": "TEXT",
+    "updated_at": "TEXT",
+}
+
+
+@dataclass
+class RoomSummary:
+    room_id: UUID
+    status: RoomStatus
+    player_count: int
+    phase: Optional[GamePhase]
+    created_at: datetime
+    updated_at: datetime
+    version: int
 
 
 class SqliteRoomRepository(RoomRepositoryPort):
-    def __init__(self, conn: sqlite3.Connection) -> None:
+    """
+    Stores rooms in the rooms table, with completed rooms that have been
+    archived kept compressed in a SqliteRoomArchive on the same connection.
+
+    Archived rooms are still found by id, listed, deleted and, if saved again,
+    moved back into the rooms table. Summary queries only see the rooms table.
+    """
+
+    def __init__(
+        self,
+        conn: sqlite3.Connection,
+        clock: Callable[[], datetime] = datetime.utcnow,
+        unit_of_work: Optional[SqliteUnitOfWork] = None,
+        archive_block_size: int = 64,
+    ) -> None:
         self._conn = conn
+        self._clock = clock
+        self._unit_of_work = unit_of_work or SqliteUnitOfWork(conn)
+        self._archive = SqliteRoomArchive(conn, archive_block_size)
 
     def init_tables(self) -> None:
         cursor = self._conn.cursor()
@@ -17,40 +67,146 @@ class SqliteRoomRepository(RoomRepositoryPort):
             """
             CREATE TABLE IF NOT EXISTS rooms (
                 room_id TEXT PRIMARY KEY,
-                room_data BLOB NOT NULL
+                room_data BLOB NOT NULL,
+                version INTEGER NOT NULL DEFAULT 0,
+                status TEXT,
+                player_count INTEGER,
+                phase TEXT,
+                created_at TEXT,
+                updated_at TEXT
             )
             """
         )
+        cursor.execute("PRAGMA table_info(rooms)")
+        columns = {row[1] for row in cursor.fetchall()}
+        for name, definition in SUMMARY_COLUMNS.items():
+            if name not in columns:
+                cursor.execute(f"ALTER TABLE rooms ADD COLUMN {name} {definition}")
+        cursor.execute(
+            "CREATE INDEX IF NOT EXISTS idx_rooms_status_updated ON rooms (status, updated_at)"
+        )
+        cursor.execute(
+            "CREATE INDEX IF NOT EXISTS idx_rooms_updated_at ON rooms (updated_at)"
+        )
+        cursor.execute(
+            "CREATE INDEX IF NOT EXISTS idx_rooms_phase ON rooms (phase)"
+        )
+        self._backfill_summaries(cursor)
+        self._archive.init_tables()
         self._conn.commit()
 
+    def _backfill_summaries(self, cursor: sqlite3.Cursor) -> None:
+        # Rows written before the summary columns existed are decoded once here.
+        cursor.execute("SELECT room_id, room_data FROM rooms WHERE status IS NULL")
+        updates = []
+        for room_id_str, room_data in cursor.fetchall():
+            try:
+                room = RoomCodec.decode(room_data)
+            except (pickle.UnpicklingError, ValueError):
+                continue
+            updates.append((*self._summary_values(room), room_id_str))
+        cursor.executemany(
+            """
+            UPDATE rooms SET status = ?, player_count = ?, phase = ?,
+                created_at = ?, updated_at = ?
+            WHERE room_id = ?
+            """,
+            updates,
+        )
+
     def save(self, room: GameRoom) -> None:
         room_id_str = str(room.room_id)
-        room_data = pickle.dumps(room)
+        expected_version = room.version
+        room.version = expected_version + 1
+        room_data = RoomCodec.encode(room)
+
+        summary = self._summary_values(room)
 
         cursor = self._conn.cursor()
         cursor.execute(
             """
-            INSERT OR REPLACE INTO rooms (room_id, room_data)
-            VALUES (?, ?)
+            UPDATE rooms SET room_data = ?, version = ?, status = ?,
+                player_count = ?, phase = ?, created_at = ?, updated_at = ?
+            WHERE room_id = ? AND version = ?
             """,
-            (room_id_str, room_data),
+            (room_data, room.version, *summary, room_id_str, expected_version),
         )
-        self._conn.commit()
+        saved = cursor.rowcount == 1
+        # Saving an archived room brings it back into the rooms table
+        unarchived = (
+            not saved
+            and expected_version > 0
+            and self._archive.version_of(room.room_id) == expected_version
+        )
+        if unarchived:
+            self._archive.remove([room_id_str])
+        if not saved and (expected_version == 0 or unarchived):
+            cursor.execute(
+                """
+                INSERT OR IGNORE INTO rooms (room_id, room_data, version, status,
+                    player_count, phase, created_at, updated_at)
+                VALUES (?, ?, ?, ?, ?, ?, ?, ?)
+                """,
+                (room_id_str, room_data, room.version, *summary),
+            )
+            saved = cursor.rowcount == 1
+
+        if not saved:
+            self._unit_of_work.rollback()
+            room.version = expected_version
+            raise ConcurrentModificationError(
+                f"Room {room.room_id} changed since version {expected_version}"
+            )
+        self._unit_of_work.commit()
+
+    def write_batch(self, rooms: list[GameRoom], deleted_ids: list[UUID]) -> None:
+        cursor = self._conn.cursor()
+        try:
+            cursor.executemany(
+                """
+                INSERT OR REPLACE INTO rooms (room_id, room_data, version, status,
+                    player_count, phase, created_at, updated_at)
+                VALUES (?, ?, ?, ?, ?, ?, ?, ?)
+                """,
+                [
+                    (
+                        str(room.room_id),
+                        RoomCodec.encode(room),
+                        room.version,
+                        *self._summary_values(room),
+                    )
+                    for room in rooms
+                ],
+            )
+            cursor.executemany(
+                "DELETE FROM rooms WHERE room_id = ?",
+                [(str(room_id),) for room_id in deleted_ids],
+            )
+            self._archive.remove(
+                [str(room.room_id) for room in rooms]
+                + [str(room_id) for room_id in deleted_ids]
+            )
+        except Exception:
+            self._unit_of_work.rollback()
+            raise
+        self._unit_of_work.commit()
 
     def find_by_id(self, room_id: UUID) -> Optional[GameRoom]:
         room_id_str = str(room_id)
         cursor = self._conn.cursor()
 
         cursor.execute(
-            "SELECT room_data FROM rooms WHERE room_id = ?", (room_id_str,)
+            "SELECT room_data, version FROM rooms WHERE room_id = ?", (room_id_str,)
         )
         result = cursor.fetchone()
 
         if result is None:
-            return None
+            result = self._archive.find(room_id)
+            if result is None:
+                return None
 
         try:
-            return pickle.loads(result[0])
+            return self._decode(*result)
         except (pickle.UnpicklingError, ValueError):
             return None
 
@@ -58,22 +214,46 @@ class SqliteRoomRepository(RoomRepositoryPort):
         room_id_str = str(room_id)
         cursor = self._conn.cursor()
         cursor.execute("DELETE FROM rooms WHERE room_id = ?", (room_id_str,))
-        self._conn.commit()
+        self._archive.remove([room_id_str])
+        self._unit_of_work.commit()
 
     def list_all(self) -> list[GameRoom]:
-        cursor = self._conn.cursor()
-        cursor.execute("SELECT room_data FROM rooms")
-        results = cursor.fetchall()
+        return list(self.iter_all())
 
-        rooms = []
-        for (room_data,) in results:
-            try:
-                room = pickle.loads(room_data)
-                rooms.append(room)
-            except (pickle.UnpicklingError, ValueError):
-                continue
+    def iter_all(
+        self, after: Optional[UUID] = None, batch_size: int = 200
+    ) -> Iterator[GameRoom]:
+        # Keyset pages keep no cursor open between yields, so callers may write.
+        # Live and archived rooms are merged so both come in room id order.
+        last_room_id = str(after) if after is not None else ""
+        while True:
+            cursor = self._conn.cursor()
+            cursor.execute(
+                """
+                SELECT room_id, room_data, version FROM rooms
+                WHERE room_id > ? ORDER BY room_id LIMIT ?
+                """,
+                (last_room_id, batch_size),
+            )
+            live = cursor.fetchall()
+            archived = [
+                (room_id, room_data, version)
+                for room_id, room_data, version, _ in self._archive.rows_after(
+                    last_room_id, batch_size
+                )
+            ]
+            page = list(
+                islice(heapq.merge(live, archived, key=lambda row: row[0]), batch_size)
+            )
+            if not page:
+                return
 
-        return rooms
+            for _, room_data, version in page:
+                try:
+                    yield self._decode(room_data, version)
+                except (pickle.UnpicklingError, ValueError):
+                    continue
+            last_room_id = page[-1][0]
 
     def exists(self, room_id: UUID) -> bool:
         room_id_str = str(room_id)
@@ -81,4 +261,118 @@ class SqliteRoomRepository(RoomRepositoryPort):
         cursor.execute(
             "SELECT 1 FROM rooms WHERE room_id = ? LIMIT 1", (room_id_str,)
         )
-        return cursor.fetchone() is not None
+        return (
+            cursor.fetchone() is not None
+            or self._archive.version_of(room_id) is not None
+        )
+
+    def archive_completed(self, updated_before: datetime, limit: int = 100) -> int:
+        """Move completed rooms last updated before `updated_before` into the archive."""
+        cursor = self._conn.cursor()
+        cursor.execute(
+            """
+            SELECT room_id, room_data, version, updated_at FROM rooms
+            WHERE status = ? AND updated_at < ?
+            ORDER BY updated_at, room_id LIMIT ?
+            """,
+            (RoomStatus.COMPLETED.value, updated_before.isoformat(), limit),
+        )
+        rows = cursor.fetchall()
+        if not rows:
+            return 0
+        try:
+            self._archive.add(rows)
+            cursor.executemany(
+                "DELETE FROM rooms WHERE room_id = ?", [(row[0],) for row in rows]
+            )
+        except Exception:
+            self._unit_of_work.rollback()
+            raise
+        self._unit_of_work.commit()
+        return len(rows)
+
+    def find_archived_room_ids(self, updated_before: datetime, limit: int = 100) -> list[UUID]:
+        return self._archive.room_ids_updated_before(updated_before, limit)
+
+    def archive_stats(self) -> dict[str, int]:
+        return self._archive.stats()
+
+    def find_room_summaries(
+        self,
+        status: Optional[RoomStatus] = None,
+        phase: Optional[GamePhase] = None,
+        updated_before: Optional[datetime] = None,
+        limit: int = 100,
+        offset: int = 0,
+    ) -> list[RoomSummary]:
+        """Page through rooms by their indexed columns, least recently updated first."""
+        where, params = self._summary_filter(status, phase, updated_before)
+        cursor = self._conn.cursor()
+        cursor.execute(
+            f"""
+            SELECT room_id, status, player_count, phase, created_at, updated_at, version
+            FROM rooms {where}
+            ORDER BY updated_at, room_id
+            LIMIT ? OFFSET ?
+            """,
+            (*params, limit, offset),
+        )
+        return [
+            RoomSummary(
+                room_id=UUID(room_id),
+                status=RoomStatus(status),
+                player_count=player_count,
+                phase=GamePhase(phase) if phase else None,
+                created_at=datetime.fromisoformat(created_at),
+                updated_at=datetime.fromisoformat(updated_at),
+                version=version,
+            )
+            for room_id, status, player_count, phase, created_at, updated_at, version
+            in cursor.fetchall()
+        ]
+
+    def count_rooms(
+        self,
+        status: Optional[RoomStatus] = None,
+        phase: Optional[GamePhase] = None,
+        updated_before: Optional[datetime] = None,
+    ) -> int:
+        where, params = self._summary_filter(status, phase, updated_before)
+        cursor = self._conn.cursor()
+        cursor.execute(f"SELECT COUNT(*) FROM rooms {where}", params)
+        return cursor.fetchone()[0]
+
+    @staticmethod
+    def _summary_filter(
+        status: Optional[RoomStatus],
+        phase: Optional[GamePhase],
+        updated_before: Optional[datetime],
+    ) -> tuple[str, tuple[Any, ...]]:
+        # Rows the backfill could not decode have no status and are never matched.
+        clauses, params = ["status IS NOT NULL"], []
+        if status is not None:
+            clauses.append("status = ?")
+            params.append(status.value)
+        if phase is not None:
+            clauses.append("phase = ?")
+            params.append(phase.value)
+        if updated_before is not None:
+            clauses.append("updated_at < ?")
+            params.append(updated_before.isoformat())
+        return "WHERE " + " AND ".join(clauses), tuple(params)
+
+    def _summary_values(self, room: GameRoom) -> tuple[Any, ...]:
+        return (
+            room.status.value,
+            len(room.players),
+            room.game_state.current_phase.value if room.game_state else None,
+            room.created_at.isoformat(),
+            self._clock().isoformat(),
+        )
+
+    @staticmethod
+    def _decode(room_data: bytes, version: int) -> GameRoom:
+        # The column is authoritative; legacy pickled rooms carry no version.
+        room = RoomCodec.decode(room_data)
+        room.version = version
+        return room
@@ -0,0 +1,61 @@
+"""Unit of work over a single SQLite connection."""
+
+import sqlite3
+from types import TracebackType
+from typing import Callable, Optional
+
+from src.ports.unit_of_work_port import UnitOfWorkPort
+
+
+class SqliteUnitOfWork(UnitOfWorkPort):
+    """
+    Defers the commits of repositories sharing `conn` while a unit is open.
+
+    Repositories call `commit()` where they used to commit the connection;
+    outside a unit that commits straight away, inside one it is a no-op and
+    the outermost exit commits (or rolls back) everything at once. They roll
+    back through `rollback()` too, so state kept outside the database about
+    uncommitted writes can be dropped with them (see `on_rollback`).
+    """
+
+    def __init__(self, conn: sqlite3.Connection) -> None:
+        self._conn = conn
+        self._depth = 0
+        self._rollback_callbacks: list[Callable[[], None]] = []
+
+    @property
+    def active(self) -> bool:
+        return self._depth > 0
+
+    def __enter__(self) -> "SqliteUnitOfWork":
+        self._depth += 1
+        return self
+
+    def __exit__(
+        self,
+        exc_type: Optional[type[BaseException]],
+        exc: Optional[BaseException],
+        traceback: Optional[TracebackType],
+    ) -> None:
+        self._depth -= 1
+        if exc_type is not None:
+            self.rollback()
+        elif self._depth == 0:
+            self._conn.commit()
+            self._rollback_callbacks.clear()
+
+    def commit(self) -> None:
+        if self._depth == 0:
+            self._conn.commit()
+            self._rollback_callbacks.clear()
+
+    def rollback(self) -> None:
+        """Roll back the open transaction, whatever the depth."""
+        self._conn.rollback()
+        callbacks, self._rollback_callbacks = self._rollback_callbacks, []
+        for callback in callbacks:
+            callback()
+
+    def on_rollback(self, callback: Callable[[], None]) -> None:
+        """Call `callback` if the open transaction is rolled back instead of committed."""
+        self._rollback_callbacks.append(callback)
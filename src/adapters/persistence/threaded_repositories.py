@@ -0,0 +1,74 @@
+"""Async repository adapters that run synchronous repositories on a thread pool."""
+
+import asyncio
+from concurrent.futures import Executor
+from typing import Callable, Optional, TypeVar
+from uuid import UUID
+
+from src.domain.entities.game_room import GameRoom
+from src.ports.code_repository_port import AsyncCodeRepositoryPort, CodeRepositoryPort
+from src.ports.room_repository_port import AsyncRoomRepositoryPort, RoomRepositoryPort
+
+T = TypeVar("T")
+R = TypeVar("R")
+
+
+class _Threaded:
+    """
+    Runs each call on `executor` against a repository built by `factory`.
+
+    The factory is called on the worker thread, so repositories backed by
+    per-thread SQLite connections get the connection of the thread that uses
+    it. Bounding the executor bounds how much blocking I/O runs at once
+    without ever blocking the event loop.
+    """
+
+    def __init__(self, factory: Callable[[], T], executor: Executor) -> None:
+        self._factory = factory
+        self._executor = executor
+
+    async def _run(self, call: Callable[[T], R]) -> R:
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(
+            self._executor, lambda: call(self._factory())
+        )
+
+
+class ThreadedRoomRepository(_Threaded, AsyncRoomRepositoryPort):
+    def __init__(
+        self, factory: Callable[[], RoomRepositoryPort], executor: Executor
+    ) -> None:
+        super().__init__(factory, executor)
+
+    async def save(self, room: GameRoom) -> None:
+        await self._run(lambda repository: repository.save(room))
+
+    async def find_by_id(self, room_id: UUID) -> Optional[GameRoom]:
+        return await self._run(lambda repository: repository.find_by_id(room_id))
+
+    async def delete(self, room_id: UUID) -> None:
+        await self._run(lambda repository: repository.delete(room_id))
+
+    async def list_all(self) -> list[GameRoom]:
+        return await self._run(lambda repository: repository.list_all())
+
+    async def exists(self, room_id: UUID) -> bool:
+        return await self._run(lambda repository: repository.exists(room_id))
+
+
+class ThreadedCodeRepository(_Threaded, AsyncCodeRepositoryPort):
+    def __init__(
+        self, factory: Callable[[], CodeRepositoryPort], executor: Executor
+    ) -> None:
+        super().__init__(factory, executor)
+
+    async def generate_code_for_room(self, room_id: UUID) -> str:
+        return await self._run(
+            lambda repository: repository.generate_code_for_room(room_id)
+        )
+
+    async def find_room_by_code(self, code: str) -> Optional[UUID]:
+        return await self._run(lambda repository: repository.find_room_by_code(code))
+
+    async def get_code_for_room(self, room_id: UUID) -> Optional[str]:
+        return await self._run(lambda repository: repository.get_code_for_room(room_id))
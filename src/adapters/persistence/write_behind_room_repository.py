@@ -0,0 +1,244 @@
+"""Room repository that serves rooms from memory and flushes them to SQLite in batches."""
+
+import logging
+import threading
+import time
+from typing import Callable, Optional
+from uuid import UUID
+
+from src.adapters.persistence.room_codec import RoomCodec
+from src.adapters.persistence.sqlite_room_repository import SqliteRoomRepository
+from src.domain.entities.game_room import GameRoom
+from src.ports.room_repository_port import (
+    ConcurrentModificationError,
+    RoomRepositoryPort,
+)
+
+logger = logging.getLogger(__name__)
+
+
+class WriteBehindRoomRepository(RoomRepositoryPort):
+    """
+    Keeps the authoritative copy of active rooms in memory.
+
+    Saves and deletes only touch memory and mark the room dirty. A background
+    thread writes every dirty room to SQLite in a single transaction once per
+    `flush_interval` seconds (or sooner when `max_dirty` rooms are waiting),
+    so a crash loses at most one durability window of changes and never
+    leaves a partially written batch. Rooms are held as encoded snapshots so
+    callers always get their own copy and a flush always writes the state as
+    of the latest save. Versions are checked in memory, so a stale room is
+    rejected with ConcurrentModificationError without touching SQLite.
+
+    After each flush, deleted rooms are forgotten and the least recently used
+    clean rooms are evicted until at most `max_rooms` stay in memory; evicted
+    rooms are read back from SQLite when next needed.
+
+    One instance must be shared by the whole process; `backing_factory` is
+    called on whichever thread needs SQLite access.
+    """
+
+    def __init__(
+        self,
+        backing_factory: Callable[[], SqliteRoomRepository],
+        flush_interval: float = 0.25,
+        max_dirty: int = 500,
+        max_rooms: int = 1000,
+    ) -> None:
+        self._backing_factory = backing_factory
+        self._flush_interval = flush_interval
+        self._max_dirty = max_dirty
+        self._max_rooms = max_rooms
+        self._lock = threading.Lock()
+        self._flush_lock = threading.Lock()
+        self._rooms: dict[UUID, Optional[bytes]] = {}
+        self._dirty: dict[UUID, Optional[bytes]] = {}
+        # Rooms in the batch being written; not dirty, but not in SQLite yet
+        self._flushing: set[UUID] = set()
+        self._versions: dict[UUID, int] = {}
+        self._wake = threading.Event()
+        self._stopping = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+        self._flushes = 0
+        self._failed_flushes = 0
+        self._rooms_flushed = 0
+        self._last_batch_size = 0
+        self._max_batch_size = 0
+        self._total_flush_seconds = 0.0
+        self._max_flush_seconds = 0.0
+        self._evictions = 0
+
+    def start(self) -> None:
+        if self._thread is not None:
+            return
+        self._stopping.clear()
+        self._thread = threading.Thread(
+            target=self._run, name="room-write-behind", daemon=True
+        )
+        self._thread.start()
+
+    def close(self) -> None:
+        """Stop the flusher and write everything still dirty."""
+        if self._thread is not None:
+            self._stopping.set()
+            self._wake.set()
+            self._thread.join()
+            self._thread = None
+        self.flush()
+
+    def _run(self) -> None:
+        while not self._stopping.is_set():
+            self._wake.wait(self._flush_interval)
+            self._wake.clear()
+            try:
+                self.flush()
+            except Exception:
+                logger.exception("Write-behind flush failed")
+
+    def flush(self) -> int:
+        with self._flush_lock:
+            with self._lock:
+                batch, self._dirty = self._dirty, {}
+                self._flushing = set(batch)
+            if not batch:
+                return 0
+
+            started = time.perf_counter()
+            try:
+                self._backing_factory().write_batch(
+                    [RoomCodec.decode(data) for data in batch.values() if data is not None],
+                    [room_id for room_id, data in batch.items() if data is None],
+                )
+            except Exception:
+                with self._lock:
+                    # Newer saves made while flushing win over the failed batch.
+                    self._dirty = {**batch, **self._dirty}
+                    self._flushing = set()
+                    self._failed_flushes += 1
+                raise
+
+            elapsed = time.perf_counter() - started
+            with self._lock:
+                self._flushing = set()
+                self._flushes += 1
+                self._rooms_flushed += len(batch)
+                self._last_batch_size = len(batch)
+                self._max_batch_size = max(self._max_batch_size, len(batch))
+                self._total_flush_seconds += elapsed
+                self._max_flush_seconds = max(self._max_flush_seconds, elapsed)
+                self._forget_deleted_locked(batch)
+                self._evict_locked(self._max_rooms)
+            return len(batch)
+
+    def _forget_deleted_locked(self, batch: dict[UUID, Optional[bytes]]) -> None:
+        # SQLite no longer has these rooms, so the tombstones are not needed
+        for room_id, data in batch.items():
+            if data is None and room_id not in self._dirty and room_id in self._rooms:
+                if self._rooms[room_id] is None:
+                    del self._rooms[room_id]
+
+    def _evict_locked(self, max_rooms: int) -> int:
+        """Drop the least recently used clean rooms until at most `max_rooms` remain."""
+        if len(self._rooms) <= max_rooms:
+            return 0
+        evicted = 0
+        for room_id in list(self._rooms):
+            if len(self._rooms) <= max_rooms:
+                break
+            if room_id in self._dirty or room_id in self._flushing:
+                continue
+            del self._rooms[room_id]
+            self._versions.pop(room_id, None)
+            evicted += 1
+        self._evictions += evicted
+        return evicted
+
+    def _mark_locked(self, room_id: UUID, data: Optional[bytes]) -> None:
+        # Rooms are kept in least recently used order
+        self._rooms.pop(room_id, None)
+        self._rooms[room_id] = data
+        self._dirty.pop(room_id, None)
+        self._dirty[room_id] = data
+        if len(self._dirty) >= self._max_dirty:
+            self._wake.set()
+
+    def save(self, room: GameRoom) -> None:
+        with self._lock:
+            known = room.room_id in self._rooms
+        if not known:
+            # Loads the stored version of rooms that are not hot yet.
+            self.find_by_id(room.room_id)
+
+        expected_version = room.version
+        with self._lock:
+            if self._versions.get(room.room_id, 0) != expected_version:
+                raise ConcurrentModificationError(
+                    f"Room {room.room_id} changed since version {expected_version}"
+                )
+            room.version = expected_version + 1
+            self._versions[room.room_id] = room.version
+            self._mark_locked(room.room_id, RoomCodec.encode(room))
+
+    def find_by_id(self, room_id: UUID) -> Optional[GameRoom]:
+        with self._lock:
+            cached = room_id in self._rooms
+            if cached:
+                data = self._rooms[room_id] = self._rooms.pop(room_id)
+        if cached:
+            return None if data is None else RoomCodec.decode(data)
+
+        room = self._backing_factory().find_by_id(room_id)
+        if room is not None:
+            with self._lock:
+                if room_id not in self._rooms:
+                    self._rooms[room_id] = RoomCodec.encode(room)
+                    self._versions[room_id] = room.version
+                    self._evict_locked(self._max_rooms)
+        return room
+
+    def delete(self, room_id: UUID) -> None:
+        with self._lock:
+            self._versions.pop(room_id, None)
+            self._mark_locked(room_id, None)
+
+    def list_all(self) -> list[GameRoom]:
+        with self._lock:
+            hot = dict(self._rooms)
+
+        rooms = [RoomCodec.decode(data) for data in hot.values() if data is not None]
+        rooms.extend(
+            room
+            for room in self._backing_factory().list_all()
+            if room.room_id not in hot
+        )
+        return rooms
+
+    def exists(self, room_id: UUID) -> bool:
+        with self._lock:
+            if room_id in self._rooms:
+                return self._rooms[room_id] is not None
+        return self._backing_factory().exists(room_id)
+
+    def evict_clean(self) -> int:
+        """Drop every room from memory that has already been flushed."""
+        with self._lock:
+            return self._evict_locked(0)
+
+    def stats(self) -> dict[str, float]:
+        with self._lock:
+            return {
+                "hot_rooms": len(self._rooms),
+                "dirty_rooms": len(self._dirty),
+                "flushes": self._flushes,
+                "failed_flushes": self._failed_flushes,
+                "rooms_flushed": self._rooms_flushed,
+                "last_batch_size": self._last_batch_size,
+                "max_batch_size": self._max_batch_size,
+                "avg_flush_ms": (
+                    self._total_flush_seconds / self._flushes * 1000
+                    if self._flushes
+                    else 0.0
+                ),
+                "max_flush_ms": self._max_flush_seconds * 1000,
+                "evictions": self._evictions,
+            }
@@ -1,6 +1,11 @@
 """Generic command bus for dispatching commands to their handlers."""
 
-from typing import Any
+import asyncio
+import random
+import time
+from concurrent.futures import Executor
+from contextlib import nullcontext
+from typing import Any, Callable, Optional
 
 from src.application.commands.cast_vote import CastVoteCommand, CastVoteHandler
 from src.application.commands.create_room import CreateRoomCommand, CreateRoomHandler
@@ -24,12 +29,36 @@ from src.application.commands.use_executive_action import (
     UseExecutiveActionHandler,
 )
 from src.application.commands.veto_agenda import VetoAgendaCommand, VetoAgendaHandler
-from src.ports.room_repository_port import RoomRepositoryPort
+from src.ports.room_repository_port import (
+    ConcurrentModificationError,
+    RoomRepositoryPort,
+)
+from src.ports.unit_of_work_port import UnitOfWorkPort
 
 
 class CommandBus:
-    def __init__(self, repository: RoomRepositoryPort) -> None:
+    """
+    Dispatches commands to their handlers.
+
+    Handlers load, mutate and save a room, so a command that loses a race to
+    another writer is simply run again against the fresh room. Retries back off
+    exponentially with jitter and give up after `max_retries`. With a
+    `unit_of_work`, each attempt commits once however many writes it makes.
+    """
+
+    def __init__(
+        self,
+        repository: RoomRepositoryPort,
+        max_retries: int = 3,
+        retry_delay: float = 0.01,
+        sleep: Callable[[float], None] = time.sleep,
+        unit_of_work: Optional[UnitOfWorkPort] = None,
+    ) -> None:
         self.repository = repository
+        self.unit_of_work = unit_of_work
+        self._max_retries = max_retries
+        self._retry_delay = retry_delay
+        self._sleep = sleep
         self._handlers = {
             CreateRoomCommand: CreateRoomHandler,
             JoinRoomCommand: JoinRoomHandler,
@@ -51,4 +80,20 @@ class CommandBus:
             raise ValueError(f"No handler registered for command type: {command_type}")
 
         handler = handler_class(self.repository)
-        return handler.handle(command)
+        attempt = 0
+        while True:
+            try:
+                with self.unit_of_work or nullcontext():
+                    return handler.handle(command)
+            except ConcurrentModificationError:
+                if attempt >= self._max_retries:
+                    raise
+                self._sleep(self._retry_delay * 2**attempt * random.uniform(0.5, 1.5))
+                attempt += 1
+
+    async def execute_async(
+        self, command: Any, executor: Optional[Executor] = None
+    ) -> Any:
+        """Run `execute` on `executor` (the loop's default if None) off the event loop."""
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(executor, self.execute, command)
@@ -37,13 +37,14 @@ class GetRoomStateHandler:
         self._repository = repository
 
     def handle(self, query: GetRoomStateQuery) -> RoomStateDTO:
-        room = self._repository.find_by_id(query.room_id)
+        room = self._repository.find_lobby_by_id(query.room_id)
         if room is None:
             raise ValueError(f"Room {query.room_id} not found")
 
-        return self._to_dto(room)
+        return self.to_dto(room)
 
-    def _to_dto(self, room: GameRoom) -> RoomStateDTO:
+    @staticmethod
+    def to_dto(room: GameRoom) -> RoomStateDTO:
         player_dtos = [
             PlayerDTO(
                 player_id=player.player_id,
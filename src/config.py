@@ -9,4 +9,28 @@ load_dotenv(dotenv_path=env_path)
 FRONTEND_DIR = Path(__file__).parent.parent / "frontend"
 API_ROOT_URL = os.getenv("API_ROOT_URL")
 SQLITE_FILE = os.getenv("SQLITE_FILE")
+SQLITE_DURABILITY = os.getenv("SQLITE_DURABILITY", "safe")
+ROOM_STORAGE = os.getenv("ROOM_STORAGE", "sqlite")
+ROOM_SHARD_COUNT = int(os.getenv("ROOM_SHARD_COUNT", "0"))
+SNAPSHOT_INTERVAL = int(os.getenv("SNAPSHOT_INTERVAL", "50"))
+WRITE_BEHIND_FLUSH_INTERVAL = float(os.getenv("WRITE_BEHIND_FLUSH_INTERVAL", "0.25"))
+WRITE_BEHIND_MAX_ROOMS = int(os.getenv("WRITE_BEHIND_MAX_ROOMS", "1000"))
+ROOM_JOURNAL_FILE = os.getenv("ROOM_JOURNAL_FILE", "rooms.journal")
+ROOM_JOURNAL_FLUSH_INTERVAL = float(os.getenv("ROOM_JOURNAL_FLUSH_INTERVAL", "0.05"))
+ROOM_CACHE_SIZE = int(os.getenv("ROOM_CACHE_SIZE", "1000"))
+ROOM_CACHE_TTL = float(os.getenv("ROOM_CACHE_TTL", "60")) or None
+CODE_CACHE_TTL = float(os.getenv("CODE_CACHE_TTL", "3600"))
+CODE_CACHE_NEGATIVE_TTL = float(os.getenv("CODE_CACHE_NEGATIVE_TTL", "5"))
+COMMAND_WORKERS = int(os.getenv("COMMAND_WORKERS", "8"))
+ROOM_SWEEP_INTERVAL = float(os.getenv("ROOM_SWEEP_INTERVAL", "300"))
+ROOM_SWEEP_BATCH_SIZE = int(os.getenv("ROOM_SWEEP_BATCH_SIZE", "100"))
+ROOM_ARCHIVE_AFTER = float(os.getenv("ROOM_ARCHIVE_AFTER", "3600"))
+ROOM_ARCHIVE_BLOCK_SIZE = int(os.getenv("ROOM_ARCHIVE_BLOCK_SIZE", "64"))
+COMPLETED_ROOM_TTL = float(os.getenv("COMPLETED_ROOM_TTL", "86400"))
+WAITING_ROOM_TTL = float(os.getenv("WAITING_ROOM_TTL", "7200"))
+CODE_REUSE_AFTER = float(os.getenv("CODE_REUSE_AFTER", "86400"))
+CODE_COUNTER_BLOCK_SIZE = int(os.getenv("CODE_COUNTER_BLOCK_SIZE", "1000"))
+PERSISTENCE_WORKERS = int(os.getenv("PERSISTENCE_WORKERS", "4"))
+WS_SEND_QUEUE_SIZE = int(os.getenv("WS_SEND_QUEUE_SIZE", "64"))
+WS_SEND_TIMEOUT = float(os.getenv("WS_SEND_TIMEOUT", "5"))
 IS_PRODUCTION = os.getenv('ENVIRONMENT', 'development') == 'production'
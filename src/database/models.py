@@ -1,22 +1,115 @@
 from datetime import datetime
-from sqlalchemy import Column, String, DateTime, Boolean
+from sqlalchemy import (
+    Boolean,
+    Column,
+    DateTime,
+    ForeignKey,
+    Integer,
+    String,
+    Text,
+)
+from sqlalchemy.orm import relationship
 import uuid
 
 from src.database.connection import Base
 
 
 class Room(Base):
-    """Example model showing how to define database tables."""
+    """
+    One row per game room, holding only what lobby views need.
 
-    __tablename__ = "rooms"
+    Players, role assignments and the game state live in their own tables so
+    a lobby read never loads the deck, votes or roles. The table is not named
+    "rooms": create_all never alters an existing table, so databases with the
+    older rooms table, or the sqlite repository's, would keep their schema.
+    """
+
+    __tablename__ = "game_rooms"
 
     # SQLite stores UUIDs as strings
     room_id = Column(String(36), primary_key=True, default=lambda: str(uuid.uuid4()), nullable=False)
-    room_code = Column(String(4), unique=True, nullable=False, index=True)
-    status = Column(String(20), nullable=False, default="WAITING")
-    creator_id = Column(String(36), nullable=False)
+    # Codes are owned by the code repository; rooms saved before they get one have none
+    room_code = Column(String(4), unique=True, nullable=True, index=True)
+    status = Column(String(20), nullable=False, default="WAITING", index=True)
+    creator_id = Column(String(36), nullable=True)
     created_at = Column(DateTime, default=datetime.utcnow, nullable=False)
+    updated_at = Column(DateTime, default=datetime.utcnow, nullable=False, index=True)
     is_active = Column(Boolean, default=True, nullable=False)
+    version = Column(Integer, default=0, nullable=False)
+
+    players = relationship(
+        "RoomPlayer",
+        order_by="RoomPlayer.seat",
+        cascade="all, delete-orphan",
+        passive_deletes=True,
+        lazy="raise",
+    )
+    role_assignments = relationship(
+        "RoleAssignment",
+        cascade="all, delete-orphan",
+        passive_deletes=True,
+        lazy="raise",
+    )
+    game_state = relationship(
+        "GameStateRecord",
+        uselist=False,
+        cascade="all, delete-orphan",
+        passive_deletes=True,
+        lazy="raise",
+    )
 
     def __repr__(self):
         return f"<Room(room_code={self.room_code}, status={self.status})>"
+
+
+class RoomPlayer(Base):
+    __tablename__ = "room_players"
+
+    room_id = Column(String(36), ForeignKey("game_rooms.room_id", ondelete="CASCADE"), primary_key=True)
+    player_id = Column(String(36), primary_key=True)
+    seat = Column(Integer, nullable=False)
+    name = Column(String(100), nullable=False)
+    is_connected = Column(Boolean, default=True, nullable=False)
+    is_alive = Column(Boolean, default=True, nullable=False)
+
+
+class RoleAssignment(Base):
+    __tablename__ = "role_assignments"
+
+    room_id = Column(String(36), ForeignKey("game_rooms.room_id", ondelete="CASCADE"), primary_key=True)
+    player_id = Column(String(36), primary_key=True)
+    # "L" liberal, "F" fascist, "H" Hitler
+    role = Column(String(1), nullable=False)
+
+
+class GameStateRecord(Base):
+    """
+    The game state of a started room.
+
+    Policy piles are strings of "L" and "F" letters; votes and investigated
+    players are JSON, since they are always read and written whole.
+    """
+
+    __tablename__ = "game_states"
+
+    room_id = Column(String(36), ForeignKey("game_rooms.room_id", ondelete="CASCADE"), primary_key=True)
+    round_number = Column(Integer, nullable=False)
+    current_phase = Column(String(30), nullable=False)
+    president_id = Column(String(36))
+    chancellor_id = Column(String(36))
+    nominated_chancellor_id = Column(String(36))
+    previous_president_id = Column(String(36))
+    previous_chancellor_id = Column(String(36))
+    next_regular_president_id = Column(String(36))
+    veto_requested = Column(Boolean, nullable=False)
+    veto_rejected = Column(Boolean, nullable=False)
+    liberal_policies = Column(Integer, nullable=False)
+    fascist_policies = Column(Integer, nullable=False)
+    election_tracker = Column(Integer, nullable=False)
+    game_over_reason = Column(Text)
+    draw_pile = Column(String(17), nullable=False)
+    discard_pile = Column(String(17), nullable=False)
+    president_policies = Column(String(3), nullable=False)
+    chancellor_policies = Column(String(3), nullable=False)
+    votes = Column(Text, nullable=False)
+    investigated_players = Column(Text, nullable=False)
@@ -0,0 +1,63 @@
+"""Records which fields of an entity changed since it was loaded or saved."""
+
+from typing import Any, Optional
+
+_CHANGED = "_changed_fields"
+_SNAPSHOT = "_container_snapshot"
+_CONTAINER_TYPES = (list, dict, set)
+
+
+class ChangeTracking:
+    """
+    Mixin for dataclass entities that reports which fields changed since
+    `clear_changes` was last called.
+
+    Assignments are recorded as they happen. Lists, dicts and sets can also be
+    changed in place, so `clear_changes` keeps a shallow copy of each and
+    `changed_fields` compares against it. Until `clear_changes` is first
+    called, and on copies or unpickled entities, the changes are unknown and
+    `changed_fields` returns None, meaning everything should be treated as
+    changed. Entities are only tracked once cleared, so building one costs
+    nothing extra.
+    """
+
+    def __setattr__(self, name: str, value: Any) -> None:
+        object.__setattr__(self, name, value)
+        changed = self.__dict__.get(_CHANGED)
+        if changed is not None and name[0] != "_":
+            changed.add(name)
+
+    @classmethod
+    def restore(cls, **fields: Any) -> "ChangeTracking":
+        """
+        Rebuild an entity from stored values of all its fields without running
+        __init__ or __setattr__, the way unpickling does.
+        """
+        entity = cls.__new__(cls)
+        entity.__dict__.update(fields)
+        return entity
+
+    def __getstate__(self) -> dict:
+        state = dict(self.__dict__)
+        state.pop(_CHANGED, None)
+        state.pop(_SNAPSHOT, None)
+        return state
+
+    def changed_fields(self) -> Optional[set[str]]:
+        changed = self.__dict__.get(_CHANGED)
+        if changed is None:
+            return None
+        changed = set(changed)
+        for name, snapshot in self.__dict__[_SNAPSHOT].items():
+            if name not in changed and self.__dict__[name] != snapshot:
+                changed.add(name)
+        return changed
+
+    def clear_changes(self) -> None:
+        snapshot = {
+            name: value.copy()
+            for name, value in self.__dict__.items()
+            if name[0] != "_" and isinstance(value, _CONTAINER_TYPES)
+        }
+        object.__setattr__(self, _SNAPSHOT, snapshot)
+        object.__setattr__(self, _CHANGED, set())
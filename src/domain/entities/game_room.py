@@ -6,6 +6,7 @@ from enum import Enum
 from typing import Optional
 from uuid import UUID, uuid4
 
+from src.domain.entities.change_tracking import ChangeTracking
 from src.domain.entities.game_state import GameState
 from src.domain.entities.player import Player
 
@@ -17,13 +18,14 @@ class RoomStatus(Enum):
 
 
 @dataclass
-class GameRoom:
+class GameRoom(ChangeTracking):
     room_id: UUID = field(default_factory=uuid4)
     creator_id: Optional[UUID] = None
     status: RoomStatus = RoomStatus.WAITING
     players: list[Player] = field(default_factory=list)
     game_state: Optional[GameState] = None
     created_at: datetime = field(default_factory=datetime.utcnow)
+    version: int = 0
 
     def add_player(self, player: Player) -> None:
         if self.status != RoomStatus.WAITING:
@@ -59,6 +61,13 @@ class GameRoom:
         player_map = {p.player_id: p for p in self.players}
         self.players = [player_map[pid] for pid in player_ids]
 
+    def clear_changes(self) -> None:
+        super().clear_changes()
+        for player in self.players:
+            player.clear_changes()
+        if self.game_state is not None:
+            self.game_state.clear_changes()
+
     def get_player(self, player_id: UUID) -> Optional[Player]:
         return next((p for p in self.players if p.player_id == player_id), None)
 
@@ -5,6 +5,7 @@ from enum import Enum
 from typing import Optional
 from uuid import UUID
 
+from src.domain.entities.change_tracking import ChangeTracking
 from src.domain.entities.policy_deck import PolicyDeck
 from src.domain.value_objects.role import Role
 
@@ -25,7 +26,7 @@ class PresidentialPower(Enum):
 
 
 @dataclass
-class GameState:
+class GameState(ChangeTracking):
     round_number: int = 1
     president_id: Optional[UUID] = None
     chancellor_id: Optional[UUID] = None
@@ -47,6 +48,10 @@ class GameState:
     investigated_players: set[UUID] = field(default_factory=set)
     game_over_reason: Optional[str] = None
 
+    def clear_changes(self) -> None:
+        super().clear_changes()
+        self.policy_deck.clear_changes()
+
     def enact_liberal_policy(self) -> None:
         self.liberal_policies += 1
         self.election_tracker = 0
@@ -3,9 +3,11 @@
 from dataclasses import dataclass, field
 from uuid import UUID, uuid4
 
+from src.domain.entities.change_tracking import ChangeTracking
+
 
 @dataclass
-class Player:
+class Player(ChangeTracking):
     player_id: UUID = field(default_factory=uuid4)
     name: str = ""
     is_connected: bool = True
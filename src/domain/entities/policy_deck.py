@@ -3,11 +3,12 @@
 import random
 from dataclasses import dataclass, field
 
+from src.domain.entities.change_tracking import ChangeTracking
 from src.domain.value_objects.policy import Policy, PolicyType
 
 
 @dataclass
-class PolicyDeck:
+class PolicyDeck(ChangeTracking):
     draw_pile: list[Policy] = field(default_factory=list)
     discard_pile: list[Policy] = field(default_factory=list)
 
@@ -1,5 +1,5 @@
 from abc import ABC, abstractmethod
-from typing import Optional
+from typing import Iterator, Optional
 from uuid import UUID
 
 
@@ -15,3 +15,29 @@ class CodeRepositoryPort(ABC):
     @abstractmethod
     def get_code_for_room(self, room_id: UUID) -> Optional[str]:
         pass
+
+    @abstractmethod
+    def iter_mappings(self, after: Optional[str] = None) -> Iterator[tuple[str, UUID]]:
+        """Yield every (code, room_id) mapping in code order, starting after the code `after`."""
+        pass
+
+    @abstractmethod
+    def import_mappings(self, mappings: list[tuple[str, UUID]]) -> None:
+        """Store mappings copied from another backend, keeping their codes."""
+        pass
+
+
+class AsyncCodeRepositoryPort(ABC):
+    """Room code persistence for callers running on an event loop."""
+
+    @abstractmethod
+    async def generate_code_for_room(self, room_id: UUID) -> str:
+        pass
+
+    @abstractmethod
+    async def find_room_by_code(self, code: str) -> Optional[UUID]:
+        pass
+
+    @abstractmethod
+    async def get_code_for_room(self, room_id: UUID) -> Optional[str]:
+        pass
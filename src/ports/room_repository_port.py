@@ -1,12 +1,16 @@
 """Repository port (interface) for game room persistence."""
 
 from abc import ABC, abstractmethod
-from typing import Optional
+from typing import Iterator, Optional
 from uuid import UUID
 
 from src.domain.entities.game_room import GameRoom
 
 
+class ConcurrentModificationError(Exception):
+    """Raised when a room is saved from a version that is no longer current."""
+
+
 class RoomRepositoryPort(ABC):
     @abstractmethod
     def save(self, room: GameRoom) -> None:
@@ -27,3 +31,47 @@ class RoomRepositoryPort(ABC):
     @abstractmethod
     def exists(self, room_id: UUID) -> bool:
         pass
+
+    def iter_all(self, after: Optional[UUID] = None) -> Iterator[GameRoom]:
+        """
+        Yield every room in room id order, starting after the room id `after`.
+
+        Adapters override this to avoid loading all rooms at once.
+        """
+        rooms = sorted(self.list_all(), key=lambda room: str(room.room_id))
+        for room in rooms:
+            if after is None or str(room.room_id) > str(after):
+                yield room
+
+    def find_lobby_by_id(self, room_id: UUID) -> Optional[GameRoom]:
+        """
+        Find a room for lobby views, which only read its fields and players.
+
+        Adapters that can skip loading the game state return the room with
+        `game_state` set to None; by default the whole room is loaded.
+        """
+        return self.find_by_id(room_id)
+
+
+class AsyncRoomRepositoryPort(ABC):
+    """Room persistence for callers running on an event loop."""
+
+    @abstractmethod
+    async def save(self, room: GameRoom) -> None:
+        pass
+
+    @abstractmethod
+    async def find_by_id(self, room_id: UUID) -> Optional[GameRoom]:
+        pass
+
+    @abstractmethod
+    async def delete(self, room_id: UUID) -> None:
+        pass
+
+    @abstractmethod
+    async def list_all(self) -> list[GameRoom]:
+        pass
+
+    @abstractmethod
+    async def exists(self, room_id: UUID) -> bool:
+        pass
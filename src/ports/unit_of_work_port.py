@@ -0,0 +1,32 @@
+"""Unit of work port (interface) for grouping writes into one transaction."""
+
+from abc import ABC, abstractmethod
+from types import TracebackType
+from typing import Optional
+
+
+class UnitOfWorkPort(ABC):
+    """
+    Groups the writes of every repository that joined it into one commit.
+
+    Units nest: only the outermost `with` block commits, and an exception
+    leaving any block rolls back everything written so far.
+    """
+
+    @abstractmethod
+    def __enter__(self) -> "UnitOfWorkPort":
+        pass
+
+    @abstractmethod
+    def __exit__(
+        self,
+        exc_type: Optional[type[BaseException]],
+        exc: Optional[BaseException],
+        traceback: Optional[TracebackType],
+    ) -> None:
+        pass
+
+    @abstractmethod
+    def commit(self) -> None:
+        """Commit now unless a unit is open, in which case its exit commits."""
+        pass
@@ -0,0 +1,84 @@
+#!/usr/bin/env python3
+"""Measure commands per second on the rooms table under each SQLite durability profile."""
+
+import argparse
+import sys
+import tempfile
+import threading
+import time
+from pathlib import Path
+
+project_root = Path(__file__).parent.parent.parent
+sys.path.insert(0, str(project_root))
+
+from src.adapters.persistence.sqlite_connection_pool import (
+    DURABILITY_PROFILES,
+    SqliteConnectionPool,
+)
+from src.adapters.persistence.sqlite_room_repository import SqliteRoomRepository
+from src.application.command_bus import CommandBus
+from src.application.commands.create_room import CreateRoomCommand
+from src.application.commands.join_room import JoinRoomCommand
+from src.application.commands.start_game import StartGameCommand
+
+# Create a room, fill it to five players and start the game
+COMMANDS_PER_ROOM = 6
+
+
+def play_rooms(pool: SqliteConnectionPool, rooms: int) -> None:
+    bus = CommandBus(
+        SqliteRoomRepository(pool.connection(), unit_of_work=pool.unit_of_work()),
+        unit_of_work=pool.unit_of_work(),
+    )
+    for _ in range(rooms):
+        created = bus.execute(CreateRoomCommand("Host"))
+        for i in range(4):
+            bus.execute(JoinRoomCommand(created.room_id, f"Player{i}"))
+        bus.execute(StartGameCommand(created.room_id, created.player_id))
+
+
+def run(profile: str, directory: str, threads: int, rooms: int) -> float:
+    pool = SqliteConnectionPool(str(Path(directory) / f"{profile}.db"), durability=profile)
+    SqliteRoomRepository(pool.connection()).init_tables()
+
+    workers = [
+        threading.Thread(target=play_rooms, args=(pool, rooms)) for _ in range(threads)
+    ]
+    started = time.perf_counter()
+    for worker in workers:
+        worker.start()
+    for worker in workers:
+        worker.join()
+    elapsed = time.perf_counter() - started
+    pool.close_all()
+    return elapsed
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--threads", type=int, default=4, help="Concurrent command threads")
+    parser.add_argument("--rooms", type=int, default=50, help="Rooms played per thread")
+    parser.add_argument(
+        "--profiles",
+        nargs="+",
+        default=list(DURABILITY_PROFILES),
+        choices=list(DURABILITY_PROFILES),
+    )
+    parser.add_argument(
+        "--directory", help="Where to put the databases; defaults to a temp dir"
+    )
+    args = parser.parse_args()
+
+    commands = args.threads * args.rooms * COMMANDS_PER_ROOM
+    print(f"{args.threads} threads x {args.rooms} rooms x {COMMANDS_PER_ROOM} commands:")
+    with tempfile.TemporaryDirectory(dir=args.directory) as tmpdir:
+        for profile in args.profiles:
+            elapsed = run(profile, tmpdir, args.threads, args.rooms)
+            print(
+                f"  {profile:<9} {commands / elapsed:9.0f} commands/s"
+                f"  total {elapsed:6.2f} s"
+            )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,93 @@
+#!/usr/bin/env python3
+"""Measure event-loop lag while coroutines save rooms to SQLite, blocking vs threaded."""
+
+import argparse
+import asyncio
+import statistics
+import sys
+import tempfile
+import time
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+from uuid import uuid4
+
+project_root = Path(__file__).parent.parent.parent
+sys.path.insert(0, str(project_root))
+
+from src.adapters.persistence.sqlite_connection_pool import SqliteConnectionPool
+from src.adapters.persistence.sqlite_room_repository import SqliteRoomRepository
+from src.adapters.persistence.threaded_repositories import ThreadedRoomRepository
+from src.domain.entities.game_room import GameRoom
+from src.domain.entities.player import Player
+
+TICK_SECONDS = 0.005
+
+
+async def monitor_lag(lags: list[float], stop: asyncio.Event) -> None:
+    """Record how late each short sleep wakes up; lateness is time the loop was blocked."""
+    while not stop.is_set():
+        started = time.perf_counter()
+        await asyncio.sleep(TICK_SECONDS)
+        lags.append((time.perf_counter() - started - TICK_SECONDS) * 1000)
+
+
+def make_room() -> GameRoom:
+    room = GameRoom()
+    for i in range(10):
+        room.add_player(Player(uuid4(), f"Player{i}"))
+    return room
+
+
+async def run(mode: str, pool: SqliteConnectionPool, writers: int, saves: int) -> list[float]:
+    executor = ThreadPoolExecutor(max_workers=4)
+    threaded = ThreadedRoomRepository(
+        lambda: SqliteRoomRepository(pool.connection()), executor
+    )
+
+    async def writer() -> None:
+        room = make_room()
+        for _ in range(saves):
+            if mode == "blocking":
+                SqliteRoomRepository(pool.connection()).save(room)
+                await asyncio.sleep(0)
+            else:
+                await threaded.save(room)
+
+    lags: list[float] = []
+    stop = asyncio.Event()
+    monitor = asyncio.create_task(monitor_lag(lags, stop))
+    await asyncio.gather(*(writer() for _ in range(writers)))
+    stop.set()
+    await monitor
+    executor.shutdown()
+    return lags
+
+
+def report(mode: str, lags: list[float], elapsed: float) -> None:
+    lags = sorted(lags) or [0.0]
+    p99 = lags[min(len(lags) - 1, int(len(lags) * 0.99))]
+    print(
+        f"  {mode:<9} lag p50 {statistics.median(lags):7.2f} ms"
+        f"  p99 {p99:7.2f} ms  max {lags[-1]:7.2f} ms  total {elapsed:6.2f} s"
+    )
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--writers", type=int, default=50, help="Concurrent writing coroutines")
+    parser.add_argument("--saves", type=int, default=20, help="Saves per writer")
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmpdir:
+        pool = SqliteConnectionPool(str(Path(tmpdir) / "benchmark.db"))
+        SqliteRoomRepository(pool.connection()).init_tables()
+        print(f"{args.writers} writers x {args.saves} saves:")
+        for mode in ("blocking", "threaded"):
+            started = time.perf_counter()
+            lags = asyncio.run(run(mode, pool, args.writers, args.saves))
+            report(mode, lags, time.perf_counter() - started)
+        pool.close_all()
+
+
+if __name__ == "__main__":
+    main()
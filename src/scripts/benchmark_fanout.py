@@ -0,0 +1,105 @@
+#!/usr/bin/env python3
+"""Measure the cost of fanning one room event out to many websockets."""
+
+import argparse
+import asyncio
+import json
+import sys
+import time
+from pathlib import Path
+from uuid import uuid4
+
+project_root = Path(__file__).parent.parent.parent
+sys.path.insert(0, str(project_root))
+
+from src.adapters.api.rest.player_state import PlayerStateView
+from src.adapters.api.rest.room_manager import RoomManager
+from src.domain.entities.game_room import GameRoom
+from src.domain.entities.game_state import GamePhase, GameState
+from src.domain.entities.player import Player
+from src.domain.services.role_assignment_service import RoleAssignmentService
+
+
+class NullWebSocket:
+    """Accepts frames without sending them; send_json encodes like Starlette does."""
+
+    async def accept(self) -> None:
+        pass
+
+    async def close(self, code: int = 1000) -> None:
+        pass
+
+    async def send_text(self, data: str) -> None:
+        pass
+
+    async def send_json(self, data) -> None:
+        await self.send_text(json.dumps(data, separators=(",", ":"), ensure_ascii=False))
+
+
+def make_payload() -> dict:
+    # A started ten-player game, as every spectator would be sent it
+    room = GameRoom()
+    for i in range(10):
+        room.add_player(Player(uuid4(), f"Player{i}"))
+    player_ids = [player.player_id for player in room.players]
+    room.start_game(
+        GameState(
+            round_number=1,
+            president_id=player_ids[0],
+            current_phase=GamePhase.NOMINATION,
+            role_assignments=RoleAssignmentService.assign_roles(player_ids),
+        )
+    )
+    return {"type": "state", "version": 1, "state": PlayerStateView(room).for_player(None)}
+
+
+async def per_socket(sockets: list[NullWebSocket], payload: dict, events: int) -> float:
+    started = time.perf_counter()
+    for _ in range(events):
+        for websocket in sockets:
+            await websocket.send_json(payload)
+    return time.perf_counter() - started
+
+
+async def encoded_once(sockets: list[NullWebSocket], payload: dict, events: int) -> float:
+    room_manager = RoomManager(max_queue=events + 1)
+    room_id = uuid4()
+    for websocket in sockets:
+        await room_manager.connect(websocket, room_id)
+
+    started = time.perf_counter()
+    for _ in range(events):
+        await room_manager.broadcast(room_id, payload)
+    await room_manager.wait_sent()
+    elapsed = time.perf_counter() - started
+
+    for websocket in sockets:
+        room_manager.disconnect(websocket, room_id)
+    return elapsed
+
+
+async def run(socket_counts: list[int], events: int) -> None:
+    payload = make_payload()
+    print(f"{events} events, {len(json.dumps(payload))} byte payload:")
+    for count in socket_counts:
+        sockets = [NullWebSocket() for _ in range(count)]
+        before = await per_socket(sockets, payload, events)
+        after = await encoded_once(sockets, payload, events)
+        print(
+            f"  {count:>5} sockets  send_json per socket {before / events * 1e6:9.0f} us/event"
+            f"  encoded once {after / events * 1e6:9.0f} us/event"
+        )
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument(
+        "--sockets", type=int, nargs="+", default=[10, 100, 1000], help="Sockets per room"
+    )
+    parser.add_argument("--events", type=int, default=50, help="Events broadcast per run")
+    args = parser.parse_args()
+    asyncio.run(run(args.sockets, args.events))
+
+
+if __name__ == "__main__":
+    main()
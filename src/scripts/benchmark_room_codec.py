@@ -0,0 +1,63 @@
+#!/usr/bin/env python3
+"""Benchmark RoomCodec against pickle for encode/decode time and blob size."""
+
+import argparse
+import pickle
+import sys
+import timeit
+from pathlib import Path
+from uuid import uuid4
+
+project_root = Path(__file__).parent.parent.parent
+sys.path.insert(0, str(project_root))
+
+from src.adapters.persistence.room_codec import RoomCodec
+from src.domain.entities.game_room import GameRoom
+from src.domain.entities.game_state import GamePhase, GameState
+from src.domain.entities.player import Player
+from src.domain.services.role_assignment_service import RoleAssignmentService
+
+
+def make_room(player_count: int) -> GameRoom:
+    room = GameRoom()
+    player_ids = [uuid4() for _ in range(player_count)]
+    for i, player_id in enumerate(player_ids):
+        room.add_player(Player(player_id, f"Player{i}"))
+
+    room.start_game(GameState(
+        president_id=player_ids[0],
+        nominated_chancellor_id=player_ids[1],
+        current_phase=GamePhase.ELECTION,
+        role_assignments=RoleAssignmentService.assign_roles(player_ids),
+    ))
+    for player_id in player_ids[1:]:
+        room.game_state.votes[player_id] = True
+    return room
+
+
+def best_us(call, number: int) -> float:
+    # The fastest of several runs is the least disturbed by other load
+    return min(timeit.repeat(call, number=number, repeat=5)) / number * 1e6
+
+
+def measure(label: str, encode, decode, room: GameRoom, number: int) -> None:
+    blob = encode(room)
+    encode_us = best_us(lambda: encode(room), number)
+    decode_us = best_us(lambda: decode(blob), number)
+    print(f"  {label:<8} {len(blob):>6} B  encode {encode_us:8.2f} us  decode {decode_us:8.2f} us")
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--number", type=int, default=5000, help="Iterations per measurement")
+    args = parser.parse_args()
+
+    for player_count in (5, 10):
+        room = make_room(player_count)
+        print(f"{player_count} players:")
+        measure("pickle", pickle.dumps, pickle.loads, room, args.number)
+        measure("codec", RoomCodec.encode, RoomCodec.decode, room, args.number)
+
+
+if __name__ == "__main__":
+    main()
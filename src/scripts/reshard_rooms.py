@@ -0,0 +1,47 @@
+#!/usr/bin/env python3
+"""Move rooms between the single SQLite file and sharded room storage layouts."""
+
+import argparse
+import sys
+from pathlib import Path
+
+project_root = Path(__file__).parent.parent.parent
+sys.path.insert(0, str(project_root))
+
+import src.config
+from src.adapters.persistence.sharded_sqlite_room_repository import (
+    reshard,
+    shard_database_paths,
+)
+
+
+def layout(database: str, shard_count: int) -> list[str]:
+    # A shard count of 0 means the unsharded database file itself
+    return [database] if shard_count == 0 else shard_database_paths(database, shard_count)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument(
+        "--database", default=src.config.SQLITE_FILE, help="Main SQLite file (SQLITE_FILE)"
+    )
+    parser.add_argument(
+        "--from-shards", type=int, required=True, help="Current shard count, 0 if unsharded"
+    )
+    parser.add_argument(
+        "--to-shards", type=int, required=True, help="New shard count, 0 to unshard"
+    )
+    parser.add_argument("--batch-size", type=int, default=500, help="Rooms per transaction")
+    args = parser.parse_args()
+
+    if args.database is None:
+        parser.error("No database given and SQLITE_FILE is not set")
+
+    sources = [path for path in layout(args.database, args.from_shards) if Path(path).exists()]
+    targets = layout(args.database, args.to_shards)
+    moved = reshard(sources, targets, args.batch_size)
+    print(f"Moved {moved} rooms from {len(sources)} file(s) into {len(targets)} file(s)")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,107 @@
+#!/usr/bin/env python3
+"""Copy rooms and room codes between storage backends, streaming in batches.
+
+Backends are given as sqlite:PATH or filesystem:DIRECTORY. An interrupted
+transfer resumes from its checkpoint file when run again with the same
+arguments.
+"""
+
+import argparse
+import sys
+from pathlib import Path
+
+project_root = Path(__file__).parent.parent.parent
+sys.path.insert(0, str(project_root))
+
+from src.adapters.persistence.file_system_code_repository import FileSystemCodeRepository
+from src.adapters.persistence.file_system_room_repository import FileSystemRoomRepository
+from src.adapters.persistence.room_transfer import (
+    TransferCheckpoint,
+    TransferProgress,
+    transfer,
+)
+from src.adapters.persistence.sqlite_code_repository import SqliteCodeRepository
+from src.adapters.persistence.sqlite_connection_pool import SqliteConnectionPool
+from src.adapters.persistence.sqlite_room_repository import SqliteRoomRepository
+
+
+def open_backend(spec: str, pools: list[SqliteConnectionPool]):
+    kind, _, location = spec.partition(":")
+    if not location:
+        raise ValueError(f"Expected sqlite:PATH or filesystem:DIRECTORY, got {spec!r}")
+    if kind == "sqlite":
+        pool = SqliteConnectionPool(location)
+        pools.append(pool)
+        rooms = SqliteRoomRepository(pool.connection(), unit_of_work=pool.unit_of_work())
+        codes = SqliteCodeRepository(pool.connection(), unit_of_work=pool.unit_of_work())
+        rooms.init_tables()
+        codes.init_tables()
+        return rooms, codes
+    if kind == "filesystem":
+        return FileSystemRoomRepository(location), FileSystemCodeRepository(location)
+    raise ValueError(f"Unknown backend {kind!r}; expected sqlite or filesystem")
+
+
+def report(progress: TransferProgress) -> None:
+    print(
+        f"\r  rooms {progress.rooms:>8}  codes {progress.codes:>8}"
+        f"  {progress.rooms_per_second():8.0f} rooms/s",
+        end="",
+        file=sys.stderr,
+        flush=True,
+    )
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter
+    )
+    parser.add_argument("--from", dest="source", required=True, help="Backend to read")
+    parser.add_argument("--to", dest="target", required=True, help="Backend to write")
+    parser.add_argument("--batch-size", type=int, default=500, help="Rooms per batch")
+    parser.add_argument(
+        "--checkpoint",
+        default="room-transfer.checkpoint.json",
+        help="Progress file used to resume an interrupted transfer",
+    )
+    parser.add_argument("--no-codes", action="store_true", help="Copy rooms only")
+    args = parser.parse_args()
+
+    pools: list[SqliteConnectionPool] = []
+    try:
+        source_rooms, source_codes = open_backend(args.source, pools)
+        target_rooms, target_codes = open_backend(args.target, pools)
+    except ValueError as e:
+        parser.error(str(e))
+
+    checkpoint = TransferCheckpoint(args.checkpoint)
+    resumed = checkpoint.load()
+    if resumed.rooms or resumed.codes:
+        print(
+            f"Resuming after {resumed.rooms} rooms and {resumed.codes} codes",
+            file=sys.stderr,
+        )
+
+    try:
+        progress = transfer(
+            source_rooms,
+            target_rooms,
+            None if args.no_codes else source_codes,
+            None if args.no_codes else target_codes,
+            batch_size=args.batch_size,
+            checkpoint=checkpoint,
+            on_progress=report,
+        )
+    finally:
+        for pool in pools:
+            pool.close_all()
+
+    print(file=sys.stderr)
+    print(
+        f"Copied {progress.rooms} rooms and {progress.codes} codes"
+        f" in {progress.elapsed():.1f} s"
+    )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,130 @@
+import sqlite3
+from unittest.mock import Mock
+from uuid import uuid4
+
+import pytest
+
+from src.adapters.persistence.cached_code_repository import (
+    CachedCodeRepository,
+    CodeCache,
+)
+from src.adapters.persistence.sqlite_code_repository import SqliteCodeRepository
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self):
+        return self.now
+
+
+@pytest.fixture
+def inner():
+    conn = sqlite3.connect(":memory:")
+    repo = SqliteCodeRepository(conn)
+    repo.init_tables()
+    yield repo
+    conn.close()
+
+
+def test_warm_load_serves_existing_codes_without_queries(inner):
+    room_id = uuid4()
+    code = inner.generate_code_for_room(room_id)
+    cache = CodeCache()
+    assert cache.warm(inner.list_mappings()) == 1
+
+    spy = Mock(wraps=inner)
+    repository = CachedCodeRepository(spy, cache)
+
+    assert repository.find_room_by_code(code) == room_id
+    assert repository.get_code_for_room(room_id) == code
+    assert repository.generate_code_for_room(room_id) == code
+    assert spy.method_calls == []
+
+
+def test_generated_code_is_cached_both_ways(inner):
+    spy = Mock(wraps=inner)
+    repository = CachedCodeRepository(spy, CodeCache())
+    room_id = uuid4()
+
+    code = repository.generate_code_for_room(room_id)
+
+    assert repository.find_room_by_code(code) == room_id
+    assert repository.get_code_for_room(room_id) == code
+    assert spy.find_room_by_code.call_count == 0
+    assert spy.get_code_for_room.call_count == 0
+
+
+def test_unknown_codes_are_negatively_cached(inner):
+    clock = FakeClock()
+    cache = CodeCache(negative_ttl=5, clock=clock)
+    spy = Mock(wraps=inner)
+    repository = CachedCodeRepository(spy, cache)
+
+    assert repository.find_room_by_code("ZZZZ") is None
+    assert repository.find_room_by_code("ZZZZ") is None
+    assert spy.find_room_by_code.call_count == 1
+    assert cache.stats()["negative_hits"] == 1
+
+    clock.now = 6
+    repository.find_room_by_code("ZZZZ")
+    assert spy.find_room_by_code.call_count == 2
+
+
+def test_put_clears_negative_entry():
+    cache = CodeCache()
+    room_id = uuid4()
+    cache.mark_unknown("ABCD")
+
+    cache.put("ABCD", room_id)
+
+    assert cache.room_for("ABCD") == (True, room_id)
+
+
+def test_negative_cache_is_bounded():
+    cache = CodeCache(max_negative=2)
+    for code in ["AAAA", "BBBB", "CCCC"]:
+        cache.mark_unknown(code)
+
+    assert cache.stats()["unknown_codes"] == 2
+    assert cache.room_for("AAAA") == (False, None)
+    assert cache.room_for("CCCC") == (True, None)
+
+
+def test_invalidate_room_forgets_both_directions():
+    cache = CodeCache()
+    room_id = uuid4()
+    cache.put("ABCD", room_id)
+
+    cache.invalidate_room(room_id)
+
+    assert cache.code_for(room_id) is None
+    assert cache.room_for("ABCD") == (False, None)
+
+
+def test_mappings_expire_so_reused_codes_are_looked_up_again(inner):
+    clock = FakeClock()
+    cache = CodeCache(clock=clock, ttl=60)
+    repository = CachedCodeRepository(inner, cache)
+    swept_room_id, new_room_id = uuid4(), uuid4()
+    code = repository.generate_code_for_room(swept_room_id)
+    assert repository.find_room_by_code(code) == swept_room_id
+
+    # Another process sweeps the room and later hands its code to a new one
+    inner.import_mappings([(code, new_room_id)])
+    clock.now = 61
+
+    assert repository.find_room_by_code(code) == new_room_id
+    assert cache.code_for(swept_room_id) is None
+
+
+def test_reused_code_replaces_its_old_room():
+    cache = CodeCache()
+    old_room_id, new_room_id = uuid4(), uuid4()
+    cache.put("ABCD", old_room_id)
+
+    cache.put("ABCD", new_room_id)
+
+    assert cache.code_for(old_room_id) is None
+    assert cache.room_for("ABCD") == (True, new_room_id)
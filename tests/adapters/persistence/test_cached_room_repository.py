@@ -0,0 +1,165 @@
+import sqlite3
+from unittest.mock import Mock
+from uuid import uuid4
+
+import pytest
+
+from src.adapters.persistence.cached_room_repository import (
+    CachedRoomRepository,
+    RoomCache,
+)
+from src.adapters.persistence.in_memory_room_repository import InMemoryRoomRepository
+from src.adapters.persistence.sqlite_room_repository import SqliteRoomRepository
+from src.adapters.persistence.sqlite_unit_of_work import SqliteUnitOfWork
+from src.domain.entities.game_room import GameRoom
+from src.domain.entities.player import Player
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self):
+        return self.now
+
+
+@pytest.fixture
+def inner():
+    return InMemoryRoomRepository()
+
+
+@pytest.fixture
+def cache():
+    return RoomCache(max_size=2)
+
+
+@pytest.fixture
+def repository(inner, cache):
+    return CachedRoomRepository(inner, cache)
+
+
+def make_room(name: str = "Alice") -> GameRoom:
+    room = GameRoom()
+    room.add_player(Player(uuid4(), name))
+    return room
+
+
+def test_repeated_reads_are_served_from_cache(inner, cache):
+    room = make_room()
+    inner.save(room)
+    spy = Mock(wraps=inner)
+    repository = CachedRoomRepository(spy, cache)
+
+    repository.find_by_id(room.room_id)
+    repository.find_by_id(room.room_id)
+    repository.find_by_id(room.room_id)
+
+    assert spy.find_by_id.call_count == 1
+    assert cache.stats()["hits"] == 2
+    assert cache.stats()["misses"] == 1
+
+
+def test_hits_return_independent_copies(repository):
+    room = make_room()
+    repository.save(room)
+
+    found = repository.find_by_id(room.room_id)
+    found.add_player(Player(uuid4(), "Unsaved"))
+
+    assert len(repository.find_by_id(room.room_id).players) == 1
+
+
+def test_save_refreshes_cached_room(repository):
+    room = make_room()
+    repository.save(room)
+    repository.find_by_id(room.room_id)
+
+    room.add_player(Player(uuid4(), "Bob"))
+    repository.save(room)
+
+    assert len(repository.find_by_id(room.room_id).players) == 2
+
+
+def test_failed_save_invalidates_entry(inner, cache):
+    room = make_room()
+    repository = CachedRoomRepository(inner, cache)
+    repository.save(room)
+
+    failing = Mock(wraps=inner)
+    failing.save.side_effect = RuntimeError("write failed")
+    with pytest.raises(RuntimeError):
+        CachedRoomRepository(failing, cache).save(room)
+
+    assert cache.stats()["size"] == 0
+
+
+def test_rolled_back_save_is_not_served_from_cache(cache):
+    conn = sqlite3.connect(":memory:")
+    unit_of_work = SqliteUnitOfWork(conn)
+    storage = SqliteRoomRepository(conn, unit_of_work=unit_of_work)
+    storage.init_tables()
+    repository = CachedRoomRepository(storage, cache, unit_of_work=unit_of_work)
+    room = make_room()
+
+    with pytest.raises(RuntimeError):
+        with unit_of_work:
+            repository.save(room)
+            raise RuntimeError("later write failed")
+
+    assert repository.find_by_id(room.room_id) is None
+
+
+def test_committed_save_stays_cached(cache):
+    conn = sqlite3.connect(":memory:")
+    unit_of_work = SqliteUnitOfWork(conn)
+    storage = SqliteRoomRepository(conn, unit_of_work=unit_of_work)
+    storage.init_tables()
+    repository = CachedRoomRepository(storage, cache, unit_of_work=unit_of_work)
+    room = make_room()
+
+    with unit_of_work:
+        repository.save(room)
+    unit_of_work.rollback()
+
+    assert cache.get(room.room_id) is not None
+    assert repository.find_by_id(room.room_id) is not None
+
+
+def test_delete_invalidates_entry(repository):
+    room = make_room()
+    repository.save(room)
+
+    repository.delete(room.room_id)
+
+    assert repository.find_by_id(room.room_id) is None
+
+
+def test_least_recently_used_room_is_evicted(repository, cache):
+    rooms = [make_room(f"Player{i}") for i in range(3)]
+    repository.save(rooms[0])
+    repository.save(rooms[1])
+    repository.find_by_id(rooms[0].room_id)
+    repository.save(rooms[2])
+
+    assert cache.get(rooms[0].room_id) is not None
+    assert cache.get(rooms[1].room_id) is None
+    assert cache.stats()["evictions"] == 1
+
+
+def test_entries_expire_after_ttl():
+    clock = FakeClock()
+    cache = RoomCache(max_size=10, ttl=5, clock=clock)
+    room_id = uuid4()
+    cache.put(room_id, b"data")
+
+    clock.now = 4
+    assert cache.get(room_id) == b"data"
+
+    clock.now = 6
+    assert cache.get(room_id) is None
+    assert cache.stats()["expirations"] == 1
+
+
+def test_invalid_cache_size():
+    with pytest.raises(ValueError):
+        RoomCache(max_size=0)
@@ -5,6 +5,10 @@ from uuid import uuid4
 
 import pytest
 
+from src.adapters.persistence.cached_code_repository import (
+    CachedCodeRepository,
+    CodeCache,
+)
 from src.adapters.persistence.file_system_code_repository import (
     FileSystemCodeRepository,
 )
@@ -21,6 +25,7 @@ def temp_dir():
     params=[
         pytest.param("file_system", id="FileSystemCodeRepository"),
         pytest.param("sqlite", id="SqliteCodeRepository"),
+        pytest.param("cached", id="CachedCodeRepository"),
     ]
 )
 def repository(request):
@@ -40,6 +45,12 @@ def repository(request):
             repo.init_tables()
             yield repo
             conn.close()
+    elif request.param == "cached":
+        conn = sqlite3.connect(":memory:")
+        repo = SqliteCodeRepository(conn)
+        repo.init_tables()
+        yield CachedCodeRepository(repo, CodeCache())
+        conn.close()
 
 
 def test_generate_code_for_room_creates_valid_code(repository):
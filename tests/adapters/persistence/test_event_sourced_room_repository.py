@@ -0,0 +1,219 @@
+import copy
+import sqlite3
+from uuid import uuid4
+
+import pytest
+
+from src.adapters.persistence.event_sourced_room_repository import (
+    ROOM_CREATED,
+    ROOM_UPDATED,
+    EventSourcedRoomRepository,
+)
+from src.ports.room_repository_port import ConcurrentModificationError
+from src.domain.entities.game_room import GameRoom, RoomStatus
+from src.domain.entities.game_state import GamePhase, GameState
+from src.domain.entities.player import Player
+from src.domain.services.role_assignment_service import RoleAssignmentService
+
+
+@pytest.fixture
+def conn():
+    conn = sqlite3.connect(":memory:", check_same_thread=False)
+    yield conn
+    conn.close()
+
+
+@pytest.fixture
+def repository(conn):
+    repo = EventSourcedRoomRepository(conn, snapshot_interval=3)
+    repo.init_tables()
+    return repo
+
+
+def make_started_room() -> GameRoom:
+    room = GameRoom()
+    player_ids = [uuid4() for _ in range(5)]
+    for i, player_id in enumerate(player_ids):
+        room.add_player(Player(player_id, f"Player{i}"))
+    room.start_game(GameState(
+        president_id=player_ids[0],
+        role_assignments=RoleAssignmentService.assign_roles(player_ids),
+    ))
+    return room
+
+
+def count_rows(conn, table):
+    return conn.execute(f"SELECT COUNT(*) FROM {table}").fetchone()[0]
+
+
+def test_first_save_records_full_room(repository):
+    room = GameRoom()
+    room.add_player(Player(uuid4(), "Alice"))
+
+    repository.save(room)
+
+    events = repository.events(room.room_id)
+    assert len(events) == 1
+    assert events[0].event_type == ROOM_CREATED
+    assert events[0].payload["players"][0][1] == "Alice"
+
+
+def test_later_saves_record_only_changed_fields(repository):
+    room = make_started_room()
+    repository.save(room)
+
+    loaded = repository.find_by_id(room.room_id)
+    voter_id = loaded.players[1].player_id
+    loaded.game_state.current_phase = GamePhase.ELECTION
+    loaded.game_state.votes[voter_id] = True
+    repository.save(loaded)
+
+    event = repository.events(room.room_id)[-1]
+    assert event.event_type == ROOM_UPDATED
+    assert event.payload == {
+        "game_state": {
+            "current_phase": "ELECTION",
+            "votes+": {str(voter_id): True},
+        }
+    }
+
+
+def test_each_vote_records_only_its_own_entry(repository):
+    room = make_started_room()
+    repository.save(room)
+    first_voter, second_voter = room.players[1].player_id, room.players[2].player_id
+
+    loaded = repository.find_by_id(room.room_id)
+    loaded.game_state.votes[first_voter] = True
+    repository.save(loaded)
+    loaded.game_state.votes[second_voter] = False
+    repository.save(loaded)
+
+    assert repository.events(room.room_id)[-1].payload == {
+        "game_state": {"votes+": {str(second_voter): False}}
+    }
+    assert repository.find_by_id(room.room_id).game_state.votes == {
+        first_voter: True,
+        second_voter: False,
+    }
+
+
+def test_clearing_votes_replaces_the_whole_map(repository):
+    room = make_started_room()
+    room.game_state.votes[room.players[1].player_id] = True
+    repository.save(room)
+
+    loaded = repository.find_by_id(room.room_id)
+    loaded.game_state.move_to_nomination_phase(room.players[1].player_id)
+    repository.save(loaded)
+
+    assert repository.events(room.room_id)[-1].payload["game_state"]["votes"] == {}
+    assert repository.find_by_id(room.room_id).game_state.votes == {}
+
+
+def test_saves_of_untracked_copies_match_tracked_saves(repository):
+    room = make_started_room()
+    repository.save(room)
+
+    loaded = repository.find_by_id(room.room_id)
+    copied = copy.deepcopy(loaded)
+    copied.game_state.policy_deck.discard(copied.game_state.policy_deck.draw(3))
+    copied.players[2].kill()
+    repository.save(copied)
+
+    reloaded = repository.find_by_id(room.room_id)
+    assert reloaded.game_state.policy_deck == copied.game_state.policy_deck
+    assert not reloaded.players[2].is_alive
+
+
+def test_unchanged_save_appends_nothing(repository):
+    room = GameRoom()
+    repository.save(room)
+    repository.save(room)
+
+    assert len(repository.events(room.room_id)) == 1
+
+
+def test_snapshot_is_taken_every_interval(repository, conn):
+    room = GameRoom()
+    for i in range(3):
+        room.add_player(Player(uuid4(), f"Player{i}"))
+        repository.save(room)
+
+    assert count_rows(conn, "room_snapshots") == 1
+
+    room.add_player(Player(uuid4(), "Late"))
+    repository.save(room)
+
+    found = EventSourcedRoomRepository(conn, snapshot_interval=3).find_by_id(
+        room.room_id
+    )
+    assert [p.name for p in found.players] == [
+        "Player0", "Player1", "Player2", "Late"
+    ]
+
+
+def test_replay_rebuilds_past_states(repository):
+    room = make_started_room()
+    repository.save(room)
+    room.game_state.liberal_policies = 1
+    repository.save(room)
+    room.end_game()
+    repository.save(room)
+
+    assert repository.replay(room.room_id, up_to_sequence=1).status == (
+        RoomStatus.IN_PROGRESS
+    )
+    assert repository.replay(room.room_id, up_to_sequence=2).game_state.liberal_policies == 1
+    assert repository.replay(room.room_id).status == RoomStatus.COMPLETED
+
+
+def test_concurrent_append_is_rejected(conn, repository):
+    room = GameRoom()
+    repository.save(room)
+
+    first = EventSourcedRoomRepository(conn)
+    second = EventSourcedRoomRepository(conn)
+    room_a = first.find_by_id(room.room_id)
+    room_b = second.find_by_id(room.room_id)
+
+    room_a.add_player(Player(uuid4(), "Alice"))
+    first.save(room_a)
+
+    room_b.add_player(Player(uuid4(), "Bob"))
+    with pytest.raises(ConcurrentModificationError):
+        second.save(room_b)
+
+    assert [p.name for p in repository.find_by_id(room.room_id).players] == ["Alice"]
+
+
+def test_stale_room_is_rejected(repository):
+    room = GameRoom()
+    repository.save(room)
+    stale = repository.find_by_id(room.room_id)
+
+    room.add_player(Player(uuid4(), "Alice"))
+    repository.save(room)
+
+    stale.add_player(Player(uuid4(), "Bob"))
+    with pytest.raises(ConcurrentModificationError):
+        repository.save(stale)
+
+    assert repository.find_by_id(room.room_id).version == 2
+
+
+def test_delete_removes_log_and_snapshot(repository, conn):
+    room = GameRoom()
+    for i in range(3):
+        room.add_player(Player(uuid4(), f"Player{i}"))
+        repository.save(room)
+
+    repository.delete(room.room_id)
+
+    assert count_rows(conn, "room_events") == 0
+    assert count_rows(conn, "room_snapshots") == 0
+
+
+def test_invalid_snapshot_interval(conn):
+    with pytest.raises(ValueError):
+        EventSourcedRoomRepository(conn, snapshot_interval=0)
@@ -1,3 +1,4 @@
+import json
 import tempfile
 from pathlib import Path
 from uuid import uuid4
@@ -25,7 +26,7 @@ def test_files_are_created(temp_dir, repository):
     repository.generate_code_for_room(room_id)
 
     counter_file = Path(temp_dir) / "code_counter.json"
-    mappings_file = Path(temp_dir) / "code_mappings.json"
+    mappings_file = Path(temp_dir) / "code_mappings.log"
 
     assert counter_file.exists()
     assert mappings_file.exists()
@@ -54,4 +55,81 @@ def test_counter_persists_across_instances(temp_dir):
     code2 = repo2.generate_code_for_room(room2_id)
 
     assert code1 == "QGLJ"
-    assert code2 == "GX72"
\ No newline at end of file
+    assert code2 == "GX72"
+
+def test_codes_appended_by_another_instance_are_found(temp_dir):
+    reader = FileSystemCodeRepository(base_path=temp_dir)
+    writer = FileSystemCodeRepository(base_path=temp_dir)
+    room_id = uuid4()
+
+    code = writer.generate_code_for_room(room_id)
+
+    assert reader.find_room_by_code(code) == room_id
+    assert reader.get_code_for_room(room_id) == code
+
+
+def test_mappings_file_is_append_only(temp_dir, repository):
+    repository.generate_code_for_room(uuid4())
+    mappings_file = Path(temp_dir) / "code_mappings.log"
+    first = mappings_file.read_text()
+
+    repository.generate_code_for_room(uuid4())
+
+    assert mappings_file.read_text().startswith(first)
+    assert len(mappings_file.read_text().splitlines()) == 2
+
+
+def test_partially_written_line_is_ignored(temp_dir, repository):
+    room_id = uuid4()
+    code = repository.generate_code_for_room(room_id)
+    with open(Path(temp_dir) / "code_mappings.log", "a") as f:
+        f.write("ABCD 1234")
+
+    repo = FileSystemCodeRepository(base_path=temp_dir)
+
+    assert repo.find_room_by_code(code) == room_id
+    assert repo.find_room_by_code("ABCD") is None
+
+    next_room_id = uuid4()
+    next_code = repo.generate_code_for_room(next_room_id)
+    assert FileSystemCodeRepository(base_path=temp_dir).find_room_by_code(
+        next_code
+    ) == next_room_id
+
+
+def test_legacy_json_mappings_are_migrated(temp_dir):
+    room_id = uuid4()
+    legacy = {
+        "code_to_room": {"ABCD": str(room_id)},
+        "room_to_code": {str(room_id): "ABCD"},
+    }
+    (Path(temp_dir) / "code_mappings.json").write_text(json.dumps(legacy))
+
+    repo = FileSystemCodeRepository(base_path=temp_dir)
+
+    assert repo.find_room_by_code("ABCD") == room_id
+    assert repo.get_code_for_room(room_id) == "ABCD"
+
+
+def test_code_appended_before_a_crash_is_not_reissued(temp_dir, repository):
+    first_room_id = uuid4()
+    first_code = repository.generate_code_for_room(first_room_id)
+    # A crash after the append but before the counter was saved
+    (Path(temp_dir) / "code_counter.json").write_text(json.dumps({"counter": 1}))
+
+    repo = FileSystemCodeRepository(base_path=temp_dir)
+    second_code = repo.generate_code_for_room(uuid4())
+
+    assert second_code != first_code
+    assert repo.find_room_by_code(first_code) == first_room_id
+
+
+def test_codes_already_in_the_log_are_skipped(temp_dir, repository):
+    room_id = uuid4()
+    repository.import_mappings([("GX72", room_id)])
+    (Path(temp_dir) / "code_counter.json").write_text(json.dumps({"counter": 1}))
+
+    codes = [repository.generate_code_for_room(uuid4()) for _ in range(2)]
+
+    assert "GX72" not in codes
+    assert repository.find_room_by_code("GX72") == room_id
@@ -3,6 +3,7 @@ Test suite for implementation details of the file system implementation of
 the room repository.
 """
 
+import hashlib
 import tempfile
 from pathlib import Path
 from uuid import uuid4
@@ -10,6 +11,7 @@ from uuid import uuid4
 import pytest
 
 from src.adapters.persistence.file_system_room_repository import FileSystemRoomRepository
+from src.adapters.persistence.room_codec import RoomCodec
 from src.domain.entities.game_room import GameRoom, RoomStatus
 from src.domain.entities.game_state import GamePhase, GameState
 from src.domain.entities.player import Player
@@ -27,6 +29,11 @@ def repository(temp_dir):
     return FileSystemRoomRepository(base_path=temp_dir)
 
 
+def shard_path(temp_dir, room_id):
+    digest = hashlib.sha1(str(room_id).encode()).hexdigest()
+    return Path(temp_dir) / digest[:2] / digest[2:4] / f"secret-hitler-{room_id}.txt"
+
+
 def test_save_writes_to_file(repository, temp_dir):
     room = GameRoom()
     player = Player(uuid4(), "TestPlayer")
@@ -34,16 +41,61 @@ def test_save_writes_to_file(repository, temp_dir):
 
     repository.save(room)
 
-    file_path = Path(temp_dir) / f"secret-hitler-{room.room_id}.txt"
+    file_path = shard_path(temp_dir, room.room_id)
     assert file_path.exists()
+    assert list(file_path.parent.glob(".tmp-*")) == []
 
 def test_delete_deletes_file(repository, temp_dir):
     room = GameRoom()
     repository.save(room)
 
-    file_path = Path(temp_dir) / f"secret-hitler-{room.room_id}.txt"
+    file_path = shard_path(temp_dir, room.room_id)
 
     repository.delete(room.room_id)
     assert not file_path.exists()
     assert repository.find_by_id(room.room_id) is None
 
+
+def test_legacy_flat_files_are_read_and_moved_on_save(repository, temp_dir):
+    room = GameRoom()
+    room.add_player(Player(uuid4(), "Legacy"))
+    legacy_path = Path(temp_dir) / f"secret-hitler-{room.room_id}.txt"
+    legacy_path.write_bytes(RoomCodec.encode(room))
+
+    assert repository.find_by_id(room.room_id).players[0].name == "Legacy"
+    assert [r.room_id for r in repository.iter_all()] == [room.room_id]
+
+    repository.save(room)
+
+    assert not legacy_path.exists()
+    assert shard_path(temp_dir, room.room_id).exists()
+
+
+def test_failed_write_keeps_previous_file(repository, temp_dir, monkeypatch):
+    room = GameRoom()
+    room.add_player(Player(uuid4(), "Alice"))
+    repository.save(room)
+
+    def fail(room):
+        raise RuntimeError("encode failed")
+
+    monkeypatch.setattr(RoomCodec, "encode", fail)
+    room.add_player(Player(uuid4(), "Bob"))
+    with pytest.raises(RuntimeError):
+        repository.save(room)
+    monkeypatch.undo()
+
+    file_path = shard_path(temp_dir, room.room_id)
+    assert [p.name for p in repository.find_by_id(room.room_id).players] == ["Alice"]
+    assert list(file_path.parent.glob(".tmp-*")) == []
+
+
+def test_iter_all_streams_rooms(repository):
+    rooms = [GameRoom() for _ in range(3)]
+    for room in rooms:
+        repository.save(room)
+
+    iterator = repository.iter_all()
+
+    assert next(iterator).room_id in {room.room_id for room in rooms}
+    assert len(list(iterator)) == 2
@@ -0,0 +1,195 @@
+import os
+from unittest.mock import Mock
+from uuid import uuid4
+
+import pytest
+
+from src.adapters.persistence.journaled_room_repository import JournaledRoomRepository
+from src.domain.entities.game_room import GameRoom
+from src.domain.entities.player import Player
+from src.ports.room_repository_port import ConcurrentModificationError
+
+
+@pytest.fixture
+def journal_path(tmp_path):
+    return str(tmp_path / "rooms.journal")
+
+
+def make_room(name: str = "Alice") -> GameRoom:
+    room = GameRoom()
+    room.add_player(Player(uuid4(), name))
+    return room
+
+
+def reopen(journal_path: str) -> JournaledRoomRepository:
+    repository = JournaledRoomRepository(journal_path, flush_interval=60)
+    repository.load()
+    return repository
+
+
+def test_rooms_survive_a_restart(journal_path):
+    repository = reopen(journal_path)
+    room = make_room()
+    repository.save(room)
+    room.add_player(Player(uuid4(), "Bob"))
+    repository.save(room)
+    repository.close()
+
+    restored = reopen(journal_path).find_by_id(room.room_id)
+
+    assert [player.name for player in restored.players] == ["Alice", "Bob"]
+    assert restored.version == 2
+
+
+def test_deletes_survive_a_restart(journal_path):
+    repository = reopen(journal_path)
+    kept, deleted = make_room("Kept"), make_room("Deleted")
+    repository.save(kept)
+    repository.save(deleted)
+    repository.delete(deleted.room_id)
+    repository.close()
+
+    restored = reopen(journal_path)
+
+    assert restored.exists(kept.room_id)
+    assert not restored.exists(deleted.room_id)
+
+
+def test_save_is_buffered_until_flush(journal_path):
+    repository = reopen(journal_path)
+    room = make_room()
+    repository.save(room)
+
+    assert reopen(journal_path).find_by_id(room.room_id) is None
+
+    assert repository.flush() == 1
+    assert reopen(journal_path).find_by_id(room.room_id) is not None
+
+
+def test_load_compacts_the_journal(journal_path):
+    repository = reopen(journal_path)
+    room = make_room()
+    repository.save(room)
+    for i in range(5):
+        room.add_player(Player(uuid4(), f"Player{i}"))
+        repository.save(room)
+    repository.delete(room.room_id)
+    repository.save(make_room("Kept"))
+    repository.flush()
+    journal_bytes = repository.stats()["journal_bytes"]
+
+    restored = reopen(journal_path)
+
+    assert restored.stats()["replayed_records"] == 8
+    assert restored.stats()["journal_bytes"] < journal_bytes
+    assert restored.stats()["journal_bytes"] == restored.stats()["live_bytes"]
+    assert reopen(journal_path).stats()["replayed_records"] == 1
+
+
+def test_flush_compacts_once_the_journal_outgrows_the_rooms(journal_path):
+    repository = JournaledRoomRepository(
+        journal_path, flush_interval=60, compact_ratio=2, min_compact_bytes=0
+    )
+    repository.load()
+    room = make_room()
+    for _ in range(3):
+        repository.save(room)
+        repository.flush()
+
+    assert repository.stats()["compactions"] == 1
+    assert reopen(journal_path).find_by_id(room.room_id).version == 3
+
+
+def test_torn_final_record_is_ignored(journal_path):
+    repository = reopen(journal_path)
+    first, second = make_room("First"), make_room("Second")
+    repository.save(first)
+    repository.save(second)
+    repository.close()
+    with open(journal_path, "r+b") as f:
+        f.truncate(f.seek(0, 2) - 3)
+
+    restored = reopen(journal_path)
+
+    assert restored.exists(first.room_id)
+    assert not restored.exists(second.room_id)
+
+
+def test_stale_save_is_rejected(journal_path):
+    repository = reopen(journal_path)
+    room = make_room()
+    repository.save(room)
+    stale = repository.find_by_id(room.room_id)
+    repository.save(repository.find_by_id(room.room_id))
+
+    with pytest.raises(ConcurrentModificationError):
+        repository.save(stale)
+
+
+def test_versions_are_checked_after_a_restart(journal_path):
+    repository = reopen(journal_path)
+    room = make_room()
+    repository.save(room)
+    repository.close()
+
+    restored = reopen(journal_path)
+
+    recreated = make_room("Bob")
+    recreated.room_id = room.room_id
+    with pytest.raises(ConcurrentModificationError):
+        restored.save(recreated)
+    restored.save(restored.find_by_id(room.room_id))
+
+
+def test_background_flusher_writes_saves(journal_path):
+    repository = JournaledRoomRepository(journal_path, flush_interval=0.01)
+    repository.start()
+    room = make_room()
+    repository.save(room)
+    repository.close()
+
+    assert repository.stats()["flushes"] >= 1
+    assert reopen(journal_path).exists(room.room_id)
+
+
+def test_failed_flush_is_cut_off_and_retried(journal_path, monkeypatch):
+    repository = reopen(journal_path)
+    kept = make_room("Kept")
+    repository.save(kept)
+    repository.flush()
+    size = os.path.getsize(journal_path)
+
+    room = make_room()
+    repository.save(room)
+    monkeypatch.setattr(os, "fsync", Mock(side_effect=OSError("disk full")))
+    with pytest.raises(OSError):
+        repository.flush()
+    monkeypatch.undo()
+
+    assert os.path.getsize(journal_path) == size
+    assert repository.stats()["failed_flushes"] == 1
+    assert repository.stats()["pending_records"] == 1
+
+    room.add_player(Player(uuid4(), "Bob"))
+    repository.save(room)
+    assert repository.flush() == 2
+
+    restored = reopen(journal_path)
+    assert restored.exists(kept.room_id)
+    assert restored.find_by_id(room.room_id).version == 2
+
+
+def test_failed_compaction_keeps_buffered_records(journal_path, monkeypatch):
+    repository = reopen(journal_path)
+    room = make_room()
+    repository.save(room)
+    monkeypatch.setattr(os, "fsync", Mock(side_effect=OSError("disk full")))
+
+    with pytest.raises(OSError):
+        repository.compact()
+    monkeypatch.undo()
+
+    assert repository.stats()["pending_records"] == 1
+    assert not os.path.exists(journal_path.replace(".journal", ".tmp"))
+    repository.close()
+    assert reopen(journal_path).exists(room.room_id)
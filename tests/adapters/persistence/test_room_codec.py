@@ -0,0 +1,120 @@
+import pickle
+from uuid import uuid4
+
+import pytest
+
+from src.adapters.persistence.room_codec import RoomCodec, RoomCodecError
+from src.domain.entities.game_room import GameRoom, RoomStatus
+from src.domain.entities.game_state import GamePhase, GameState
+from src.domain.entities.player import Player
+from src.domain.services.role_assignment_service import RoleAssignmentService
+from src.domain.value_objects.role import Role
+
+
+def make_started_room(player_count: int = 5) -> GameRoom:
+    room = GameRoom()
+    player_ids = [uuid4() for _ in range(player_count)]
+    for i, player_id in enumerate(player_ids):
+        room.add_player(Player(player_id, f"Player{i}"))
+
+    game_state = GameState(
+        president_id=player_ids[0],
+        role_assignments=RoleAssignmentService.assign_roles(player_ids),
+    )
+    room.start_game(game_state)
+    return room
+
+
+def test_round_trip_waiting_room():
+    room = GameRoom()
+    room.add_player(Player(uuid4(), "Alice"))
+    room.add_player(Player(uuid4(), "Zoë"))
+
+    decoded = RoomCodec.decode(RoomCodec.encode(room))
+
+    assert decoded.room_id == room.room_id
+    assert decoded.creator_id == room.creator_id
+    assert decoded.status == RoomStatus.WAITING
+    assert decoded.created_at == room.created_at
+    assert [p.name for p in decoded.players] == ["Alice", "Zoë"]
+    assert decoded.game_state is None
+
+
+def test_round_trip_started_game():
+    room = make_started_room(10)
+    state = room.game_state
+    player_ids = [p.player_id for p in room.players]
+    state.nominated_chancellor_id = player_ids[1]
+    state.previous_chancellor_id = player_ids[2]
+    state.current_phase = GamePhase.LEGISLATIVE_PRESIDENT
+    state.votes = {player_ids[1]: True, player_ids[2]: False}
+    state.investigated_players = {player_ids[3]}
+    state.president_policies = state.policy_deck.draw(3)
+    state.policy_deck.discard(state.policy_deck.draw(2))
+    state.fascist_policies = 2
+    state.election_tracker = 1
+    state.veto_rejected = True
+    room.players[4].kill()
+    room.players[5].disconnect()
+
+    decoded = RoomCodec.decode(RoomCodec.encode(room))
+
+    assert decoded.status == RoomStatus.IN_PROGRESS
+    assert decoded.game_state == state
+    assert [p.is_alive for p in decoded.players] == [p.is_alive for p in room.players]
+    assert [p.is_connected for p in decoded.players] == [
+        p.is_connected for p in room.players
+    ]
+
+
+def test_roles_are_preserved():
+    room = make_started_room(7)
+
+    decoded = RoomCodec.decode(RoomCodec.encode(room))
+
+    assert decoded.game_state.role_assignments == room.game_state.role_assignments
+    assert list(decoded.game_state.role_assignments.values()).count(
+        Role.hitler_role()
+    ) == 1
+
+
+def test_game_over_reason_is_preserved():
+    room = make_started_room()
+    room.game_state.current_phase = GamePhase.GAME_OVER
+    room.game_state.game_over_reason = "Liberals win!"
+    room.end_game()
+
+    decoded = RoomCodec.decode(RoomCodec.encode(room))
+
+    assert decoded.status == RoomStatus.COMPLETED
+    assert decoded.game_state.game_over_reason == "Liberals win!"
+
+
+def test_encoding_is_smaller_than_pickle():
+    room = make_started_room(10)
+
+    assert len(RoomCodec.encode(room)) < len(pickle.dumps(room)) / 4
+
+
+def test_decode_falls_back_to_pickle():
+    room = make_started_room()
+
+    decoded = RoomCodec.decode(pickle.dumps(room))
+
+    assert decoded.room_id == room.room_id
+    assert decoded.game_state == room.game_state
+
+
+def test_unsupported_version_is_rejected():
+    data = bytearray(RoomCodec.encode(GameRoom()))
+    data[len(RoomCodec.MAGIC)] = 255
+
+    with pytest.raises(RoomCodecError):
+        RoomCodec.decode(bytes(data))
+
+
+def test_truncated_data_is_rejected():
+    data = RoomCodec.encode(make_started_room())
+
+    with pytest.raises(ValueError):
+        RoomCodec.decode(data[:-5])
@@ -13,11 +13,26 @@ from uuid import uuid4
 
 import pytest
 
+from src.adapters.persistence.cached_room_repository import (
+    CachedRoomRepository,
+    RoomCache,
+)
+from src.adapters.persistence.event_sourced_room_repository import (
+    EventSourcedRoomRepository,
+)
 from src.adapters.persistence.in_memory_room_repository import InMemoryRoomRepository
+from src.adapters.persistence.journaled_room_repository import JournaledRoomRepository
 from src.adapters.persistence.file_system_room_repository import (
     FileSystemRoomRepository,
 )
+from src.adapters.persistence.sharded_sqlite_room_repository import (
+    ShardedSqliteRoomRepository,
+)
+from src.adapters.persistence.sqlite_connection_pool import SqliteConnectionPool
 from src.adapters.persistence.sqlite_room_repository import SqliteRoomRepository
+from src.adapters.persistence.write_behind_room_repository import (
+    WriteBehindRoomRepository,
+)
 from src.domain.entities.game_room import GameRoom, RoomStatus
 from src.domain.entities.game_state import GamePhase, GameState
 from src.domain.entities.player import Player
@@ -29,6 +44,11 @@ from src.domain.services.role_assignment_service import RoleAssignmentService
         pytest.param("in_memory", id="InMemoryRoomRepository"),
         pytest.param("file_system", id="FileSystemRoomRepository"),
         pytest.param("sqlite", id="SqliteRoomRepository"),
+        pytest.param("event_sourced", id="EventSourcedRoomRepository"),
+        pytest.param("write_behind", id="WriteBehindRoomRepository"),
+        pytest.param("cached", id="CachedRoomRepository"),
+        pytest.param("sharded", id="ShardedSqliteRoomRepository"),
+        pytest.param("journaled", id="JournaledRoomRepository"),
     ]
 )
 def repository(request):
@@ -53,6 +73,49 @@ def repository(request):
         yield repo
         conn.close()
 
+    elif request.param == "event_sourced":
+        conn = sqlite3.connect(":memory:", check_same_thread=False)
+        repo = EventSourcedRoomRepository(conn, snapshot_interval=2)
+        repo.init_tables()
+        yield repo
+        conn.close()
+
+    elif request.param == "write_behind":
+        conn = sqlite3.connect(":memory:", check_same_thread=False)
+        backing = SqliteRoomRepository(conn)
+        backing.init_tables()
+        repo = WriteBehindRoomRepository(lambda: backing, max_dirty=3)
+        repo.start()
+        yield repo
+        repo.close()
+        conn.close()
+
+    elif request.param == "cached":
+        conn = sqlite3.connect(":memory:", check_same_thread=False)
+        backing = SqliteRoomRepository(conn)
+        backing.init_tables()
+        yield CachedRoomRepository(backing, RoomCache(max_size=4))
+        conn.close()
+
+    elif request.param == "sharded":
+        with tempfile.TemporaryDirectory() as tmpdir:
+            pools = [
+                SqliteConnectionPool(str(Path(tmpdir) / f"shard{i}.db"))
+                for i in range(3)
+            ]
+            repo = ShardedSqliteRoomRepository(pools)
+            repo.init_tables()
+            yield repo
+            for pool in pools:
+                pool.close_all()
+
+    elif request.param == "journaled":
+        with tempfile.TemporaryDirectory() as tmpdir:
+            repo = JournaledRoomRepository(str(Path(tmpdir) / "rooms.journal"))
+            repo.start()
+            yield repo
+            repo.close()
+
 
 def test_save_and_find_by_id(repository):
     room = GameRoom()
@@ -179,6 +242,24 @@ def test_list_all_excludes_deleted_rooms(repository):
     assert rooms[0].room_id == room2.room_id
 
 
+def test_iter_all_yields_every_room(repository):
+    rooms = [GameRoom() for _ in range(3)]
+    for room in rooms:
+        repository.save(room)
+
+    assert {r.room_id for r in repository.iter_all()} == {r.room_id for r in rooms}
+
+
+def test_iter_all_is_in_room_id_order_and_resumes_after_a_room(repository):
+    rooms = [GameRoom() for _ in range(5)]
+    for room in rooms:
+        repository.save(room)
+    ordered = sorted((room.room_id for room in rooms), key=str)
+
+    assert [r.room_id for r in repository.iter_all()] == ordered
+    assert [r.room_id for r in repository.iter_all(after=ordered[1])] == ordered[2:]
+
+
 def test_save_and_retrieve_room_with_multiple_players(repository):
     room = GameRoom()
 
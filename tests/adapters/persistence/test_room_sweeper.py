@@ -0,0 +1,201 @@
+import asyncio
+import sqlite3
+from concurrent.futures import Future
+from datetime import datetime, timedelta
+from uuid import uuid4
+
+import pytest
+
+from src.adapters.persistence.cached_code_repository import CodeCache
+from src.adapters.persistence.room_sweeper import RoomSweeper
+from src.adapters.persistence.sqlite_code_repository import SqliteCodeRepository
+from src.adapters.persistence.sqlite_room_repository import SqliteRoomRepository
+from src.domain.entities.game_room import GameRoom, RoomStatus
+from src.domain.entities.player import Player
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = datetime(2024, 1, 1, 12, 0)
+
+    def __call__(self):
+        return self.now
+
+
+@pytest.fixture
+def clock():
+    return FakeClock()
+
+
+@pytest.fixture
+def conn():
+    conn = sqlite3.connect(":memory:", check_same_thread=False)
+    yield conn
+    conn.close()
+
+
+@pytest.fixture
+def rooms(conn, clock):
+    repo = SqliteRoomRepository(conn, clock=clock)
+    repo.init_tables()
+    return repo
+
+
+@pytest.fixture
+def codes(conn):
+    repo = SqliteCodeRepository(conn)
+    repo.init_tables()
+    return repo
+
+
+@pytest.fixture
+def code_cache():
+    return CodeCache()
+
+
+def make_sweeper(rooms, codes, clock, code_cache=None, batch_size=100):
+    return RoomSweeper(
+        lambda: rooms,
+        lambda: rooms,
+        lambda: codes,
+        completed_ttl=timedelta(hours=1),
+        waiting_ttl=timedelta(hours=2),
+        batch_size=batch_size,
+        code_cache=code_cache,
+        clock=clock,
+    )
+
+
+def save_room(rooms, codes, status=RoomStatus.WAITING):
+    room = GameRoom()
+    room.add_player(Player(uuid4(), "Alice"))
+    room.status = status
+    rooms.save(room)
+    codes.generate_code_for_room(room.room_id)
+    return room
+
+
+def test_expired_rooms_are_deleted_and_codes_released(rooms, codes, clock, code_cache):
+    completed = save_room(rooms, codes, RoomStatus.COMPLETED)
+    waiting = save_room(rooms, codes, RoomStatus.WAITING)
+    playing = save_room(rooms, codes, RoomStatus.IN_PROGRESS)
+    code = codes.get_code_for_room(completed.room_id)
+    code_cache.put(code, completed.room_id)
+
+    clock.now += timedelta(hours=1, minutes=30)
+    sweeper = make_sweeper(rooms, codes, clock, code_cache)
+    assert sweeper.sweep() == 1
+    assert not rooms.exists(completed.room_id)
+    assert rooms.exists(waiting.room_id)
+    assert codes.find_room_by_code(code) is None
+    assert code_cache.code_for(completed.room_id) is None
+
+    clock.now += timedelta(hours=1)
+    assert sweeper.sweep() == 1
+    assert not rooms.exists(waiting.room_id)
+    assert rooms.exists(playing.room_id)
+
+    stats = sweeper.stats()
+    assert stats["rooms_deleted"] == 2
+    assert stats["codes_released"] == 2
+    assert codes.pooled_code_count() == 2
+
+
+def test_recently_updated_rooms_are_kept(rooms, codes, clock):
+    room = save_room(rooms, codes, RoomStatus.WAITING)
+    clock.now += timedelta(hours=3)
+    room.add_player(Player(uuid4(), "Bob"))
+    rooms.save(room)
+
+    assert make_sweeper(rooms, codes, clock).sweep() == 0
+    assert rooms.exists(room.room_id)
+
+
+def test_room_changed_before_its_delete_runs_is_kept(rooms, codes, clock):
+    room = save_room(rooms, codes, RoomStatus.WAITING)
+    clock.now += timedelta(hours=3)
+
+    def run_for_room(room_id, fn):
+        # A command for the room was queued ahead of the delete
+        room.add_player(Player(uuid4(), "Bob"))
+        rooms.save(room)
+        future = Future()
+        future.set_result(fn())
+        return future
+
+    sweeper = RoomSweeper(
+        lambda: rooms,
+        lambda: rooms,
+        lambda: codes,
+        completed_ttl=timedelta(hours=1),
+        waiting_ttl=timedelta(hours=2),
+        clock=clock,
+        run_for_room=run_for_room,
+    )
+
+    assert sweeper.sweep() == 0
+    assert rooms.find_by_id(room.room_id).player_count() == 2
+    assert codes.get_code_for_room(room.room_id) is not None
+    assert sweeper.stats()["rooms_kept"] == 1
+
+
+def test_sweep_works_in_batches(rooms, codes, clock):
+    for _ in range(5):
+        save_room(rooms, codes, RoomStatus.COMPLETED)
+    clock.now += timedelta(days=1)
+    sweeper = make_sweeper(rooms, codes, clock, batch_size=2)
+
+    assert sweeper.sweep_batch() == 2
+    assert sweeper.sweep() == 3
+    assert rooms.count_rooms() == 0
+
+
+@pytest.mark.asyncio
+async def test_background_task_sweeps_and_stops(rooms, codes, clock):
+    save_room(rooms, codes, RoomStatus.COMPLETED)
+    clock.now += timedelta(days=1)
+    sweeper = RoomSweeper(
+        lambda: rooms,
+        lambda: rooms,
+        lambda: codes,
+        completed_ttl=timedelta(hours=1),
+        waiting_ttl=timedelta(hours=2),
+        interval=0.01,
+        clock=clock,
+    )
+
+    sweeper.start()
+    for _ in range(100):
+        if sweeper.stats()["rooms_deleted"]:
+            break
+        await asyncio.sleep(0.01)
+    await sweeper.stop()
+
+    assert sweeper.stats()["rooms_deleted"] == 1
+
+
+def test_completed_rooms_are_archived_before_they_expire(rooms, codes, clock):
+    completed = save_room(rooms, codes, RoomStatus.COMPLETED)
+    code = codes.get_code_for_room(completed.room_id)
+    sweeper = RoomSweeper(
+        lambda: rooms,
+        lambda: rooms,
+        lambda: codes,
+        completed_ttl=timedelta(hours=2),
+        waiting_ttl=timedelta(hours=2),
+        archive_after=timedelta(minutes=10),
+        clock=clock,
+    )
+
+    clock.now += timedelta(minutes=30)
+    assert sweeper.sweep() == 1
+    assert rooms.count_rooms() == 0
+    assert rooms.find_by_id(completed.room_id) is not None
+    assert codes.find_room_by_code(code) == completed.room_id
+
+    clock.now += timedelta(hours=2)
+    sweeper.sweep()
+    assert not rooms.exists(completed.room_id)
+    assert codes.find_room_by_code(code) is None
+    assert sweeper.stats()["rooms_archived"] == 1
+    assert sweeper.stats()["rooms_deleted"] == 1
@@ -0,0 +1,161 @@
+import sqlite3
+import tempfile
+from pathlib import Path
+
+import pytest
+
+from src.adapters.persistence.file_system_code_repository import FileSystemCodeRepository
+from src.adapters.persistence.file_system_room_repository import FileSystemRoomRepository
+from src.adapters.persistence.in_memory_room_repository import InMemoryRoomRepository
+from src.adapters.persistence.room_transfer import (
+    TransferCheckpoint,
+    TransferProgress,
+    transfer,
+)
+from src.adapters.persistence.sqlite_code_repository import SqliteCodeRepository
+from src.adapters.persistence.sqlite_room_repository import SqliteRoomRepository
+from src.domain.entities.game_room import GameRoom
+
+
+@pytest.fixture
+def temp_dir():
+    with tempfile.TemporaryDirectory() as tmpdir:
+        yield tmpdir
+
+
+@pytest.fixture
+def conn():
+    conn = sqlite3.connect(":memory:", check_same_thread=False)
+    yield conn
+    conn.close()
+
+
+@pytest.fixture
+def sqlite_rooms(conn):
+    repo = SqliteRoomRepository(conn)
+    repo.init_tables()
+    return repo
+
+
+@pytest.fixture
+def sqlite_codes(conn):
+    repo = SqliteCodeRepository(conn)
+    repo.init_tables()
+    return repo
+
+
+class FailingRoomRepository(InMemoryRoomRepository):
+    def __init__(self, fail_after: int) -> None:
+        super().__init__()
+        self._fail_after = fail_after
+
+    def save(self, room: GameRoom) -> None:
+        if len(self.list_all()) >= self._fail_after:
+            raise RuntimeError("Disk full")
+        super().save(room)
+
+
+def make_rooms(repository, count):
+    rooms = [GameRoom() for _ in range(count)]
+    for room in rooms:
+        repository.save(room)
+    return rooms
+
+
+def test_rooms_and_codes_are_copied_in_batches(temp_dir, sqlite_rooms, sqlite_codes):
+    source_rooms = FileSystemRoomRepository(temp_dir)
+    source_codes = FileSystemCodeRepository(temp_dir)
+    rooms = make_rooms(source_rooms, 7)
+    codes = {room.room_id: source_codes.generate_code_for_room(room.room_id) for room in rooms}
+    seen = []
+
+    progress = transfer(
+        source_rooms,
+        sqlite_rooms,
+        source_codes,
+        sqlite_codes,
+        batch_size=3,
+        on_progress=lambda p: seen.append((p.rooms, p.codes)),
+    )
+
+    assert (progress.rooms, progress.codes) == (7, 7)
+    assert seen == [(3, 0), (6, 0), (7, 0), (7, 3), (7, 6), (7, 7)]
+    for room in rooms:
+        assert sqlite_rooms.find_by_id(room.room_id).version == room.version
+        assert sqlite_codes.find_room_by_code(codes[room.room_id]) == room.room_id
+
+
+def test_interrupted_transfer_resumes_from_checkpoint(temp_dir, sqlite_rooms):
+    make_rooms(sqlite_rooms, 10)
+    checkpoint = TransferCheckpoint(str(Path(temp_dir) / "checkpoint.json"))
+    target = FailingRoomRepository(fail_after=4)
+
+    with pytest.raises(RuntimeError):
+        transfer(sqlite_rooms, target, batch_size=2, checkpoint=checkpoint)
+    saved = checkpoint.load()
+    assert (saved.rooms, saved.codes) == (4, 0)
+    assert saved.last_room_id == sorted(room.room_id for room in target.list_all())[-1]
+
+    target._fail_after = 100
+    progress = transfer(sqlite_rooms, target, batch_size=2, checkpoint=checkpoint)
+
+    assert progress.rooms == 10
+    assert {room.room_id for room in target.list_all()} == {
+        room.room_id for room in sqlite_rooms.list_all()
+    }
+    assert checkpoint.load().last_room_id is None
+
+
+def test_resume_is_not_thrown_off_by_rooms_deleted_meanwhile(temp_dir, sqlite_rooms):
+    rooms = sorted(make_rooms(sqlite_rooms, 6), key=lambda room: str(room.room_id))
+    checkpoint = TransferCheckpoint(str(Path(temp_dir) / "checkpoint.json"))
+    target = FailingRoomRepository(fail_after=4)
+    with pytest.raises(RuntimeError):
+        transfer(sqlite_rooms, target, batch_size=2, checkpoint=checkpoint)
+
+    # Counting copied rooms would now skip rooms[4]
+    sqlite_rooms.delete(rooms[0].room_id)
+    target._fail_after = 100
+    transfer(sqlite_rooms, target, batch_size=2, checkpoint=checkpoint)
+
+    assert {room.room_id for room in target.list_all()} == {room.room_id for room in rooms}
+
+
+def test_code_transfer_resumes_after_the_last_code(temp_dir, sqlite_codes):
+    for _ in range(5):
+        sqlite_codes.generate_code_for_room(GameRoom().room_id)
+    mappings = list(sqlite_codes.iter_mappings())
+    checkpoint = TransferCheckpoint(str(Path(temp_dir) / "checkpoint.json"))
+    checkpoint.save(TransferProgress(codes=2, last_code=mappings[1][0]))
+    target = FileSystemCodeRepository(temp_dir)
+
+    transfer(
+        InMemoryRoomRepository(),
+        InMemoryRoomRepository(),
+        sqlite_codes,
+        target,
+        checkpoint=checkpoint,
+    )
+
+    assert list(target.iter_mappings()) == mappings[2:]
+
+
+def test_imported_codes_are_not_handed_out_again(temp_dir, sqlite_codes):
+    rooms = [GameRoom() for _ in range(3)]
+    for room in rooms:
+        sqlite_codes.generate_code_for_room(room.room_id)
+    target = FileSystemCodeRepository(temp_dir)
+
+    transfer(InMemoryRoomRepository(), InMemoryRoomRepository(), sqlite_codes, target)
+
+    imported = sorted(sqlite_codes.iter_mappings())
+    assert sorted(target.iter_mappings()) == imported
+    new_room = GameRoom()
+    new_code = target.generate_code_for_room(new_room.room_id)
+    assert new_code not in {code for code, _ in imported}
+    assert target.find_room_by_code(new_code) == new_room.room_id
+
+
+def test_batch_size_must_be_positive(sqlite_rooms):
+    with pytest.raises(ValueError):
+        transfer(sqlite_rooms, InMemoryRoomRepository(), batch_size=0)
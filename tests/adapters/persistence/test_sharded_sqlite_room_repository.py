@@ -0,0 +1,156 @@
+import sqlite3
+import tempfile
+from datetime import datetime, timedelta
+from pathlib import Path
+from uuid import uuid4
+
+import pytest
+
+from src.adapters.persistence.sharded_sqlite_room_repository import (
+    ShardedSqliteRoomRepository,
+    reshard,
+    shard_database_paths,
+    shard_index,
+)
+from src.adapters.persistence.sqlite_connection_pool import SqliteConnectionPool
+from src.adapters.persistence.sqlite_room_repository import SqliteRoomRepository
+from src.domain.entities.game_room import GameRoom, RoomStatus
+
+
+@pytest.fixture
+def temp_dir():
+    with tempfile.TemporaryDirectory() as tmpdir:
+        yield tmpdir
+
+
+def make_repository(paths):
+    pools = [SqliteConnectionPool(path) for path in paths]
+    repo = ShardedSqliteRoomRepository(pools)
+    repo.init_tables()
+    return repo, pools
+
+
+def count_rooms_in(path):
+    with sqlite3.connect(path) as conn:
+        return conn.execute("SELECT COUNT(*) FROM rooms").fetchone()[0]
+
+
+def test_shard_paths_sit_next_to_the_database():
+    assert shard_database_paths("/data/rooms.db", 2) == [
+        "/data/rooms.shard0.db",
+        "/data/rooms.shard1.db",
+    ]
+
+
+def test_rooms_are_spread_by_id_hash(temp_dir):
+    paths = shard_database_paths(str(Path(temp_dir) / "rooms.db"), 4)
+    repo, pools = make_repository(paths)
+    rooms = [GameRoom() for _ in range(40)]
+    for room in rooms:
+        repo.save(room)
+
+    for i, path in enumerate(paths):
+        expected = sum(1 for room in rooms if shard_index(room.room_id, 4) == i)
+        assert count_rooms_in(path) == expected
+    assert all(count_rooms_in(path) > 0 for path in paths)
+    for pool in pools:
+        pool.close_all()
+
+
+def test_summaries_are_merged_across_shards(temp_dir):
+    paths = shard_database_paths(str(Path(temp_dir) / "rooms.db"), 3)
+    repo, pools = make_repository(paths)
+    rooms = [GameRoom() for _ in range(6)]
+    for room in rooms:
+        repo.save(room)
+    rooms[0].status = RoomStatus.COMPLETED
+    repo.save(rooms[0])
+
+    summaries = repo.find_room_summaries(status=RoomStatus.WAITING, limit=3, offset=1)
+    all_waiting = repo.find_room_summaries(status=RoomStatus.WAITING)
+
+    assert len(all_waiting) == 5
+    assert summaries == all_waiting[1:4]
+    assert [s.updated_at for s in all_waiting] == sorted(s.updated_at for s in all_waiting)
+    assert repo.count_rooms() == 6
+    assert repo.count_rooms(status=RoomStatus.COMPLETED) == 1
+    assert repo.count_rooms(updated_before=datetime(2000, 1, 1)) == 0
+    for pool in pools:
+        pool.close_all()
+
+
+def test_reshard_moves_unsharded_rooms_into_shards(temp_dir):
+    database = str(Path(temp_dir) / "rooms.db")
+    conn = sqlite3.connect(database)
+    single = SqliteRoomRepository(conn)
+    single.init_tables()
+    rooms = [GameRoom() for _ in range(10)]
+    for room in rooms:
+        single.save(room)
+    conn.close()
+
+    paths = shard_database_paths(database, 2)
+    assert reshard([database], paths, batch_size=3) == 10
+
+    assert count_rooms_in(database) == 0
+    repo, pools = make_repository(paths)
+    assert {room.room_id for room in repo.iter_all()} == {room.room_id for room in rooms}
+    assert repo.find_by_id(rooms[0].room_id).version == 1
+    for pool in pools:
+        pool.close_all()
+
+
+def test_reshard_in_place_keeps_rows_already_in_their_shard(temp_dir):
+    database = str(Path(temp_dir) / "rooms.db")
+    two = shard_database_paths(database, 2)
+    repo, pools = make_repository(two)
+    rooms = [GameRoom() for _ in range(12)]
+    for room in rooms:
+        repo.save(room)
+    for pool in pools:
+        pool.close_all()
+
+    four = shard_database_paths(database, 4)
+    moved = reshard(two, four)
+
+    staying = sum(
+        1 for room in rooms
+        if shard_index(room.room_id, 2) == shard_index(room.room_id, 4)
+    )
+    assert moved == 12 - staying
+    repo, pools = make_repository(four)
+    assert all(repo.exists(room.room_id) for room in rooms)
+    assert sum(count_rooms_in(path) for path in four) == 12
+    for pool in pools:
+        pool.close_all()
+
+
+def test_requires_a_shard():
+    with pytest.raises(ValueError):
+        ShardedSqliteRoomRepository([])
+
+
+def test_reshard_moves_archived_rooms(temp_dir):
+    database = str(Path(temp_dir) / "rooms.db")
+    conn = sqlite3.connect(database)
+    single = SqliteRoomRepository(conn)
+    single.init_tables()
+    rooms = [GameRoom(status=RoomStatus.COMPLETED) for _ in range(6)]
+    for room in rooms:
+        single.save(room)
+    single.archive_completed(datetime.utcnow() + timedelta(seconds=1))
+    conn.close()
+
+    paths = shard_database_paths(database, 2)
+    assert reshard([database], paths) == 6
+
+    with sqlite3.connect(database) as conn:
+        source_stats = SqliteRoomRepository(conn).archive_stats()
+    assert source_stats["rooms"] == 0
+    assert source_stats["blocks"] == 0
+    assert source_stats["compressed_bytes"] == 0
+    repo, pools = make_repository(paths)
+    assert repo.archive_stats()["rooms"] == 6
+    assert all(repo.find_by_id(room.room_id) is not None for room in rooms)
+    for pool in pools:
+        pool.close_all()
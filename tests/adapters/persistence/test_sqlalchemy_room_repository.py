@@ -0,0 +1,142 @@
+from uuid import uuid4
+
+import pytest
+
+pytest.importorskip("sqlalchemy")
+
+from sqlalchemy import create_engine, event
+from sqlalchemy.orm import sessionmaker
+from sqlalchemy.pool import StaticPool
+
+from src.adapters.persistence.sqlalchemy_room_repository import SqlAlchemyRoomRepository
+from src.database.connection import Base
+from src.database.models import GameStateRecord, RoleAssignment, RoomPlayer
+from src.domain.entities.game_room import GameRoom, RoomStatus
+from src.domain.entities.game_state import GamePhase, GameState
+from src.domain.entities.player import Player
+from src.domain.services.role_assignment_service import RoleAssignmentService
+from src.ports.room_repository_port import ConcurrentModificationError
+
+
+@pytest.fixture
+def engine():
+    engine = create_engine(
+        "sqlite://",
+        connect_args={"check_same_thread": False},
+        poolclass=StaticPool,
+    )
+    Base.metadata.create_all(engine)
+    yield engine
+    engine.dispose()
+
+
+@pytest.fixture
+def statements(engine):
+    executed = []
+    event.listen(
+        engine,
+        "before_cursor_execute",
+        lambda conn, cursor, statement, *args: executed.append(statement),
+    )
+    return executed
+
+
+@pytest.fixture
+def repository(engine):
+    return SqlAlchemyRoomRepository(sessionmaker(bind=engine))
+
+
+def make_started_room() -> GameRoom:
+    room = GameRoom()
+    player_ids = [uuid4() for _ in range(5)]
+    for i, player_id in enumerate(player_ids):
+        room.add_player(Player(player_id, f"Player{i}"))
+    room.start_game(GameState(
+        president_id=player_ids[0],
+        nominated_chancellor_id=player_ids[1],
+        current_phase=GamePhase.ELECTION,
+        role_assignments=RoleAssignmentService.assign_roles(player_ids),
+    ))
+    room.game_state.votes[player_ids[2]] = True
+    room.game_state.investigated_players.add(player_ids[3])
+    return room
+
+
+def test_started_room_round_trips(repository):
+    room = make_started_room()
+    repository.save(room)
+
+    loaded = repository.find_by_id(room.room_id)
+
+    assert loaded.version == 1
+    assert loaded.status == RoomStatus.IN_PROGRESS
+    assert [p.name for p in loaded.players] == [p.name for p in room.players]
+    assert loaded.game_state == room.game_state
+
+
+def test_lobby_read_skips_game_state_tables(repository, statements):
+    room = make_started_room()
+    repository.save(room)
+    statements.clear()
+
+    lobby = repository.find_lobby_by_id(room.room_id)
+
+    assert lobby.game_state is None
+    assert [p.player_id for p in lobby.players] == [p.player_id for p in room.players]
+    queried = " ".join(statements)
+    assert RoomPlayer.__tablename__ in queried
+    assert GameStateRecord.__tablename__ not in queried
+    assert RoleAssignment.__tablename__ not in queried
+
+
+def test_stale_save_is_rejected(repository):
+    room = GameRoom()
+    repository.save(room)
+    stale = repository.find_by_id(room.room_id)
+    repository.save(room)
+
+    with pytest.raises(ConcurrentModificationError):
+        repository.save(stale)
+
+
+def test_saving_replaces_players(repository):
+    room = GameRoom()
+    alice, bob = Player(uuid4(), "Alice"), Player(uuid4(), "Bob")
+    room.add_player(alice)
+    room.add_player(bob)
+    repository.save(room)
+
+    room.reorder_players([bob.player_id, alice.player_id])
+    room.remove_player(alice.player_id)
+    repository.save(room)
+
+    assert [p.name for p in repository.find_by_id(room.room_id).players] == ["Bob"]
+
+
+def test_delete_and_iteration(repository):
+    rooms = [GameRoom() for _ in range(5)]
+    for room in rooms:
+        repository.save(room)
+
+    repository.delete(rooms[0].room_id)
+
+    assert not repository.exists(rooms[0].room_id)
+    assert {room.room_id for room in repository.iter_all(batch_size=2)} == {
+        room.room_id for room in rooms[1:]
+    }
+
+
+def test_save_only_writes_rows_that_changed(repository, statements):
+    room = make_started_room()
+    repository.save(room)
+    room.game_state.votes[room.players[4].player_id] = False
+    statements.clear()
+
+    repository.save(room)
+
+    writes = [s for s in statements if not s.lstrip().upper().startswith("SELECT")]
+    assert len(writes) == 2
+    assert all(s.lstrip().upper().startswith("UPDATE") for s in writes)
+    assert RoomPlayer.__tablename__ not in " ".join(writes)
+    assert RoleAssignment.__tablename__ not in " ".join(writes)
+    assert repository.find_by_id(room.room_id).game_state == room.game_state
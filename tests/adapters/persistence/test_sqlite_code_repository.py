@@ -5,7 +5,12 @@ from uuid import uuid4
 
 import pytest
 
-from src.adapters.persistence.sqlite_code_repository import SqliteCodeRepository
+from src.adapters.api.rest.code_factory import CodeFactory
+from src.adapters.persistence.sqlite_code_repository import (
+    CodeCounterLease,
+    SqliteCodeRepository,
+)
+from src.adapters.persistence.sqlite_unit_of_work import SqliteUnitOfWork
 
 
 @pytest.fixture
@@ -128,3 +133,157 @@ def test_code_uniqueness_constraint(temp_db_path):
     conn.close()
 
     assert len(codes) == len(set(codes))
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 1000.0
+
+    def __call__(self):
+        return self.now
+
+
+def test_released_codes_are_reused_after_delay(in_memory_conn):
+    clock = FakeClock()
+    repo = SqliteCodeRepository(in_memory_conn, reuse_after=60, clock=clock)
+    repo.init_tables()
+    old_room_id = uuid4()
+    code = repo.generate_code_for_room(old_room_id)
+
+    assert repo.release_codes([old_room_id]) == 1
+    assert repo.find_room_by_code(code) is None
+    assert repo.generate_code_for_room(uuid4()) != code
+
+    clock.now += 61
+    new_room_id = uuid4()
+    assert repo.generate_code_for_room(new_room_id) == code
+    assert repo.find_room_by_code(code) == new_room_id
+    assert repo.pooled_code_count() == 0
+
+
+class RacingConnection:
+    """Makes the first pooled code vanish just before it is deleted, as if claimed elsewhere."""
+
+    def __init__(self, conn):
+        self._conn = conn
+        self.raced = False
+
+    def cursor(self):
+        connection = self
+        cursor = self._conn.cursor()
+
+        class Cursor:
+            def execute(self, sql, params=()):
+                if sql.startswith("DELETE FROM code_pool") and not connection.raced:
+                    connection.raced = True
+                    cursor.execute(sql, params)
+                return cursor.execute(sql, params)
+
+            def __getattr__(self, name):
+                return getattr(cursor, name)
+
+        return Cursor()
+
+    def __getattr__(self, name):
+        return getattr(self._conn, name)
+
+
+def test_lost_claim_race_keeps_the_callers_writes(in_memory_conn):
+    clock = FakeClock()
+    repo = SqliteCodeRepository(in_memory_conn, reuse_after=60, clock=clock)
+    repo.init_tables()
+    released = [uuid4(), uuid4()]
+    codes = [repo.generate_code_for_room(room_id) for room_id in released]
+    repo.release_codes(released)
+    clock.now += 61
+    in_memory_conn.execute("CREATE TABLE marker (value TEXT)")
+    in_memory_conn.commit()
+
+    racing = RacingConnection(in_memory_conn)
+    unit_of_work = SqliteUnitOfWork(in_memory_conn)
+    racing_repo = SqliteCodeRepository(
+        racing, reuse_after=60, clock=clock, unit_of_work=unit_of_work
+    )
+    new_room_id = uuid4()
+    with unit_of_work:
+        # Stands in for the room create_room saves before generating its code
+        in_memory_conn.execute("INSERT INTO marker VALUES ('room')")
+        code = racing_repo.generate_code_for_room(new_room_id)
+
+    assert racing.raced
+    assert code == codes[1]
+    assert repo.find_room_by_code(code) == new_room_id
+    assert in_memory_conn.execute("SELECT value FROM marker").fetchall() == [("room",)]
+
+
+def test_counter_skips_codes_still_in_use_after_wraparound(in_memory_conn):
+    repo = SqliteCodeRepository(in_memory_conn)
+    repo.init_tables()
+    first = repo.generate_code_for_room(uuid4())
+    in_memory_conn.execute(
+        "UPDATE code_counter SET counter = ? WHERE id = 1",
+        (CodeFactory.MAX_CODES + 1,),
+    )
+    in_memory_conn.commit()
+
+    code = repo.generate_code_for_room(uuid4())
+
+    assert code != first
+    assert code == CodeFactory.int_to_code(2)
+
+
+def test_lease_takes_counter_values_in_blocks(in_memory_conn):
+    lease = CodeCounterLease(block_size=10)
+    repo = SqliteCodeRepository(in_memory_conn, lease=lease)
+    repo.init_tables()
+
+    codes = [repo.generate_code_for_room(uuid4()) for _ in range(12)]
+
+    assert codes == [CodeFactory.int_to_code(n) for n in range(1, 13)]
+    assert lease.stats()["leases"] == 2
+    counter = in_memory_conn.execute(
+        "SELECT counter FROM code_counter WHERE id = 1"
+    ).fetchone()[0]
+    assert counter == 21
+
+
+def test_block_leased_in_a_rolled_back_unit_is_dropped(temp_db_path):
+    conn = sqlite3.connect(temp_db_path)
+    unit_of_work = SqliteUnitOfWork(conn)
+    lease = CodeCounterLease(block_size=10)
+    repo = SqliteCodeRepository(conn, lease=lease, unit_of_work=unit_of_work)
+    repo.init_tables()
+
+    with pytest.raises(RuntimeError):
+        with unit_of_work:
+            repo.generate_code_for_room(uuid4())
+            raise RuntimeError("room could not be saved")
+    codes = [repo.generate_code_for_room(uuid4()) for _ in range(2)]
+    other = SqliteCodeRepository(
+        sqlite3.connect(temp_db_path), lease=CodeCounterLease(block_size=10)
+    )
+
+    assert codes == [CodeFactory.int_to_code(1), CodeFactory.int_to_code(2)]
+    assert lease.stats()["leases"] == 2
+    assert other.generate_code_for_room(uuid4()) == CodeFactory.int_to_code(11)
+    conn.close()
+
+
+def test_separate_leases_never_share_values(temp_db_path):
+    conns = [sqlite3.connect(temp_db_path) for _ in range(2)]
+    repos = [
+        SqliteCodeRepository(conn, lease=CodeCounterLease(block_size=5))
+        for conn in conns
+    ]
+    repos[0].init_tables()
+
+    codes = [repos[i % 2].generate_code_for_room(uuid4()) for i in range(10)]
+
+    assert len(set(codes)) == 10
+    for conn in conns:
+        conn.close()
+
+
+def test_invalid_block_size():
+    with pytest.raises(ValueError):
+        CodeCounterLease(block_size=0)
@@ -0,0 +1,138 @@
+import tempfile
+import threading
+from pathlib import Path
+
+import pytest
+
+from src.adapters.persistence.sqlite_connection_pool import (
+    DURABILITY_PROFILES,
+    SqliteConnectionPool,
+)
+from src.adapters.persistence.sqlite_room_repository import SqliteRoomRepository
+from src.domain.entities.game_room import GameRoom
+
+
+@pytest.fixture
+def pool():
+    with tempfile.TemporaryDirectory() as tmpdir:
+        pool = SqliteConnectionPool(str(Path(tmpdir) / "test.db"))
+        yield pool
+        pool.close_all()
+
+
+def run_in_thread(func):
+    results = []
+    thread = threading.Thread(target=lambda: results.append(func()))
+    thread.start()
+    thread.join()
+    return results[0]
+
+
+def test_same_thread_reuses_connection(pool):
+    conn1 = pool.connection()
+    conn2 = pool.connection()
+
+    assert conn1 is conn2
+    assert pool.stats()["connections_opened"] == 1
+    assert pool.stats()["acquisitions"] == 2
+
+
+def test_different_threads_get_different_connections(pool):
+    main_conn = pool.connection()
+    thread_conn = run_in_thread(pool.connection)
+
+    assert main_conn is not thread_conn
+    assert pool.stats()["connections_opened"] == 2
+
+
+def test_connections_use_wal_and_busy_timeout(pool):
+    conn = pool.connection()
+
+    assert conn.execute("PRAGMA journal_mode").fetchone()[0] == "wal"
+    assert conn.execute("PRAGMA busy_timeout").fetchone()[0] == 5000
+
+
+def test_dead_thread_connections_are_closed_on_next_open(pool):
+    run_in_thread(pool.connection)
+    run_in_thread(pool.connection)
+
+    stats = pool.stats()
+    assert stats["connections_opened"] == 2
+    assert stats["connections_closed"] == 1
+    assert stats["open_connections"] == 1
+
+
+def test_close_all_releases_connections(pool):
+    pool.connection()
+    pool.close_all()
+
+    assert pool.stats()["open_connections"] == 0
+    assert pool.stats()["connections_closed"] == 1
+
+    pool.connection()
+    assert pool.stats()["connections_opened"] == 2
+
+
+def test_data_written_on_one_thread_is_visible_on_another(pool):
+    SqliteRoomRepository(pool.connection()).init_tables()
+    room = GameRoom()
+    SqliteRoomRepository(pool.connection()).save(room)
+
+    found = run_in_thread(
+        lambda: SqliteRoomRepository(pool.connection()).find_by_id(room.room_id)
+    )
+
+    assert found is not None
+    assert found.room_id == room.room_id
+
+
+def test_unconfigured_pool_raises():
+    pool = SqliteConnectionPool(None)
+
+    with pytest.raises(ValueError):
+        pool.connection()
+
+
+def test_stats_report_peak_connections(pool):
+    barrier = threading.Barrier(3)
+
+    def worker():
+        pool.connection()
+        barrier.wait()
+
+    threads = [threading.Thread(target=worker) for _ in range(3)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    assert pool.stats()["peak_connections"] == 3
+
+
+def test_unit_of_work_is_shared_per_thread(pool):
+    unit_of_work = pool.unit_of_work()
+
+    assert pool.unit_of_work() is unit_of_work
+    assert run_in_thread(pool.unit_of_work) is not unit_of_work
+
+
+@pytest.mark.parametrize("profile", list(DURABILITY_PROFILES))
+def test_connections_use_durability_profile(profile):
+    expected = DURABILITY_PROFILES[profile]
+    synchronous = {"OFF": 0, "NORMAL": 1, "FULL": 2}
+    temp_store = {"DEFAULT": 0, "FILE": 1, "MEMORY": 2}
+    with tempfile.TemporaryDirectory() as tmpdir:
+        pool = SqliteConnectionPool(str(Path(tmpdir) / "test.db"), durability=profile)
+        conn = pool.connection()
+
+        assert conn.execute("PRAGMA journal_mode").fetchone()[0] == "wal"
+        assert conn.execute("PRAGMA synchronous").fetchone()[0] == synchronous[expected.synchronous]
+        assert conn.execute("PRAGMA cache_size").fetchone()[0] == -expected.cache_size_kib
+        assert conn.execute("PRAGMA temp_store").fetchone()[0] == temp_store[expected.temp_store]
+        assert pool.stats()["durability"] == profile
+        pool.close_all()
+
+
+def test_unknown_durability_profile_is_rejected():
+    with pytest.raises(ValueError, match="Unknown durability profile"):
+        SqliteConnectionPool("test.db", durability="reckless")
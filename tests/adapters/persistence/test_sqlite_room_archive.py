@@ -0,0 +1,159 @@
+import sqlite3
+from datetime import datetime, timedelta
+from uuid import uuid4
+
+import pytest
+
+from src.adapters.persistence.sqlite_room_archive import SqliteRoomArchive
+from src.adapters.persistence.sqlite_room_repository import SqliteRoomRepository
+from src.domain.entities.game_room import GameRoom, RoomStatus
+from src.domain.entities.player import Player
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = datetime(2024, 1, 1, 12, 0)
+
+    def __call__(self):
+        return self.now
+
+
+@pytest.fixture
+def conn():
+    conn = sqlite3.connect(":memory:", check_same_thread=False)
+    yield conn
+    conn.close()
+
+
+@pytest.fixture
+def clock():
+    return FakeClock()
+
+
+@pytest.fixture
+def repository(conn, clock):
+    repo = SqliteRoomRepository(conn, clock=clock, archive_block_size=3)
+    repo.init_tables()
+    return repo
+
+
+def save_room(repository, status=RoomStatus.COMPLETED, players=5):
+    room = GameRoom()
+    for i in range(players):
+        room.add_player(Player(uuid4(), f"Player{i}"))
+    room.status = status
+    repository.save(room)
+    return room
+
+
+def archive_all(repository, clock):
+    return repository.archive_completed(clock.now + timedelta(seconds=1), limit=100)
+
+
+def test_only_old_completed_rooms_are_archived(repository, clock):
+    completed = save_room(repository)
+    waiting = save_room(repository, RoomStatus.WAITING)
+    clock.now += timedelta(hours=1)
+    recent = save_room(repository)
+
+    assert repository.archive_completed(clock.now - timedelta(minutes=30)) == 1
+
+    assert repository.count_rooms() == 2
+    assert repository.archive_stats()["rooms"] == 1
+    assert {s.room_id for s in repository.find_room_summaries()} == {
+        waiting.room_id,
+        recent.room_id,
+    }
+    assert repository.exists(completed.room_id)
+
+
+def test_archived_rooms_are_packed_into_compressed_blocks(repository, clock):
+    rooms = [save_room(repository) for _ in range(7)]
+
+    assert archive_all(repository, clock) == 7
+
+    stats = repository.archive_stats()
+    assert stats["rooms"] == 7
+    assert stats["blocks"] == 3
+    assert stats["compressed_bytes"] < stats["raw_bytes"]
+    for room in rooms:
+        archived = repository.find_by_id(room.room_id)
+        assert archived.players == room.players
+        assert archived.version == room.version
+
+
+def test_list_all_includes_archived_rooms(repository, clock):
+    archived = save_room(repository)
+    archive_all(repository, clock)
+    hot = save_room(repository, RoomStatus.WAITING)
+
+    assert {room.room_id for room in repository.list_all()} == {
+        archived.room_id,
+        hot.room_id,
+    }
+
+
+def test_iter_all_merges_archived_rooms_in_room_id_order(repository, clock):
+    archived = [save_room(repository) for _ in range(5)]
+    archive_all(repository, clock)
+    hot = [save_room(repository, RoomStatus.WAITING) for _ in range(5)]
+    ordered = sorted((room.room_id for room in archived + hot), key=str)
+
+    assert [room.room_id for room in repository.iter_all(batch_size=3)] == ordered
+    assert [
+        room.room_id for room in repository.iter_all(after=ordered[4], batch_size=3)
+    ] == ordered[5:]
+
+
+def test_saving_an_archived_room_moves_it_back(repository, clock):
+    room = save_room(repository)
+    archive_all(repository, clock)
+
+    loaded = repository.find_by_id(room.room_id)
+    loaded.players[0].disconnect()
+    repository.save(loaded)
+
+    assert repository.archive_stats()["rooms"] == 0
+    assert repository.count_rooms() == 1
+    assert not repository.find_by_id(room.room_id).players[0].is_connected
+
+
+def test_deleting_archived_rooms_frees_their_block(repository, clock):
+    rooms = [save_room(repository) for _ in range(3)]
+    archive_all(repository, clock)
+
+    repository.delete(rooms[0].room_id)
+    repository.write_batch([], [rooms[1].room_id])
+    assert repository.archive_stats()["blocks"] == 1
+    assert repository.find_by_id(rooms[2].room_id) is not None
+
+    repository.delete(rooms[2].room_id)
+    assert repository.archive_stats() == {
+        "rooms": 0, "blocks": 0, "compressed_bytes": 0, "raw_bytes": 0,
+    }
+
+
+def test_removing_several_rooms_of_one_block_at_once_frees_it(repository, clock):
+    rooms = [save_room(repository) for _ in range(3)]
+    archive_all(repository, clock)
+    assert repository.archive_stats()["blocks"] == 1
+
+    repository.write_batch([], [room.room_id for room in rooms])
+
+    assert repository.archive_stats() == {
+        "rooms": 0, "blocks": 0, "compressed_bytes": 0, "raw_bytes": 0,
+    }
+
+
+def test_archived_room_ids_are_found_by_age(repository, clock):
+    old = save_room(repository)
+    clock.now += timedelta(hours=2)
+    save_room(repository)
+    archive_all(repository, clock)
+
+    assert repository.find_archived_room_ids(clock.now - timedelta(hours=1)) == [old.room_id]
+
+
+def test_block_size_must_be_positive(conn):
+    with pytest.raises(ValueError):
+        SqliteRoomArchive(conn, block_size=0)
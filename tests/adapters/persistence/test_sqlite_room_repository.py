@@ -1,13 +1,17 @@
 import sqlite3
 import tempfile
+from datetime import datetime, timedelta
 from pathlib import Path
 from uuid import uuid4
 
 import pytest
 
+from src.adapters.persistence.room_codec import RoomCodec
 from src.adapters.persistence.sqlite_room_repository import SqliteRoomRepository
-from src.domain.entities.game_room import GameRoom
+from src.domain.entities.game_room import GameRoom, RoomStatus
+from src.domain.entities.game_state import GamePhase, GameState
 from src.domain.entities.player import Player
+from src.ports.room_repository_port import ConcurrentModificationError
 
 
 @pytest.fixture
@@ -69,7 +73,16 @@ def test_database_schema_is_correct(temp_db_path):
 
         cursor.execute("PRAGMA table_info(rooms)")
         columns = {row[1]: row[2] for row in cursor.fetchall()}
-        assert columns == {"room_id": "TEXT", "room_data": "BLOB"}
+        assert columns == {
+            "room_id": "TEXT",
+            "room_data": "BLOB",
+            "version": "INTEGER",
+            "status": "TEXT",
+            "player_count": "INTEGER",
+            "phase": "TEXT",
+            "created_at": "TEXT",
+            "updated_at": "TEXT",
+        }
 
 
 def test_corrupted_data_is_handled_gracefully(in_memory_conn):
@@ -85,3 +98,134 @@ def test_corrupted_data_is_handled_gracefully(in_memory_conn):
 
     assert repo.list_all() == []
 
+
+def test_save_increments_version(in_memory_conn):
+    repo = SqliteRoomRepository(in_memory_conn)
+    repo.init_tables()
+
+    room = GameRoom()
+    repo.save(room)
+    repo.save(room)
+
+    assert room.version == 2
+    assert repo.find_by_id(room.room_id).version == 2
+
+
+def test_stale_save_is_rejected(in_memory_conn):
+    repo = SqliteRoomRepository(in_memory_conn)
+    repo.init_tables()
+    room = GameRoom()
+    repo.save(room)
+
+    first = repo.find_by_id(room.room_id)
+    second = repo.find_by_id(room.room_id)
+    first.add_player(Player(uuid4(), "Alice"))
+    repo.save(first)
+
+    second.add_player(Player(uuid4(), "Bob"))
+    with pytest.raises(ConcurrentModificationError):
+        repo.save(second)
+
+    assert second.version == 1
+    assert [p.name for p in repo.find_by_id(room.room_id).players] == ["Alice"]
+
+
+def test_version_column_is_added_to_existing_table(in_memory_conn):
+    in_memory_conn.execute(
+        "CREATE TABLE rooms (room_id TEXT PRIMARY KEY, room_data BLOB NOT NULL)"
+    )
+    repo = SqliteRoomRepository(in_memory_conn)
+    repo.init_tables()
+
+    room = GameRoom()
+    repo.save(room)
+
+    assert repo.find_by_id(room.room_id).version == 1
+
+
+def test_iter_all_pages_through_rooms(in_memory_conn):
+    repo = SqliteRoomRepository(in_memory_conn)
+    repo.init_tables()
+    rooms = [GameRoom() for _ in range(5)]
+    for room in rooms:
+        repo.save(room)
+
+    found = [room.room_id for room in repo.iter_all(batch_size=2)]
+
+    assert sorted(found) == sorted(room.room_id for room in rooms)
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = datetime(2024, 1, 1, 12, 0)
+
+    def __call__(self):
+        return self.now
+
+
+def test_summary_columns_are_maintained_on_save(in_memory_conn):
+    clock = FakeClock()
+    repo = SqliteRoomRepository(in_memory_conn, clock=clock)
+    repo.init_tables()
+    room = GameRoom()
+    player_ids = [uuid4() for _ in range(5)]
+    for i, player_id in enumerate(player_ids):
+        room.add_player(Player(player_id, f"Player{i}"))
+    repo.save(room)
+
+    clock.now += timedelta(minutes=5)
+    room.start_game(GameState(president_id=player_ids[0]))
+    repo.save(room)
+
+    [summary] = repo.find_room_summaries()
+    assert summary.room_id == room.room_id
+    assert summary.status == RoomStatus.IN_PROGRESS
+    assert summary.player_count == 5
+    assert summary.phase == GamePhase.NOMINATION
+    assert summary.updated_at == clock.now
+    assert summary.version == 2
+
+
+def test_summaries_filter_and_paginate_in_sql(in_memory_conn):
+    clock = FakeClock()
+    repo = SqliteRoomRepository(in_memory_conn, clock=clock)
+    repo.init_tables()
+    rooms = []
+    for _ in range(4):
+        room = GameRoom()
+        repo.save(room)
+        rooms.append(room)
+        clock.now += timedelta(hours=1)
+    rooms[3].status = RoomStatus.COMPLETED
+    repo.save(rooms[3])
+
+    idle = repo.find_room_summaries(
+        status=RoomStatus.WAITING, updated_before=datetime(2024, 1, 1, 14, 0)
+    )
+    assert [s.room_id for s in idle] == [rooms[0].room_id, rooms[1].room_id]
+
+    page = repo.find_room_summaries(status=RoomStatus.WAITING, limit=2, offset=2)
+    assert [s.room_id for s in page] == [rooms[2].room_id]
+
+    assert repo.count_rooms() == 4
+    assert repo.count_rooms(status=RoomStatus.WAITING) == 3
+    assert repo.count_rooms(status=RoomStatus.COMPLETED) == 1
+
+
+def test_existing_rows_are_backfilled(in_memory_conn):
+    in_memory_conn.execute(
+        "CREATE TABLE rooms (room_id TEXT PRIMARY KEY, room_data BLOB NOT NULL)"
+    )
+    room = GameRoom()
+    room.add_player(Player(uuid4(), "Alice"))
+    in_memory_conn.execute(
+        "INSERT INTO rooms (room_id, room_data) VALUES (?, ?)",
+        (str(room.room_id), RoomCodec.encode(room)),
+    )
+    repo = SqliteRoomRepository(in_memory_conn)
+
+    repo.init_tables()
+
+    [summary] = repo.find_room_summaries()
+    assert summary.player_count == 1
+    assert summary.status == RoomStatus.WAITING
@@ -0,0 +1,113 @@
+import sqlite3
+import tempfile
+from pathlib import Path
+from uuid import uuid4
+
+import pytest
+
+from src.adapters.persistence.sqlite_code_repository import SqliteCodeRepository
+from src.adapters.persistence.sqlite_room_repository import SqliteRoomRepository
+from src.adapters.persistence.sqlite_unit_of_work import SqliteUnitOfWork
+from src.application.command_bus import CommandBus
+from src.application.commands.create_room import CreateRoomCommand
+from src.domain.entities.game_room import GameRoom
+
+
+@pytest.fixture
+def db_path():
+    with tempfile.TemporaryDirectory() as tmpdir:
+        yield str(Path(tmpdir) / "test.db")
+
+
+@pytest.fixture
+def conn(db_path):
+    conn = sqlite3.connect(db_path, check_same_thread=False)
+    yield conn
+    conn.close()
+
+
+@pytest.fixture
+def unit_of_work(conn):
+    return SqliteUnitOfWork(conn)
+
+
+@pytest.fixture
+def rooms(conn, unit_of_work):
+    repo = SqliteRoomRepository(conn, unit_of_work=unit_of_work)
+    repo.init_tables()
+    return repo
+
+
+@pytest.fixture
+def codes(conn, unit_of_work):
+    repo = SqliteCodeRepository(conn, unit_of_work=unit_of_work)
+    repo.init_tables()
+    return repo
+
+
+def count_rows(db_path, table):
+    with sqlite3.connect(db_path) as other:
+        return other.execute(f"SELECT COUNT(*) FROM {table}").fetchone()[0]
+
+
+def test_writes_are_invisible_until_the_unit_exits(db_path, unit_of_work, rooms, codes):
+    room = GameRoom()
+    with unit_of_work:
+        rooms.save(room)
+        codes.generate_code_for_room(room.room_id)
+        assert count_rows(db_path, "rooms") == 0
+
+    assert count_rows(db_path, "rooms") == 1
+    assert count_rows(db_path, "code_mappings") == 1
+
+
+def test_failure_rolls_back_every_repository(db_path, unit_of_work, rooms, codes):
+    room = GameRoom()
+    with pytest.raises(RuntimeError):
+        with unit_of_work:
+            rooms.save(room)
+            codes.generate_code_for_room(room.room_id)
+            raise RuntimeError("code step failed")
+
+    assert count_rows(db_path, "rooms") == 0
+    assert count_rows(db_path, "code_mappings") == 0
+
+
+def test_nested_units_commit_once_at_the_outermost_exit(db_path, unit_of_work, rooms):
+    with unit_of_work:
+        with unit_of_work:
+            rooms.save(GameRoom())
+        assert count_rows(db_path, "rooms") == 0
+
+    assert count_rows(db_path, "rooms") == 1
+
+
+def test_repositories_commit_immediately_outside_a_unit(db_path, rooms):
+    rooms.save(GameRoom())
+
+    assert count_rows(db_path, "rooms") == 1
+
+
+def test_command_and_side_write_share_one_commit(db_path, unit_of_work, rooms, codes):
+    bus = CommandBus(rooms, unit_of_work=unit_of_work)
+
+    with unit_of_work:
+        result = bus.execute(CreateRoomCommand(player_name="Alice"))
+        assert count_rows(db_path, "rooms") == 0
+        code = codes.generate_code_for_room(result.room_id)
+
+    assert codes.find_room_by_code(code) == result.room_id
+    assert rooms.exists(result.room_id)
+
+
+def test_rollback_callbacks_run_only_when_the_unit_rolls_back(unit_of_work):
+    calls = []
+
+    with unit_of_work:
+        unit_of_work.on_rollback(lambda: calls.append("committed"))
+    with pytest.raises(RuntimeError):
+        with unit_of_work:
+            unit_of_work.on_rollback(lambda: calls.append("rolled back"))
+            raise RuntimeError("boom")
+
+    assert calls == ["rolled back"]
@@ -0,0 +1,107 @@
+import asyncio
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from uuid import uuid4
+
+import pytest
+
+from src.adapters.persistence.in_memory_room_repository import InMemoryRoomRepository
+from src.adapters.persistence.threaded_repositories import (
+    ThreadedCodeRepository,
+    ThreadedRoomRepository,
+)
+from src.application.command_bus import CommandBus
+from src.application.commands.create_room import CreateRoomCommand
+from src.domain.entities.game_room import GameRoom
+from src.ports.code_repository_port import CodeRepositoryPort
+
+
+class InMemoryCodeRepository(CodeRepositoryPort):
+    def __init__(self):
+        self.codes = {}
+
+    def generate_code_for_room(self, room_id):
+        code = f"C{len(self.codes):03d}"
+        self.codes[code] = room_id
+        return code
+
+    def find_room_by_code(self, code):
+        return self.codes.get(code)
+
+    def get_code_for_room(self, room_id):
+        return next((c for c, r in self.codes.items() if r == room_id), None)
+
+    def iter_mappings(self, after=None):
+        return iter(sorted((c, r) for c, r in self.codes.items() if after is None or c > after))
+
+    def import_mappings(self, mappings):
+        self.codes.update(mappings)
+
+
+@pytest.fixture
+def executor():
+    executor = ThreadPoolExecutor(max_workers=2, thread_name_prefix="test-persistence")
+    yield executor
+    executor.shutdown()
+
+
+@pytest.mark.asyncio
+async def test_room_calls_run_on_the_executor(executor):
+    inner = InMemoryRoomRepository()
+    threads = []
+
+    def factory():
+        threads.append(threading.current_thread().name)
+        return inner
+
+    repository = ThreadedRoomRepository(factory, executor)
+    room = GameRoom()
+
+    await repository.save(room)
+
+    assert await repository.exists(room.room_id)
+    assert (await repository.find_by_id(room.room_id)).room_id == room.room_id
+    assert [r.room_id for r in await repository.list_all()] == [room.room_id]
+    await repository.delete(room.room_id)
+    assert await repository.find_by_id(room.room_id) is None
+    assert all(name.startswith("test-persistence") for name in threads)
+
+
+@pytest.mark.asyncio
+async def test_code_calls_run_on_the_executor(executor):
+    inner = InMemoryCodeRepository()
+    repository = ThreadedCodeRepository(lambda: inner, executor)
+    room_id = uuid4()
+
+    code = await repository.generate_code_for_room(room_id)
+
+    assert await repository.find_room_by_code(code) == room_id
+    assert await repository.get_code_for_room(room_id) == code
+
+
+@pytest.mark.asyncio
+async def test_blocking_calls_do_not_stall_the_loop(executor):
+    release = threading.Event()
+
+    class SlowRepository(InMemoryRoomRepository):
+        def find_by_id(self, room_id):
+            release.wait(timeout=2)
+            return None
+
+    repository = ThreadedRoomRepository(SlowRepository, executor)
+    pending = asyncio.ensure_future(repository.find_by_id(uuid4()))
+
+    await asyncio.sleep(0.01)
+    assert not pending.done()
+    release.set()
+    assert await pending is None
+
+
+@pytest.mark.asyncio
+async def test_command_bus_executes_async(executor):
+    repository = InMemoryRoomRepository()
+    bus = CommandBus(repository)
+
+    result = await bus.execute_async(CreateRoomCommand(player_name="Alice"), executor)
+
+    assert repository.exists(result.room_id)
@@ -0,0 +1,220 @@
+import sqlite3
+import time
+from uuid import uuid4
+
+import pytest
+
+from src.adapters.persistence.sqlite_room_repository import SqliteRoomRepository
+from src.adapters.persistence.write_behind_room_repository import (
+    WriteBehindRoomRepository,
+)
+from src.domain.entities.game_room import GameRoom
+from src.domain.entities.player import Player
+from src.ports.room_repository_port import ConcurrentModificationError
+
+
+@pytest.fixture
+def backing():
+    conn = sqlite3.connect(":memory:", check_same_thread=False)
+    repo = SqliteRoomRepository(conn)
+    repo.init_tables()
+    yield repo
+    conn.close()
+
+
+@pytest.fixture
+def repository(backing):
+    return WriteBehindRoomRepository(lambda: backing, flush_interval=60)
+
+
+def make_room(name: str = "Alice") -> GameRoom:
+    room = GameRoom()
+    room.add_player(Player(uuid4(), name))
+    return room
+
+
+def test_save_does_not_write_until_flush(repository, backing):
+    room = make_room()
+
+    repository.save(room)
+
+    assert repository.find_by_id(room.room_id) is not None
+    assert backing.find_by_id(room.room_id) is None
+
+    assert repository.flush() == 1
+    assert backing.find_by_id(room.room_id).players[0].name == "Alice"
+
+
+def test_flush_writes_latest_state_in_one_batch(repository, backing):
+    rooms = [make_room(f"Player{i}") for i in range(3)]
+    for room in rooms:
+        repository.save(room)
+    rooms[0].add_player(Player(uuid4(), "Late"))
+    repository.save(rooms[0])
+
+    assert repository.flush() == 3
+    assert len(backing.find_by_id(rooms[0].room_id).players) == 2
+    assert repository.stats()["last_batch_size"] == 3
+    assert repository.stats()["flushes"] == 1
+
+
+def test_found_rooms_are_independent_copies(repository):
+    room = make_room()
+    repository.save(room)
+
+    found = repository.find_by_id(room.room_id)
+    found.add_player(Player(uuid4(), "Unsaved"))
+
+    assert len(repository.find_by_id(room.room_id).players) == 1
+
+
+def test_delete_is_flushed(repository, backing):
+    room = make_room()
+    backing.save(room)
+
+    repository.delete(room.room_id)
+
+    assert not repository.exists(room.room_id)
+    assert backing.exists(room.room_id)
+
+    repository.flush()
+    assert not backing.exists(room.room_id)
+
+
+def test_reads_fall_through_to_backing_store(repository, backing):
+    room = make_room()
+    backing.save(room)
+
+    assert repository.find_by_id(room.room_id).room_id == room.room_id
+    assert repository.stats()["dirty_rooms"] == 0
+
+
+def test_close_flushes_pending_rooms(backing):
+    repository = WriteBehindRoomRepository(lambda: backing, flush_interval=60)
+    repository.start()
+    room = make_room()
+    repository.save(room)
+
+    repository.close()
+
+    assert backing.exists(room.room_id)
+
+
+def test_background_flush_when_dirty_limit_reached(backing):
+    repository = WriteBehindRoomRepository(
+        lambda: backing, flush_interval=60, max_dirty=2
+    )
+    repository.start()
+    try:
+        repository.save(make_room())
+        repository.save(make_room())
+
+        for _ in range(100):
+            if repository.stats()["flushes"]:
+                break
+            time.sleep(0.01)
+
+        assert repository.stats()["rooms_flushed"] == 2
+    finally:
+        repository.close()
+
+
+def test_failed_flush_keeps_rooms_dirty(repository, backing, monkeypatch):
+    room = make_room()
+    repository.save(room)
+
+    def fail(rooms, deleted_ids):
+        raise sqlite3.OperationalError("disk I/O error")
+
+    monkeypatch.setattr(backing, "write_batch", fail)
+    with pytest.raises(sqlite3.OperationalError):
+        repository.flush()
+
+    monkeypatch.undo()
+    assert repository.stats()["failed_flushes"] == 1
+    assert repository.flush() == 1
+    assert backing.exists(room.room_id)
+
+
+def test_evict_clean_keeps_dirty_rooms(repository):
+    clean = make_room()
+    repository.save(clean)
+    repository.flush()
+    dirty = make_room()
+    repository.save(dirty)
+
+    assert repository.evict_clean() == 1
+    assert repository.stats()["hot_rooms"] == 1
+    assert repository.find_by_id(clean.room_id) is not None
+
+
+def test_stale_save_is_rejected_in_memory(repository, backing):
+    room = make_room()
+    backing.save(room)
+    stale = repository.find_by_id(room.room_id)
+
+    room = repository.find_by_id(room.room_id)
+    room.add_player(Player(uuid4(), "Bob"))
+    repository.save(room)
+
+    with pytest.raises(ConcurrentModificationError):
+        repository.save(stale)
+
+    repository.flush()
+    assert backing.find_by_id(room.room_id).version == 2
+
+
+def test_flush_evicts_least_recently_used_clean_rooms(backing):
+    repository = WriteBehindRoomRepository(lambda: backing, flush_interval=60, max_rooms=2)
+    rooms = [make_room(f"Player{i}") for i in range(3)]
+    for room in rooms:
+        repository.save(room)
+    # Reading the first room makes the second the least recently used
+    repository.find_by_id(rooms[0].room_id)
+
+    repository.flush()
+
+    assert repository.stats()["hot_rooms"] == 2
+    assert repository.stats()["evictions"] == 1
+    assert repository.find_by_id(rooms[1].room_id).players[0].name == "Player1"
+
+
+def test_rooms_loaded_from_sqlite_are_bounded_too(backing):
+    repository = WriteBehindRoomRepository(lambda: backing, flush_interval=60, max_rooms=2)
+    rooms = [make_room(f"Player{i}") for i in range(4)]
+    for room in rooms:
+        backing.save(room)
+
+    for room in rooms:
+        assert repository.find_by_id(room.room_id) is not None
+
+    assert repository.stats()["hot_rooms"] == 2
+
+
+def test_dirty_rooms_are_never_evicted(backing):
+    repository = WriteBehindRoomRepository(lambda: backing, flush_interval=60, max_rooms=1)
+    rooms = [make_room(f"Player{i}") for i in range(3)]
+    for room in rooms:
+        backing.save(room)
+        repository.find_by_id(room.room_id)
+    dirty = make_room("Dirty")
+    repository.save(dirty)
+    repository.find_by_id(rooms[0].room_id)
+
+    assert repository.stats()["dirty_rooms"] == 1
+    assert repository.find_by_id(dirty.room_id) is not None
+    assert backing.find_by_id(dirty.room_id) is None
+
+
+def test_flushed_deletes_are_forgotten(repository, backing):
+    room = make_room()
+    repository.save(room)
+    repository.flush()
+
+    repository.delete(room.room_id)
+    assert repository.stats()["hot_rooms"] == 1
+    repository.flush()
+
+    assert repository.stats()["hot_rooms"] == 0
+    assert repository.find_by_id(room.room_id) is None
+    assert not repository.exists(room.room_id)
@@ -0,0 +1,67 @@
+from uuid import uuid4
+
+from src.adapters.api.rest.player_state import PlayerStateView
+from src.domain.entities.game_room import GameRoom, RoomStatus
+from src.domain.entities.game_state import GamePhase, GameState
+from src.domain.entities.player import Player
+from src.domain.value_objects.policy import Policy, PolicyType
+from src.domain.value_objects.role import Role, Team
+
+
+def make_legislative_room():
+    players = [Player(uuid4(), f"Player{i}") for i in range(5)]
+    room = GameRoom()
+    for player in players:
+        room.add_player(player)
+    room.status = RoomStatus.IN_PROGRESS
+    room.game_state = GameState(
+        president_id=players[0].player_id,
+        chancellor_id=players[1].player_id,
+        current_phase=GamePhase.LEGISLATIVE_PRESIDENT,
+    )
+    room.game_state.president_policies = [
+        Policy(PolicyType.LIBERAL),
+        Policy(PolicyType.FASCIST),
+        Policy(PolicyType.FASCIST),
+    ]
+    room.game_state.role_assignments = {
+        player.player_id: Role(team=Team.LIBERAL, is_hitler=False) for player in players
+    }
+    room.game_state.role_assignments[players[4].player_id] = Role(
+        team=Team.FASCIST, is_hitler=True
+    )
+    return room, players
+
+
+def test_lobby_has_no_game_or_role():
+    room = GameRoom()
+    player = Player(uuid4(), "Alice")
+    room.add_player(player)
+
+    state = PlayerStateView(room).for_player(player.player_id)
+
+    assert state["room"]["players"][0]["name"] == "Alice"
+    assert state["game"] is None
+    assert state["my_role"] is None
+
+
+def test_only_the_president_sees_their_policies():
+    room, players = make_legislative_room()
+    view = PlayerStateView(room)
+
+    president = view.for_player(players[0].player_id)
+    other = view.for_player(players[2].player_id)
+
+    assert len(president["game"]["president_policies"]) == 3
+    assert other["game"]["president_policies"] == []
+    assert other["game"]["current_phase"] == president["game"]["current_phase"]
+
+
+def test_players_only_see_their_own_role():
+    room, players = make_legislative_room()
+    view = PlayerStateView(room)
+
+    assert view.for_player(players[4].player_id)["my_role"]["is_hitler"] is True
+    assert view.for_player(players[2].player_id)["my_role"]["is_hitler"] is False
+    assert view.for_player(None)["my_role"] is None
+    assert view.for_player(uuid4())["my_role"] is None
@@ -0,0 +1,97 @@
+import asyncio
+import threading
+import time
+from uuid import uuid4
+
+import pytest
+
+from src.adapters.api.rest.room_command_executor import RoomCommandExecutor
+
+
+@pytest.fixture
+def executor():
+    executor = RoomCommandExecutor(max_workers=4)
+    yield executor
+    executor.shutdown()
+
+
+@pytest.mark.asyncio
+async def test_commands_for_one_room_run_in_order(executor):
+    room_id = uuid4()
+    seen = []
+
+    def command(i):
+        def run():
+            time.sleep(0.001 * (5 - i))
+            seen.append(i)
+            return i
+        return run
+
+    results = await asyncio.gather(
+        *(executor.submit(room_id, command(i)) for i in range(5))
+    )
+
+    assert results == [0, 1, 2, 3, 4]
+    assert seen == [0, 1, 2, 3, 4]
+
+
+@pytest.mark.asyncio
+async def test_commands_for_one_room_never_overlap(executor):
+    room_id = uuid4()
+    running = threading.Lock()
+    overlaps = []
+
+    def command():
+        if not running.acquire(blocking=False):
+            overlaps.append(True)
+            return
+        time.sleep(0.001)
+        running.release()
+
+    await asyncio.gather(*(executor.submit(room_id, command) for _ in range(20)))
+
+    assert overlaps == []
+
+
+@pytest.mark.asyncio
+async def test_different_rooms_run_in_parallel(executor):
+    barrier = threading.Barrier(2, timeout=2)
+
+    await asyncio.gather(
+        executor.submit(uuid4(), barrier.wait),
+        executor.submit(uuid4(), barrier.wait),
+    )
+
+
+@pytest.mark.asyncio
+async def test_errors_reach_the_caller_and_queue_continues(executor):
+    room_id = uuid4()
+
+    def fail():
+        raise ValueError("Not your turn")
+
+    with pytest.raises(ValueError, match="Not your turn"):
+        await executor.submit(room_id, fail)
+
+    assert await executor.submit(room_id, lambda: "next") == "next"
+    assert executor.stats()["active_rooms"] == 0
+    assert executor.stats()["completed_commands"] == 2
+
+
+@pytest.mark.asyncio
+async def test_event_loop_is_not_blocked(executor):
+    ticks = []
+
+    async def tick():
+        for _ in range(5):
+            ticks.append(time.monotonic())
+            await asyncio.sleep(0.01)
+
+    await asyncio.gather(executor.submit(uuid4(), lambda: time.sleep(0.1)), tick())
+
+    assert len(ticks) == 5
+
+
+def test_invalid_worker_count():
+    with pytest.raises(ValueError):
+        RoomCommandExecutor(max_workers=0)
@@ -1,7 +1,10 @@
+import asyncio
+import json
 from unittest.mock import AsyncMock, Mock
 from uuid import UUID, uuid4
 import pytest
-from src.adapters.api.rest.room_manager import RoomManager
+from src.adapters.api.rest.connection_sender import SLOW_CONSUMER_CLOSE_CODE
+from src.adapters.api.rest.room_manager import RoomManager, state_message
 
 
 @pytest.fixture
@@ -17,6 +20,18 @@ def mock_websocket():
     return ws
 
 
+def sent_messages(ws):
+    return [json.loads(call.args[0]) for call in ws.send_text.call_args_list]
+
+
+def assert_sent_once(ws, message):
+    assert sent_messages(ws) == [message]
+
+
+def assert_last_sent(ws, message):
+    assert sent_messages(ws)[-1] == message
+
+
 def test_initialization(room_manager):
     assert room_manager.rooms == {}
 
@@ -90,20 +105,21 @@ def test_disconnect_keeps_room_with_remaining_connections(room_manager):
 async def test_broadcast_sends_to_all_connections(room_manager):
     room_id = uuid4()
     ws1 = Mock()
-    ws1.send_json = AsyncMock()
+    ws1.send_text = AsyncMock()
     ws2 = Mock()
-    ws2.send_json = AsyncMock()
+    ws2.send_text = AsyncMock()
     ws3 = Mock()
-    ws3.send_json = AsyncMock()
+    ws3.send_text = AsyncMock()
 
     room_manager.rooms[room_id] = [ws1, ws2, ws3]
     message = {"type": "message"}
 
     await room_manager.broadcast(room_id, message)
+    await room_manager.wait_sent()
 
-    ws1.send_json.assert_called_once_with(message)
-    ws2.send_json.assert_called_once_with(message)
-    ws3.send_json.assert_called_once_with(message)
+    assert_sent_once(ws1, message)
+    assert_sent_once(ws2, message)
+    assert_sent_once(ws3, message)
 
 
 @pytest.mark.asyncio
@@ -112,7 +128,7 @@ async def test_broadcast_to_nonexistent_room(room_manager, mock_websocket):
 
     await room_manager.broadcast(room_id, "test message")
 
-    mock_websocket.send_json.assert_not_called()
+    mock_websocket.send_text.assert_not_called()
 
 
 @pytest.mark.asyncio
@@ -120,11 +136,11 @@ async def test_broadcast_to_empty_room_list(room_manager):
     room_id = uuid4()
     room_manager.rooms[room_id] = []
     ws = Mock()
-    ws.send_json = AsyncMock()
+    ws.send_text = AsyncMock()
 
     await room_manager.broadcast(room_id, "test message")
 
-    ws.send_json.assert_not_called()
+    ws.send_text.assert_not_called()
 
 
 @pytest.mark.asyncio
@@ -132,10 +148,10 @@ async def test_full_lifecycle(room_manager):
     room_id = uuid4()
     ws1 = Mock()
     ws1.accept = AsyncMock()
-    ws1.send_json = AsyncMock()
+    ws1.send_text = AsyncMock()
     ws2 = Mock()
     ws2.accept = AsyncMock()
-    ws2.send_json = AsyncMock()
+    ws2.send_text = AsyncMock()
     message = {"type": "message"}
 
     await room_manager.connect(ws1, room_id)
@@ -143,8 +159,9 @@ async def test_full_lifecycle(room_manager):
     assert len(room_manager.rooms[room_id]) == 2
 
     await room_manager.broadcast(room_id, message)
-    ws1.send_json.assert_called_once_with(message)
-    ws2.send_json.assert_called_once_with(message)
+    await room_manager.wait_sent()
+    assert_sent_once(ws1, message)
+    assert_sent_once(ws2, message)
 
     room_manager.disconnect(ws1, room_id)
     assert len(room_manager.rooms[room_id]) == 1
@@ -152,3 +169,241 @@ async def test_full_lifecycle(room_manager):
 
     room_manager.disconnect(ws2, room_id)
     assert room_id not in room_manager.rooms
+
+
+def test_state_message_sends_whole_state_first():
+    state = {"room": {"status": "WAITING"}, "game": None}
+
+    assert state_message(None, 1, state) == {"type": "state", "version": 1, "state": state}
+
+
+def test_state_message_patches_changed_fields_and_sets_new_sections():
+    sent = (1, {"room": {"status": "WAITING", "player_count": 5}, "game": None})
+    state = {"room": {"status": "IN_PROGRESS", "player_count": 5}, "game": {"round_number": 1}}
+
+    assert state_message(sent, 2, state) == {
+        "type": "state_delta",
+        "base_version": 1,
+        "version": 2,
+        "set": {"game": {"round_number": 1}},
+        "patch": {"room": {"status": "IN_PROGRESS"}},
+        "unset": [],
+    }
+
+
+def test_state_message_sends_sections_that_lost_fields_whole_and_unsets_removed_ones():
+    sent = (1, {"room": {"status": "WAITING", "host": "Alice"}, "game": {"round_number": 1}})
+    state = {"room": {"status": "WAITING"}}
+
+    assert state_message(sent, 2, state) == {
+        "type": "state_delta",
+        "base_version": 1,
+        "version": 2,
+        "set": {"room": {"status": "WAITING"}},
+        "patch": {},
+        "unset": ["game"],
+    }
+
+
+def test_state_message_is_none_when_nothing_changed():
+    state = {"room": {"status": "WAITING"}}
+
+    assert state_message((1, state), 1, dict(state)) is None
+
+
+@pytest.mark.asyncio
+async def test_push_state_sends_each_player_their_own_view(room_manager):
+    room_id = uuid4()
+    alice_id, bob_id = uuid4(), uuid4()
+    alice, bob, spectator = Mock(), Mock(), Mock()
+    for ws in (alice, bob, spectator):
+        ws.accept = AsyncMock()
+        ws.send_text = AsyncMock()
+    await room_manager.connect(alice, room_id, alice_id)
+    await room_manager.connect(bob, room_id, bob_id)
+    await room_manager.connect(spectator, room_id)
+    views = []
+
+    def view_for(player_id):
+        views.append(player_id)
+        return {"me": {"id": str(player_id)}}
+
+    await room_manager.push_state(room_id, 3, view_for)
+    await room_manager.wait_sent()
+
+    assert views == [alice_id, bob_id, None]
+    assert_sent_once(alice, 
+        {"type": "state", "version": 3, "state": {"me": {"id": str(alice_id)}}}
+    )
+    assert_sent_once(spectator, 
+        {"type": "state", "version": 3, "state": {"me": {"id": "None"}}}
+    )
+
+
+@pytest.mark.asyncio
+async def test_push_state_sends_deltas_and_skips_unchanged_and_stale(room_manager, mock_websocket):
+    room_id = uuid4()
+    mock_websocket.send_text = AsyncMock()
+    await room_manager.connect(mock_websocket, room_id)
+
+    await room_manager.push_state(room_id, 1, lambda _: {"room": {"a": 1, "b": 1}})
+    await room_manager.push_state(room_id, 2, lambda _: {"room": {"a": 1, "b": 2}})
+    await room_manager.push_state(room_id, 2, lambda _: {"room": {"a": 1, "b": 2}})
+    await room_manager.push_state(room_id, 1, lambda _: {"room": {"a": 1, "b": 1}})
+    await room_manager.wait_sent()
+
+    assert mock_websocket.send_text.call_count == 2
+    assert_last_sent(mock_websocket, 
+        {
+            "type": "state_delta",
+            "base_version": 1,
+            "version": 2,
+            "set": {},
+            "patch": {"room": {"b": 2}},
+            "unset": [],
+        }
+    )
+
+
+@pytest.mark.asyncio
+async def test_forget_sent_state_resends_whole_state(room_manager, mock_websocket):
+    room_id = uuid4()
+    mock_websocket.send_text = AsyncMock()
+    await room_manager.connect(mock_websocket, room_id)
+    await room_manager.push_state(room_id, 1, lambda _: {"room": {"a": 1}})
+
+    room_manager.forget_sent_state(mock_websocket)
+    await room_manager.push_state(room_id, 1, lambda _: {"room": {"a": 1}})
+    await room_manager.wait_sent()
+
+    assert sent_messages(mock_websocket)[-1]["type"] == "state"
+    assert mock_websocket.send_text.call_count == 2
+
+
+def stall_until(event: asyncio.Event):
+    async def send(_):
+        await event.wait()
+    return send
+
+
+@pytest.mark.asyncio
+async def test_broadcast_does_not_wait_for_slow_connections():
+    room_manager = RoomManager(send_timeout=60)
+    room_id = uuid4()
+    stalled = asyncio.Event()
+    slow, fast = Mock(), Mock()
+    slow.accept = AsyncMock()
+    slow.send_text = AsyncMock(side_effect=stall_until(stalled))
+    fast.accept = AsyncMock()
+    fast.send_text = AsyncMock()
+    await room_manager.connect(slow, room_id)
+    await room_manager.connect(fast, room_id)
+
+    await room_manager.broadcast(room_id, {"type": "message"})
+    await room_manager.senders[fast].wait_sent()
+
+    assert_sent_once(fast, {"type": "message"})
+    assert_sent_once(slow, {"type": "message"})
+    assert slow in room_manager.rooms[room_id]
+    stalled.set()
+    await room_manager.wait_sent()
+
+
+@pytest.mark.asyncio
+async def test_connection_is_dropped_when_its_queue_overflows():
+    room_manager = RoomManager(max_queue=2, send_timeout=60)
+    room_id = uuid4()
+    stalled = asyncio.Event()
+    slow, fast = Mock(), Mock()
+    for ws in (slow, fast):
+        ws.accept = AsyncMock()
+        ws.close = AsyncMock()
+    slow.send_text = AsyncMock(side_effect=stall_until(stalled))
+    fast.send_text = AsyncMock()
+    await room_manager.connect(slow, room_id)
+    await room_manager.connect(fast, room_id)
+
+    for i in range(4):
+        await room_manager.broadcast(room_id, {"type": "message", "n": i})
+        await room_manager.senders[fast].wait_sent()
+    await asyncio.sleep(0)
+
+    assert room_manager.rooms[room_id] == [fast]
+    assert fast.send_text.call_count == 4
+    slow.close.assert_called_once_with(code=SLOW_CONSUMER_CLOSE_CODE)
+    assert room_manager.stats()["connections_dropped"] == 1
+
+
+@pytest.mark.asyncio
+async def test_connection_is_dropped_when_a_send_times_out(mock_websocket):
+    room_manager = RoomManager(send_timeout=0.01)
+    room_id = uuid4()
+    mock_websocket.close = AsyncMock()
+    mock_websocket.send_text = AsyncMock(side_effect=stall_until(asyncio.Event()))
+    await room_manager.connect(mock_websocket, room_id)
+
+    await room_manager.broadcast(room_id, {"type": "message"})
+    await room_manager.wait_sent()
+
+    assert room_id not in room_manager.rooms
+    assert mock_websocket not in room_manager.senders
+
+
+@pytest.mark.asyncio
+async def test_failed_send_does_not_stop_the_broadcast(room_manager):
+    room_id = uuid4()
+    broken, working = Mock(), Mock()
+    for ws in (broken, working):
+        ws.accept = AsyncMock()
+        ws.close = AsyncMock()
+    broken.send_text = AsyncMock(side_effect=RuntimeError("socket closed"))
+    working.send_text = AsyncMock()
+    await room_manager.connect(broken, room_id)
+    await room_manager.connect(working, room_id)
+
+    await room_manager.broadcast(room_id, {"type": "message"})
+    await room_manager.wait_sent()
+
+    assert_sent_once(working, {"type": "message"})
+    assert room_manager.rooms[room_id] == [working]
+    room_manager.disconnect(broken, room_id)
+
+
+@pytest.mark.asyncio
+async def test_broadcast_encodes_payload_once(room_manager):
+    room_id = uuid4()
+    sockets = [Mock() for _ in range(3)]
+    for ws in sockets:
+        ws.accept = AsyncMock()
+        ws.send_text = AsyncMock()
+        await room_manager.connect(ws, room_id)
+
+    await room_manager.broadcast(room_id, {"type": "message"})
+    await room_manager.wait_sent()
+
+    frames = [ws.send_text.call_args.args[0] for ws in sockets]
+    assert all(frame is frames[0] for frame in frames)
+    assert room_manager.stats()["frames_encoded"] == 1
+
+
+@pytest.mark.asyncio
+async def test_push_state_encodes_shared_views_once(room_manager):
+    room_id = uuid4()
+    player_id = uuid4()
+    spectators = [Mock() for _ in range(3)]
+    player = Mock()
+    for ws in [*spectators, player]:
+        ws.accept = AsyncMock()
+        ws.send_text = AsyncMock()
+    for ws in spectators:
+        await room_manager.connect(ws, room_id)
+    await room_manager.connect(player, room_id, player_id)
+
+    await room_manager.push_state(room_id, 1, lambda pid: {"me": {"id": str(pid)}})
+    await room_manager.push_state(room_id, 2, lambda pid: {"me": {"id": str(pid), "v": 2}})
+    await room_manager.wait_sent()
+
+    # One full state and one delta each for the spectators and the player
+    assert room_manager.stats()["frames_encoded"] == 4
+    assert sent_messages(spectators[2]) == sent_messages(spectators[0])
+    assert sent_messages(player)[1]["patch"] == {"me": {"v": 2}}
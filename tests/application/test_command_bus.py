@@ -0,0 +1,60 @@
+import copy
+from typing import Optional
+from uuid import UUID
+
+import pytest
+
+from src.adapters.persistence.in_memory_room_repository import InMemoryRoomRepository
+from src.application.command_bus import CommandBus
+from src.application.commands.join_room import JoinRoomCommand
+from src.domain.entities.game_room import GameRoom
+from src.ports.room_repository_port import ConcurrentModificationError
+
+
+class ConflictingRepository(InMemoryRoomRepository):
+    def __init__(self) -> None:
+        super().__init__()
+        self.conflicts = 0
+
+    def save(self, room: GameRoom) -> None:
+        if self.conflicts:
+            self.conflicts -= 1
+            raise ConcurrentModificationError("conflict")
+        super().save(copy.deepcopy(room))
+
+    def find_by_id(self, room_id: UUID) -> Optional[GameRoom]:
+        return copy.deepcopy(super().find_by_id(room_id))
+
+
+@pytest.fixture
+def repository():
+    return ConflictingRepository()
+
+
+def test_conflicting_command_is_retried(repository):
+    room = GameRoom()
+    repository.save(room)
+    repository.conflicts = 2
+    delays = []
+
+    CommandBus(repository, max_retries=3, sleep=delays.append).execute(
+        JoinRoomCommand(room_id=room.room_id, player_name="Alice")
+    )
+
+    assert [p.name for p in repository.find_by_id(room.room_id).players] == ["Alice"]
+    assert len(delays) == 2
+    assert delays[1] > delays[0] / 3
+
+
+def test_conflict_is_raised_after_max_retries(repository):
+    room = GameRoom()
+    repository.save(room)
+    repository.conflicts = 10
+    delays = []
+
+    with pytest.raises(ConcurrentModificationError):
+        CommandBus(repository, max_retries=3, sleep=delays.append).execute(
+            JoinRoomCommand(room_id=room.room_id, player_name="Alice")
+        )
+
+    assert len(delays) == 3
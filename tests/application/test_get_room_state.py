@@ -0,0 +1,27 @@
+from uuid import uuid4
+
+from src.adapters.persistence.in_memory_room_repository import InMemoryRoomRepository
+from src.application.queries.get_room_state import GetRoomStateHandler, GetRoomStateQuery
+from src.domain.entities.game_room import GameRoom
+from src.domain.entities.player import Player
+
+
+class LobbyOnlyRepository(InMemoryRoomRepository):
+    def find_by_id(self, room_id):
+        raise AssertionError("Lobby reads must not load the whole room")
+
+    def find_lobby_by_id(self, room_id):
+        return super().find_by_id(room_id)
+
+
+def test_room_state_is_read_through_the_lobby_query():
+    repository = LobbyOnlyRepository()
+    room = GameRoom()
+    room.add_player(Player(uuid4(), "Alice"))
+    repository.save(room)
+
+    result = GetRoomStateHandler(repository).handle(GetRoomStateQuery(room.room_id))
+
+    assert result.player_count == 1
+    assert result.players[0].name == "Alice"
+    assert not result.can_start
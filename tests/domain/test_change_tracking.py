@@ -0,0 +1,83 @@
+import copy
+import pickle
+from uuid import uuid4
+
+from src.domain.entities.game_room import GameRoom
+from src.domain.entities.game_state import GamePhase, GameState
+from src.domain.entities.player import Player
+
+
+def test_changes_are_unknown_until_first_cleared():
+    player = Player(name="Alice")
+
+    assert player.changed_fields() is None
+    player.clear_changes()
+    assert player.changed_fields() == set()
+
+
+def test_assignment_is_recorded():
+    state = GameState()
+    state.clear_changes()
+
+    state.current_phase = GamePhase.ELECTION
+
+    assert state.changed_fields() == {"current_phase"}
+
+
+def test_in_place_mutations_are_recorded():
+    state = GameState()
+    state.clear_changes()
+
+    state.votes[uuid4()] = True
+    state.investigated_players.add(uuid4())
+
+    assert state.changed_fields() == {"votes", "investigated_players"}
+
+
+def test_mutations_that_undo_themselves_are_not_changes():
+    voter = uuid4()
+    state = GameState()
+    state.clear_changes()
+
+    state.votes[voter] = True
+    del state.votes[voter]
+
+    assert state.changed_fields() == set()
+
+
+def test_clearing_a_room_clears_its_players_and_game_state():
+    room = GameRoom()
+    room.add_player(Player(name="Alice"))
+    room.game_state = GameState()
+
+    room.clear_changes()
+    room.game_state.policy_deck.draw(3)
+
+    assert room.changed_fields() == set()
+    assert room.players[0].changed_fields() == set()
+    assert room.game_state.changed_fields() == set()
+    assert room.game_state.policy_deck.changed_fields() == {"draw_pile"}
+
+
+def test_copies_report_unknown_changes():
+    room = GameRoom()
+    room.add_player(Player(name="Alice"))
+    room.clear_changes()
+
+    for restored in (copy.deepcopy(room), pickle.loads(pickle.dumps(room))):
+        assert restored.changed_fields() is None
+        assert restored.players == room.players
+
+
+def test_restored_entities_equal_constructed_ones_and_track_after_clearing():
+    player_id = uuid4()
+    restored = Player.restore(
+        player_id=player_id, name="Alice", is_connected=True, is_alive=True
+    )
+
+    assert restored == Player(player_id, "Alice")
+    assert restored.changed_fields() is None
+
+    restored.clear_changes()
+    restored.name = "Bob"
+    assert restored.changed_fields() == {"name"}
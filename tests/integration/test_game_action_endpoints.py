@@ -48,6 +48,16 @@ class InMemoryCodeRepository(CodeRepositoryPort):
         room_id_str = str(room_id)
         return self.room_to_code.get(room_id_str)
 
+    def iter_mappings(self, after: str | None = None):
+        for code in sorted(self.code_to_room):
+            if after is None or code > after:
+                yield code, UUID(self.code_to_room[code])
+
+    def import_mappings(self, mappings: list[tuple[str, UUID]]) -> None:
+        for code, room_id in mappings:
+            self.code_to_room[code] = str(room_id)
+            self.room_to_code[str(room_id)] = code
+
 
 def start_game_for_room(room: GameRoom) -> None:
     player_ids = [p.player_id for p in room.players]
@@ -0,0 +1,23 @@
+from pathlib import Path
+
+from fastapi.testclient import TestClient
+
+from src.adapters.api.main import app
+from src.adapters.persistence.sqlite_connection_pool import SqliteConnectionPool
+
+client = TestClient(app)
+
+
+def test_metrics_include_each_shard_pool(monkeypatch, tmp_path):
+    import src.adapters.api.rest.routes as routes_module
+
+    pools = [SqliteConnectionPool(str(Path(tmp_path) / f"rooms-{i}.db")) for i in range(3)]
+    monkeypatch.setattr(routes_module, "shard_pools", pools)
+    monkeypatch.setattr(routes_module, "room_sweeper", None)
+
+    response = client.get("/api/metrics")
+
+    assert response.status_code == 200
+    shards = response.json()["db_shards"]
+    assert sorted(shards) == ["0", "1", "2"]
+    assert shards["0"]["durability"] == "safe"